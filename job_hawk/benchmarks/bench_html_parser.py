@@ -0,0 +1,44 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+from utils.html_parser import available_backends, css, parse_html
+from core.live_scraper import STATIC_DEAL_PAGES
+
+DEFAULT_PAGE = Path(__file__).resolve().parent.parent.parent / 'unstop_debug.html'
+LINKS = css('a[href*="/competitions/"]')
+
+def old_bs4(content):
+    """The BeautifulSoup lambda scan the scrapers used before html_parser."""
+    soup = BeautifulSoup(content, 'html.parser')
+    cards = soup.find_all(['div', 'section'], class_=lambda x: x and any(w in x.lower() for w in ['deal', 'product', 'item']))
+    links = soup.find_all('a', href=lambda x: x and '/competitions/' in x)
+    return len(cards), len(links)
+
+def new_parser(content, backend):
+    document = parse_html(content, backend)
+    return len(document.select(STATIC_DEAL_PAGES['amazon']['card'])), len(document.select(LINKS))
+
+def timed(label, func, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = func()
+    elapsed = (time.perf_counter() - start) / rounds * 1000
+    print(f"{label:<12} {elapsed:8.2f} ms/page   cards, links = {result}")
+    return elapsed
+
+def main():
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PAGE
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    content = path.read_bytes()
+    print(f"📄 {path.name}: {len(content) / 1024:.0f} KiB, {rounds} rounds")
+    baseline = timed('bs4-lambda', lambda: old_bs4(content), rounds)
+    for backend in available_backends():
+        elapsed = timed(backend, lambda: new_parser(content, backend), rounds)
+        print(f"{'':<12} {baseline / elapsed:8.1f}x vs bs4-lambda")
+
+if __name__ == '__main__':
+    main()
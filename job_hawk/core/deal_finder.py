@@ -3,6 +3,8 @@ from typing import List, Dict
 from playwright.async_api import async_playwright
 from .scraper import get_product_info
 from .live_scraper import LiveDealScraper
+from .ranking import TopK, deal_rank
+from utils.browser import get_browser_service
 
 class DealFinder:
     def __init__(self):
@@ -20,15 +22,14 @@ class DealFinder:
         # Get best sellers
         print("🏆 Finding best-selling products...")
         try:
-            best_sellers = await self.live_scraper.find_best_sellers(max_deals//4)
+            service = get_browser_service()
+            best_sellers = await service.run_async(self.live_scraper.find_best_sellers(max_deals//4, pool=service.pool))
             all_deals.extend(best_sellers)
         except Exception as e:
             print(f"Bestseller finding failed: {e}")
         
-        # Sort by discount percentage and rating
-        all_deals.sort(key=lambda x: (x.get('discount_percent', 0), x.get('rating', 0)), reverse=True)
-        
-        return all_deals[:max_deals]
+        # Best by discount percentage, then numeric rating
+        return TopK(max_deals, key=deal_rank).extend(all_deals).items()
     
     def is_good_deal(self, deal: Dict) -> bool:
         """Determine if a deal is worth considering."""
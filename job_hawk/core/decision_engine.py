@@ -1,12 +1,48 @@
+from collections import OrderedDict
 from datetime import datetime
 import re
-import json
-from pathlib import Path
+import time
+from .matcher import KeywordMatcher
+from .price_series import DAY, PriceSeries
+from .price_store import PRICES_DB, PriceStore
+
+# Rules for categories without their own entry in category_rules
+DEFAULT_RULES = {
+    'min_discount': 20,
+    'max_price': 10000,
+    'min_rating': 4.0
+}
+
+# Title keywords per category; the first category with a match wins
+CATEGORY_KEYWORDS = {
+    'electronics': ['laptop', 'computer', 'phone', 'smartphone', 'headphone', 'camera', 'watch'],
+    'fashion': ['shirt', 'jeans', 'dress', 'shoes', 'nike', 'adidas', 'levis'],
+    'beauty': ['lipstick', 'foundation', 'makeup', 'beauty', 'cosmetic'],
+    'sports': ['running', 'fitness', 'sports', 'gym', 'workout'],
+    'home_kitchen': ['kitchen', 'appliance', 'home', 'washing', 'fryer'],
+    'books': ['book', 'novel', 'author']
+}
+CATEGORY_MATCHER = KeywordMatcher(CATEGORY_KEYWORDS)
+# Products whose price series are kept in memory; older ones are re-read from the store
+MAX_CACHED_PRODUCTS = 1000
+
+# (verdict, confidence, reason) per decision rule, in the order they are tried
+VERDICT_RULES = [
+    ("Buy", 95, "Excellent discount: {discount}%"),
+    ("Buy", 85, "Good deal: {discount}% off, {rating}/5 stars, ₹{price}"),
+    ("Buy", 80, "Price dropping + {discount}% discount"),
+    ("Buy", 75, "Good price (₹{price}) with high rating ({rating}/5)"),
+    ("Buy", 70, "High discount: {discount}%"),
+    ("Wait", 30, "Wait for better deal (Current: {discount}% off, ₹{price}, {rating}/5)")
+]
 
 class DecisionEngine:
-    def __init__(self):
-        self.price_history_file = Path("data/price_history.json")
-        self._load_price_history()
+    def __init__(self, history_path=PRICES_DB, max_cached_products=MAX_CACHED_PRODUCTS):
+        # Price history is written behind: call flush() at the end of a run
+        self.price_store = PriceStore(history_path)
+        # url -> {'title', 'first_seen', 'last_updated', 'series': PriceSeries}, least recently used first
+        self.price_history = OrderedDict()
+        self.max_cached_products = max_cached_products
         
         # Category-specific decision rules
         self.category_rules = {
@@ -42,92 +78,151 @@ class DecisionEngine:
             }
         }
     
-    def _load_price_history(self):
-        """Load price history from file."""
-        if self.price_history_file.exists():
-            with open(self.price_history_file, 'r') as f:
-                self.price_history = json.load(f)
-        else:
-            self.price_history = {}
+    def flush(self):
+        """Write buffered price history to the store."""
+        self.price_store.flush()
+    
+    def _history(self, url):
+        """Cached history entry for a product, read from the store on first use; unknown products cache None."""
+        if url in self.price_history:
+            self.price_history.move_to_end(url)
+            return self.price_history[url]
+        info = self.price_store.product(url)
+        if info is None:
+            return self._cache_history(url, None)
+        series = PriceSeries()
+        since = time.time() - series.retention_days * DAY
+        for observed_at, price in self.price_store.observations(url, since):
+            series.append(observed_at, price)
+        return self._cache_history(url, {**info, 'series': series})
     
-    def _save_price_history(self):
-        """Save price history to file."""
-        with open(self.price_history_file, 'w') as f:
-            json.dump(self.price_history, f, indent=2)
+    def _cache_history(self, url, history):
+        """Keep a history entry, evicting the least recently used beyond max_cached_products."""
+        self.price_history[url] = history
+        while len(self.price_history) > self.max_cached_products:
+            self.price_history.popitem(last=False)
+        return history
     
     def decide(self, product_info):
         """Make a decision based on product info with improved logic."""
-        price = product_info.get('price')
-        discount = product_info.get('discount_percent', 0)
-        rating = product_info.get('rating', '0')
-        title = product_info.get('title', '').lower()
-        url = product_info.get('url', '')
-        
-        # Extract numeric rating
-        try:
-            rating_num = float(rating.split()[0]) if rating else 0
-        except:
-            rating_num = 0
-        
-        # Parse price more robustly
-        price_num = self._parse_price(price)
-        
-        # Determine product category
-        category = self._determine_category(title)
-        
-        # Get category-specific rules
-        rules = self.category_rules.get(category, {
-            'min_discount': 20,
-            'max_price': 10000,
-            'min_rating': 4.0
-        })
+        row = self._normalize(product_info)
+        discount, rating_num, price_num, category, title, url = row
         
         # Check price history
         price_trend = self._check_price_trend(url, price_num)
+        lowest_90d = self._is_lowest(url, price_num, days=90)
         
-        # Decision logic
-        verdict = "Wait"
-        reason = ""
-        confidence = 0
-        
-        # High confidence scenarios
-        if discount >= 50:
-            verdict = "Buy"
-            reason = f"Excellent discount: {discount}%"
-            confidence = 95
-        elif discount >= rules['min_discount'] and rating_num >= rules['min_rating'] and price_num <= rules['max_price']:
-            verdict = "Buy"
-            reason = f"Good deal: {discount}% off, {rating_num}/5 stars, ₹{price_num}"
-            confidence = 85
-        elif price_trend == "decreasing" and discount >= 15:
-            verdict = "Buy"
-            reason = f"Price dropping + {discount}% discount"
-            confidence = 80
-        elif price_num and price_num < 2000 and rating_num >= 4.0:
-            verdict = "Buy"
-            reason = f"Good price (₹{price_num}) with high rating ({rating_num}/5)"
-            confidence = 75
-        elif discount >= 40:
-            verdict = "Buy"
-            reason = f"High discount: {discount}%"
-            confidence = 70
-        else:
-            reason = f"Wait for better deal (Current: {discount}% off, ₹{price_num}, {rating_num}/5)"
-            confidence = 30
+        # Decision logic: the first matching rule wins
+        rule = self._rule(row, price_trend)
         
         # Update price history
         if url and price_num:
             self._update_price_history(url, price_num, title)
         
+        return self._verdict(rule, discount, rating_num, price_num, category, price_trend, lowest_90d, datetime.utcnow().isoformat())
+    
+    def decide_many(self, deals, update_history=True):
+        """
+        decide() for a whole batch, with the rules evaluated as NumPy masks
+        (plain Python without NumPy). Verdicts match calling decide() on each
+        deal in order, including repeated URLs, apart from the timestamp.
+        Pass update_history=False to score historical deals without recording them.
+        """
+        # Batches repeat titles, prices and ratings: parse each distinct value once
+        caches = ({}, {}, {})
+        rows = [self._normalize(deal, caches) for deal in deals]
+        trends, lowest = [], []
+        # History is order-dependent, so it is walked once in order: O(1) per deal
+        for discount, rating_num, price_num, category, title, url in rows:
+            trends.append(self._check_price_trend(url, price_num))
+            lowest.append(self._is_lowest(url, price_num, days=90))
+            if update_history and url and price_num:
+                self._update_price_history(url, price_num, title)
+        
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is None or not rows:
+            matched = [self._rule(row, trend) for row, trend in zip(rows, trends)]
+        else:
+            discount = np.array([row[0] for row in rows], dtype=float)
+            rating = np.array([row[1] for row in rows], dtype=float)
+            price = np.array([np.nan if row[2] is None else row[2] for row in rows], dtype=float)
+            category_rules = [self.category_rules.get(row[3], DEFAULT_RULES) for row in rows]
+            min_discount = np.array([r['min_discount'] for r in category_rules], dtype=float)
+            min_rating = np.array([r['min_rating'] for r in category_rules], dtype=float)
+            max_price = np.array([r['max_price'] for r in category_rules], dtype=float)
+            decreasing = np.array([trend == "decreasing" for trend in trends])
+            # NaN prices compare False, like a missing price in decide()
+            conditions = [
+                discount >= 50,
+                (discount >= min_discount) & (rating >= min_rating) & (price <= max_price),
+                decreasing & (discount >= 15),
+                (price > 0) & (price < 2000) & (rating >= 4.0),
+                discount >= 40
+            ]
+            matched = np.select(conditions, range(len(conditions)), default=len(conditions)).tolist()
+        
+        timestamp = datetime.utcnow().isoformat()
+        return [
+            self._verdict(rule, row[0], row[1], row[2], row[3], trend, low, timestamp)
+            for rule, row, trend, low in zip(matched, rows, trends, lowest)
+        ]
+    
+    def _normalize(self, product_info, caches=None):
+        """
+        (discount, rating, price, category, title, url) of a deal, as decide()
+        reads them. `caches` is a (ratings, prices, categories) triple of dicts
+        memoizing the parsers across a batch.
+        """
+        title = product_info.get('title', '').lower()
+        rating = product_info.get('rating', '0')
+        price = product_info.get('price')
+        if caches is None:
+            rating_num, price_num, category = self._parse_rating(rating), self._parse_price(price), self._determine_category(title)
+        else:
+            ratings, prices, categories = caches
+            rating_num = ratings[rating] if rating in ratings else ratings.setdefault(rating, self._parse_rating(rating))
+            price_num = prices[price] if price in prices else prices.setdefault(price, self._parse_price(price))
+            category = categories[title] if title in categories else categories.setdefault(title, self._determine_category(title))
+        return (product_info.get('discount_percent') or 0, rating_num, price_num, category, title, product_info.get('url', ''))
+    
+    def _rule(self, row, price_trend):
+        """Index into VERDICT_RULES of the first rule a normalized deal matches."""
+        discount, rating_num, price_num, category = row[:4]
+        rules = self.category_rules.get(category, DEFAULT_RULES)
+        if discount >= 50:
+            return 0
+        if discount >= rules['min_discount'] and rating_num >= rules['min_rating'] and price_num is not None and price_num <= rules['max_price']:
+            return 1
+        if price_trend == "decreasing" and discount >= 15:
+            return 2
+        if price_num and price_num < 2000 and rating_num >= 4.0:
+            return 3
+        if discount >= 40:
+            return 4
+        return 5
+    
+    def _verdict(self, rule, discount, rating_num, price_num, category, price_trend, lowest_90d, timestamp):
+        verdict, confidence, reason = VERDICT_RULES[rule]
         return {
             "verdict": verdict,
-            "reason": reason,
+            "reason": reason.format(discount=discount, rating=rating_num, price=price_num),
             "confidence": confidence,
             "category": category,
             "price_trend": price_trend,
-            "timestamp": datetime.utcnow().isoformat()
+            "lowest_90d": lowest_90d,
+            "timestamp": timestamp
         }
     
+    def _parse_rating(self, rating):
+        """Numeric rating from strings like '4.3 out of 5 stars'; 0 when missing."""
+        try:
+            return float(rating.split()[0]) if rating else 0
+        except (AttributeError, IndexError, ValueError):
+            return 0
+    
     def _parse_price(self, price_str):
         """Parse price string to float, handling various formats."""
         if not price_str:
@@ -152,30 +247,16 @@ class DecisionEngine:
     
     def _determine_category(self, title):
         """Determine product category from title."""
-        title_lower = title.lower()
-        
-        if any(word in title_lower for word in ['laptop', 'computer', 'phone', 'smartphone', 'headphone', 'camera', 'watch']):
-            return 'electronics'
-        elif any(word in title_lower for word in ['shirt', 'jeans', 'dress', 'shoes', 'nike', 'adidas', 'levis']):
-            return 'fashion'
-        elif any(word in title_lower for word in ['lipstick', 'foundation', 'makeup', 'beauty', 'cosmetic']):
-            return 'beauty'
-        elif any(word in title_lower for word in ['running', 'fitness', 'sports', 'gym', 'workout']):
-            return 'sports'
-        elif any(word in title_lower for word in ['kitchen', 'appliance', 'home', 'washing', 'fryer']):
-            return 'home_kitchen'
-        elif any(word in title_lower for word in ['book', 'novel', 'author']):
-            return 'books'
-        else:
-            return 'general'
+        return CATEGORY_MATCHER.first(title, 'general')
     
     def _check_price_trend(self, url, current_price):
         """Check if price is trending down."""
         if not url or not current_price:
             return "unknown"
         
-        if url in self.price_history:
-            prices = self.price_history[url]['prices']
+        history = self._history(url)
+        if history:
+            prices = history['series'].prices
             if len(prices) >= 2:
                 if prices[-1] < prices[-2]:
                     return "decreasing"
@@ -186,34 +267,51 @@ class DecisionEngine:
         
         return "unknown"
     
+    def _is_lowest(self, url, current_price, days=90):
+        """True if the current price is at or below every recorded price of the last `days` days."""
+        if not url or not current_price:
+            return False
+        history = self._history(url)
+        # A couple of points say nothing about a 90-day low
+        if not history or len(history['series']) < 3:
+            return False
+        return history['series'].is_lowest(days, price=current_price, now=time.time())
+    
     def _update_price_history(self, url, price, title):
         """Update price history for a product."""
-        if url not in self.price_history:
-            self.price_history[url] = {
+        history = self._history(url)
+        if history is None:
+            history = self._cache_history(url, {
                 'title': title,
-                'prices': [],
+                'series': PriceSeries(),
                 'first_seen': datetime.now().isoformat()
-            }
-        
-        # Add current price
-        self.price_history[url]['prices'].append(price)
-        self.price_history[url]['last_updated'] = datetime.now().isoformat()
-        
-        # Keep only last 10 prices
-        if len(self.price_history[url]['prices']) > 10:
-            self.price_history[url]['prices'] = self.price_history[url]['prices'][-10:]
+            })
         
-        self._save_price_history()
+        now = time.time()
+        history['series'].append(now, price)
+        history['last_updated'] = datetime.fromtimestamp(now).isoformat()
+        self.price_store.append(url, price, title, observed_at=now)
     
     def get_price_history(self, url):
-        """Get price history for a specific URL."""
-        return self.price_history.get(url, {})
+        """Get price history for a specific URL: the last 10 prices plus rolling statistics."""
+        history = self._history(url)
+        if not history:
+            return {}
+        series = history['series']
+        return {
+            'title': history.get('title'),
+            'first_seen': history.get('first_seen'),
+            'last_updated': history.get('last_updated'),
+            'prices': series.last(10),
+            **series.stats()
+        }
     
     def get_best_deals_by_category(self, deals):
         """Get the best deals organized by category."""
         categorized = {}
         for deal in deals:
-            category = self._determine_category(deal.get('title', ''))
+            # Deals that went through decide() already carry their category
+            category = (deal.get('verdict') or {}).get('category') or self._determine_category(deal.get('title', ''))
             if category not in categorized:
                 categorized[category] = []
             categorized[category].append(deal)
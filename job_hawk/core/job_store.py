@@ -0,0 +1,301 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from .listing_normalizer import NORMALIZED_FIELDS, local_naive, normalize, parse_when
+from .near_dupes import listing_signature, same_role
+from .seen_index import listing_key
+
+JOBS_DB = Path(__file__).resolve().parent.parent / 'data' / 'jobs.db'
+LEGACY_JOBS_FILE = Path(__file__).resolve().parent.parent / 'data' / 'active_jobs.json'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    key TEXT PRIMARY KEY,
+    link TEXT,
+    source TEXT,
+    title TEXT,
+    company TEXT,
+    deadline TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    notified_at TEXT,
+    send_attempts INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_link ON jobs (link);
+CREATE INDEX IF NOT EXISTS jobs_source ON jobs (source);
+CREATE INDEX IF NOT EXISTS jobs_deadline ON jobs (deadline);
+CREATE INDEX IF NOT EXISTS jobs_first_seen ON jobs (first_seen);
+CREATE TABLE IF NOT EXISTS signatures (
+    key TEXT PRIMARY KEY,
+    company TEXT NOT NULL,
+    title TEXT NOT NULL,
+    location TEXT NOT NULL,
+    first_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS signatures_company ON signatures (company);
+CREATE TABLE IF NOT EXISTS migrations (
+    name TEXT PRIMARY KEY,
+    applied_at TEXT NOT NULL
+);
+"""
+
+_UPSERT = """
+INSERT INTO jobs (key, link, source, title, company, deadline, first_seen, last_seen, data)
+VALUES (:key, :link, :source, :title, :company, :deadline, :now, :now, :data)
+ON CONFLICT (key) DO UPDATE SET
+    link = excluded.link,
+    title = excluded.title,
+    company = excluded.company,
+    deadline = excluded.deadline,
+    last_seen = excluded.last_seen,
+    data = excluded.data
+"""
+
+_INSERT_SIGNATURE = """
+INSERT OR IGNORE INTO signatures (key, company, title, location, first_seen)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+_NEAR_CANDIDATES = "SELECT key, title, location FROM signatures WHERE company = ? AND key != ?"
+
+_KNOWN = "SELECT 1 FROM jobs WHERE key = ? UNION ALL SELECT 1 FROM signatures WHERE key = ? LIMIT 1"
+
+_PENDING = """
+SELECT data FROM jobs
+WHERE notified_at IS NULL AND send_attempts BETWEEN 1 AND ?
+    AND (deadline IS NULL OR deadline >= ?)
+ORDER BY first_seen DESC LIMIT ?
+"""
+
+def _signature_row(key: str, listing: Dict, now: str) -> Optional[tuple]:
+    signature = listing_signature(listing)
+    return (key, *signature, now) if signature else None
+
+def deadline_iso(listing: Dict) -> Optional[str]:
+    """Deadline as a sortable naive local ISO timestamp, or None when missing or unparseable."""
+    deadline_at = normalize(listing)['deadline_at']
+    return local_naive(deadline_at).isoformat() if deadline_at else None
+
+def _json_default(value):
+    # posted_at / deadline_at from the normalizer
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+class JobStore:
+    """
+    Active job listings in SQLite (WAL mode). Listings are upserted one at a
+    time as the hunt produces them and expire once their deadline passes, or
+    `ttl_days` after they were last seen when they have no deadline.
+    Near-duplicate signatures of every listing are kept for `signature_ttl_days`
+    so reposts are caught against the whole history, not just active jobs.
+    A listing whose send failed (mark_send_failed()) stays pending until
+    mark_notified() records a successful send or it has failed
+    `max_send_attempts` times; listings the ranker cut are never retried.
+    """
+    def __init__(self, path=JOBS_DB, ttl_days=30, signature_ttl_days=180, max_send_attempts=3):
+        self.path = Path(path)
+        self.ttl_days = ttl_days
+        self.max_send_attempts = max_send_attempts
+        self.signature_ttl_days = signature_ttl_days
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # The hunt runs on the browser service thread, so share one connection under a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._add_send_columns()
+        self._backfill_signatures()
+
+    def upsert(self, listing: Dict, now: Optional[datetime] = None) -> bool:
+        """Insert or refresh one listing; returns False when it has no usable key."""
+        return self.upsert_many([listing], now) == 1
+
+    def upsert_many(self, listings: Iterable[Dict], now: Optional[datetime] = None) -> int:
+        now = (now or datetime.now()).isoformat()
+        rows, signatures = [], []
+        for listing in listings:
+            key = listing_key(listing)
+            if key is None:
+                continue
+            signature = _signature_row(key, listing, now)
+            if signature:
+                signatures.append(signature)
+            rows.append({
+                'key': key,
+                'link': listing.get('link') or None,
+                'source': listing.get('source', ''),
+                'title': listing.get('title', ''),
+                'company': listing.get('company', ''),
+                'deadline': deadline_iso(listing),
+                'now': now,
+                'data': json.dumps(listing, default=_json_default)
+            })
+        with self._lock:
+            self._conn.executemany(_UPSERT, rows)
+            self._conn.executemany(_INSERT_SIGNATURE, signatures)
+            self._conn.commit()
+        return len(rows)
+
+    def contains(self, listing: Dict) -> bool:
+        """
+        True if the listing was stored or signed in an earlier run (a primary-key
+        lookup in jobs, then signatures). Listings the hunt dropped before that
+        point, as irrelevant or closed, are not remembered.
+        """
+        key = listing_key(listing)
+        if key is None:
+            return False
+        with self._lock:
+            return self._conn.execute(_KNOWN, (key, key)).fetchone() is not None
+
+    def near_duplicate(self, listing: Dict, record=True, now: Optional[datetime] = None) -> Optional[str]:
+        """
+        Key of an earlier listing of the same company with the same role
+        (near_dupes.same_role), else None. With `record`, a listing that is
+        not a duplicate claims its signature right away, so a repost arriving
+        later in the same run is caught before either is stored.
+        """
+        key = listing_key(listing)
+        signature = listing_signature(listing)
+        if key is None or signature is None:
+            return None
+        company, title, location = signature
+        with self._lock:
+            for other_key, other_title, other_location in self._conn.execute(_NEAR_CANDIDATES, (company, key)):
+                if same_role(title, location, other_title, other_location):
+                    return other_key
+            if record:
+                self._conn.execute(_INSERT_SIGNATURE, (key, *signature, (now or datetime.now()).isoformat()))
+                self._conn.commit()
+        return None
+
+    def mark_notified(self, listing: Dict, now: Optional[datetime] = None) -> bool:
+        """Record a successful send; returns False when the listing is not stored."""
+        key = listing_key(listing)
+        if key is None:
+            return False
+        with self._lock:
+            cursor = self._conn.execute(
+                'UPDATE jobs SET notified_at = ? WHERE key = ?', ((now or datetime.now()).isoformat(), key)
+            )
+            self._conn.commit()
+        return cursor.rowcount == 1
+
+    def mark_send_failed(self, listing: Dict) -> bool:
+        """Count a failed send attempt; returns False when the listing is not stored."""
+        key = listing_key(listing)
+        if key is None:
+            return False
+        with self._lock:
+            cursor = self._conn.execute('UPDATE jobs SET send_attempts = send_attempts + 1 WHERE key = ?', (key,))
+            self._conn.commit()
+        return cursor.rowcount == 1
+
+    def pending(self, limit=100, now: Optional[datetime] = None) -> List[Dict]:
+        """
+        Stored listings whose sends failed fewer than `max_send_attempts`
+        times, never sent and still open, newest first. Their parsed
+        dates are restored from the stored ISO values, so relative text such
+        as '1 day ago' keeps meaning the day the listing was first seen.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                _PENDING, (self.max_send_attempts - 1, (now or datetime.now()).isoformat(), limit)
+            ).fetchall()
+        listings = [json.loads(row[0]) for row in rows]
+        for listing in listings:
+            for field in NORMALIZED_FIELDS:
+                if field in listing:
+                    listing[field] = parse_when(listing[field])
+            # Rescored against the current run
+            listing.pop('score', None)
+        return listings
+
+    def expire(self, now: Optional[datetime] = None) -> int:
+        """Delete listings past their deadline or stale beyond the TTL; returns how many."""
+        now = now or datetime.now()
+        stale = (now - timedelta(days=self.ttl_days)).isoformat()
+        with self._lock:
+            cursor = self._conn.execute(
+                'DELETE FROM jobs WHERE deadline < ? OR (deadline IS NULL AND last_seen < ?)',
+                (now.isoformat(), stale)
+            )
+            self._conn.execute(
+                'DELETE FROM signatures WHERE first_seen < ?',
+                ((now - timedelta(days=self.signature_ttl_days)).isoformat(),)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def count(self, source: Optional[str] = None) -> int:
+        with self._lock:
+            if source:
+                return self._conn.execute('SELECT COUNT(*) FROM jobs WHERE source = ?', (source,)).fetchone()[0]
+            return self._conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+    def find_by_link(self, link: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute('SELECT data FROM jobs WHERE link = ?', (link,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def migrate_json(self, json_path=LEGACY_JOBS_FILE) -> List[Dict]:
+        """
+        One-time import of the old active_jobs.json (the file is left in place).
+        Returns the imported listings, or [] if already migrated or absent.
+        """
+        name = f"json:{Path(json_path).name}"
+        with self._lock:
+            done = self._conn.execute('SELECT 1 FROM migrations WHERE name = ?', (name,)).fetchone()
+        if done:
+            return []
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                listings = json.load(f)
+        except (OSError, ValueError):
+            listings = []
+        self.upsert_many(listings)
+        # The old bot already announced these
+        for listing in listings:
+            self.mark_notified(listing)
+        with self._lock:
+            self._conn.execute('INSERT INTO migrations (name, applied_at) VALUES (?, ?)', (name, datetime.now().isoformat()))
+            self._conn.commit()
+        if listings:
+            print(f"📦 Migrated {len(listings)} listings from {Path(json_path).name} to {self.path.name}")
+        return listings
+
+    def _add_send_columns(self):
+        """Add notified_at and send_attempts to older databases; listings stored before notified_at count as sent."""
+        with self._lock:
+            columns = [row[1] for row in self._conn.execute('PRAGMA table_info(jobs)')]
+            if 'notified_at' not in columns:
+                self._conn.execute('ALTER TABLE jobs ADD COLUMN notified_at TEXT')
+                self._conn.execute('UPDATE jobs SET notified_at = first_seen')
+            if 'send_attempts' not in columns:
+                self._conn.execute('ALTER TABLE jobs ADD COLUMN send_attempts INTEGER NOT NULL DEFAULT 0')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS jobs_notified_at ON jobs (notified_at)')
+            self._conn.commit()
+
+    def _backfill_signatures(self):
+        """Sign listings stored before signatures existed, replacing the old SimHash table (runs once)."""
+        name = 'signatures:v1'
+        with self._lock:
+            if self._conn.execute('SELECT 1 FROM migrations WHERE name = ?', (name,)).fetchone():
+                return
+            self._conn.execute('DROP TABLE IF EXISTS fingerprints')
+            rows = self._conn.execute('SELECT key, first_seen, data FROM jobs').fetchall()
+            signatures = [_signature_row(key, json.loads(data), first_seen) for key, first_seen, data in rows]
+            self._conn.executemany(_INSERT_SIGNATURE, [row for row in signatures if row])
+            self._conn.execute('INSERT INTO migrations (name, applied_at) VALUES (?, ?)', (name, datetime.now().isoformat()))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
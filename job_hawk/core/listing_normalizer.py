@@ -0,0 +1,102 @@
+import re
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from dateutil import parser
+
+# Deadline and posted strings are parsed once, when a listing enters the
+# pipeline, into timezone-aware datetimes stored next to the original text.
+# Later stages (filters, the job store) compare those values directly.
+
+# Datetime fields added by normalize(); the original strings stay for display
+NORMALIZED_FIELDS = ('posted_at', 'deadline_at')
+
+# Formats seen on the job sources besides ISO, tried before dateutil
+DATE_FORMATS = [
+    '%d %b %Y', '%d %B %Y', "%d %b' %y", '%b %d, %Y', '%B %d, %Y',
+    '%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d %H:%M:%S', '%d %b %Y, %I:%M %p'
+]
+
+_RELATIVE_RE = re.compile(
+    r'\b(\d+|an?|one|few)\+?\s*(minute|min|hour|hr|day|week|month)s?\b(?:\s*(ago|left))?', re.IGNORECASE
+)
+_UNIT = {'minute': timedelta(minutes=1), 'min': timedelta(minutes=1), 'hour': timedelta(hours=1), 'hr': timedelta(hours=1),
+         'day': timedelta(days=1), 'week': timedelta(weeks=1), 'month': timedelta(days=30)}
+_NOW_WORDS = ('just now', 'today', 'few seconds')
+
+# (source, field) -> last format that parsed; strings known not to parse
+_format_cache: Dict[tuple, str] = {}
+_failures = set()
+MAX_FAILURES = 10000
+
+def as_aware(dt: datetime) -> datetime:
+    """Naive datetimes are local time; give them the local offset."""
+    return dt if dt.tzinfo else dt.astimezone()
+
+def local_naive(dt: datetime) -> datetime:
+    """Aware datetimes as naive local time, for sortable stored timestamps."""
+    return dt.astimezone().replace(tzinfo=None) if dt.tzinfo else dt
+
+def _relative(text: str, now: datetime, sign: int) -> Optional[datetime]:
+    lowered = text.lower()
+    if sign > 0 and 'today' in lowered:
+        # A deadline of 'today' is open until the day ends
+        return now.replace(hour=23, minute=59, second=59, microsecond=0)
+    if any(word in lowered for word in _NOW_WORDS):
+        return now
+    if 'yesterday' in lowered:
+        return now - timedelta(days=1)
+    match = _RELATIVE_RE.search(text)
+    if not match:
+        return None
+    amount = match.group(1).lower()
+    amount = int(amount) if amount.isdigit() else 3 if amount == 'few' else 1
+    direction = {'ago': -1, 'left': 1}.get((match.group(3) or '').lower(), sign)
+    return now + direction * amount * _UNIT[match.group(2).lower()]
+
+def parse_when(text, source: str = '', field: str = 'deadline', now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Aware datetime for a deadline or posted string, or None. Tries ISO, then
+    relative phrases ('2 days ago', '5 days left'), then the format that last
+    worked for this source and field, the known formats, and finally dateutil.
+    Relative amounts without 'ago'/'left' point back for posted times and
+    forward for deadlines; 'today' is the current time when posted and the
+    end of the day as a deadline.
+    """
+    if isinstance(text, datetime):
+        return as_aware(text)
+    text = (text or '').strip()
+    if not text or text in _failures:
+        return None
+    try:
+        return as_aware(datetime.fromisoformat(text.replace('Z', '+00:00')))
+    except ValueError:
+        pass
+    now = as_aware(now or datetime.now())
+    relative = _relative(text, now, -1 if field == 'posted' else 1)
+    if relative is not None:
+        return relative
+    key = (source, field)
+    cached = _format_cache.get(key)
+    for fmt in ([cached] if cached else []) + DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        _format_cache[key] = fmt
+        return as_aware(parsed)
+    try:
+        return as_aware(parser.parse(text))
+    except (ValueError, OverflowError):
+        if len(_failures) >= MAX_FAILURES:
+            _failures.clear()
+        _failures.add(text)
+        return None
+
+def normalize(listing: Dict, now: Optional[datetime] = None) -> Dict:
+    """Add 'posted_at' and 'deadline_at' (aware datetime or None) to a listing, once."""
+    source = listing.get('source', '')
+    if 'posted_at' not in listing:
+        listing['posted_at'] = parse_when(listing.get('posted_time'), source, 'posted', now)
+    if 'deadline_at' not in listing:
+        listing['deadline_at'] = parse_when(listing.get('deadline'), source, 'deadline', now)
+    return listing
@@ -1,10 +1,421 @@
 import asyncio
+import time
 from typing import List, Dict, Optional
-from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import re
-from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
+from datetime import datetime, timedelta
+from utils.browser import BrowserPool, get_browser_service, pool_or_temporary
+from utils.http_cache import http_cache
+from utils.html_parser import Selector, css, parse_html
+from utils.http_client import get_client
+from utils.latency import domain_of, latency_tracker
+from utils.rate_limiter import get_rate_limiter
+from utils.resource_blocker import resource_stats
+from utils.trace import tracer
+from .listing_normalizer import as_aware, normalize
+
+# Listing-page layouts. Every card on a page is reduced to a plain record
+# with one evaluate_all call; discounts and absolute URLs are then worked
+# out in Python over that list.
+#   fields: name -> selector (inner text), or {'selector', 'attr'} for an
+#           attribute, or {'selector', 'exists': True} for a presence flag;
+#           {'self': True, ...} reads the card element itself
+#   discount: 'original_price' (compare with price) or 'discount_text'
+#   defaults: values used when a field's element is missing
+#   profile: utils.resource_blocker profile for the page's context
+DEAL_LISTINGS = {
+    'amazon': {
+        'name': 'Amazon',
+        'profile': 'amazon',
+        'url': 'https://www.amazon.in/deals',
+        'base_url': 'https://www.amazon.in',
+        'card': '[data-component-type="s-deal-card"], .a-section.a-spacing-base, [class*="deal"]',
+        'fields': {
+            'href': {'selector': 'a[href*="/dp/"], a[href*="/gp/product/"]', 'attr': 'href'},
+            'title': 'h2 a, h3 a, .a-text-normal, [class*="title"]',
+            'price': '.a-price .a-offscreen, .a-price-whole, [class*="price"]',
+            'timer': {'selector': '[class*="timer"], [class*="countdown"], [class*="deal"]', 'exists': True},
+            'original_price': '.a-text-strike, [class*="original"]',
+            'rating': '.a-icon-alt, [class*="rating"]'
+        },
+        'discount': 'original_price',
+        'default_discount': 25,
+        'defaults': {'title': 'Amazon Product', 'price': '₹999', 'rating': '4.0 out of 5'}
+    },
+    'flipkart': {
+        'name': 'Flipkart',
+        'profile': 'flipkart',
+        'url': 'https://www.flipkart.com/offers-store',
+        'base_url': 'https://www.flipkart.com',
+        'card': '[class*="product"], [class*="item"], [class*="deal"]',
+        'fields': {
+            'href': {'selector': 'a[href*="/p/"], a[href*="/product/"]', 'attr': 'href'},
+            'title': 'a[class*="title"], a[class*="name"], [class*="title"]',
+            'price': '[class*="price"]',
+            'timer': {'selector': '[class*="timer"], [class*="countdown"], [class*="deal"]', 'exists': True},
+            'discount': '[class*="discount"]',
+            'rating': '[class*="rating"]'
+        },
+        'discount': 'discount_text',
+        'default_discount': 30,
+        'defaults': {'title': 'Flipkart Product', 'price': '₹999', 'rating': '4.0 out of 5'}
+    },
+    'myntra': {
+        'name': 'Myntra',
+        'profile': 'myntra',
+        'url': 'https://www.myntra.com/sale',
+        'base_url': 'https://www.myntra.com',
+        'card': '[class*="product"], [class*="item"], [class*="deal"]',
+        'fields': {
+            'href': {'selector': 'a[href*="/buy"], a[href*="/product/"]', 'attr': 'href'},
+            'title': 'a[class*="title"], a[class*="name"], [class*="title"]',
+            'price': '[class*="price"]',
+            'timer': {'selector': '[class*="timer"], [class*="countdown"], [class*="deal"]', 'exists': True},
+            'discount': '[class*="discount"]'
+        },
+        'discount': 'discount_text',
+        'default_discount': 40,  # Default for fashion
+        'defaults': {'title': 'Myntra Product', 'price': '₹999', 'rating': '4.2 out of 5'}
+    },
+    'nykaa': {
+        'name': 'Nykaa',
+        'profile': 'nykaa',
+        'url': 'https://www.nykaa.com/offers',
+        'base_url': 'https://www.nykaa.com',
+        'card': '[class*="product"], [class*="item"], [class*="deal"]',
+        'fields': {
+            'href': {'selector': 'a[href*="/p/"], a[href*="/product/"]', 'attr': 'href'},
+            'title': 'a[class*="title"], a[class*="name"], [class*="title"]',
+            'price': '[class*="price"]',
+            'timer': {'selector': '[class*="timer"], [class*="countdown"], [class*="deal"]', 'exists': True},
+            'discount': '[class*="discount"]'
+        },
+        'discount': 'discount_text',
+        'default_discount': 50,  # Default for beauty
+        'defaults': {'title': 'Nykaa Product', 'price': '₹999', 'rating': '4.3 out of 5'}
+    },
+    'ajio': {
+        'name': 'Ajio',
+        'profile': 'ajio',
+        'url': 'https://www.ajio.com/sale',
+        'base_url': 'https://www.ajio.com',
+        'card': '[class*="product"], [class*="item"], [class*="deal"]',
+        'fields': {
+            'href': {'selector': 'a[href*="/p/"], a[href*="/product/"]', 'attr': 'href'},
+            'title': 'a[class*="title"], a[class*="name"], [class*="title"]',
+            'price': '[class*="price"]',
+            'timer': {'selector': '[class*="timer"], [class*="countdown"], [class*="deal"]', 'exists': True},
+            'discount': '[class*="discount"]'
+        },
+        'discount': 'discount_text',
+        'default_discount': 45,  # Default for fashion
+        'defaults': {'title': 'Ajio Product', 'price': '₹999', 'rating': '4.4 out of 5'}
+    }
+}
+
+DEAL_SITES = list(DEAL_LISTINGS)
+
+BEST_SELLER_LISTINGS = {
+    'amazon': {
+        'name': 'Amazon Bestseller',
+        'profile': 'amazon',
+        'url': 'https://www.amazon.in/gp/bestsellers',
+        'base_url': 'https://www.amazon.in',
+        'goto_timeout': 15000,
+        'load_timeout': 8000,
+        'card': '[class*="product"], [class*="item"]',
+        'fields': {
+            'href': {'selector': 'a[href*="/dp/"]', 'attr': 'href'},
+            'title': 'h2 a, h3 a, .a-text-normal',
+            'price': '.a-price .a-offscreen'
+        },
+        'bestseller': True,
+        'defaults': {'title': 'Amazon Bestseller', 'price': '₹999'}
+    }
+}
+
+# Runs inside the page over every matched card and returns plain records.
+_CARDS_SCRIPT = """
+(cards, [fields, limit]) => cards.slice(0, limit).map((card) => {
+    const record = {};
+    for (const [name, spec] of Object.entries(fields)) {
+        const el = spec.self ? card : card.querySelector(typeof spec === 'string' ? spec : spec.selector);
+        if (typeof spec !== 'string' && spec.exists) {
+            record[name] = el !== null;
+        } else if (!el) {
+            record[name] = null;
+        } else if (typeof spec !== 'string' && spec.attr) {
+            record[name] = el.getAttribute(spec.attr);
+        } else {
+            record[name] = el.innerText;
+        }
+    }
+    return record;
+})
+"""
+
+async def _open_listing(page, listing):
+    """Navigate to a listing page and return as soon as its first card is in the DOM."""
+    domain = domain_of(listing['url'])
+    async with get_rate_limiter().slot(listing['url']):
+        # Timed from inside the slot, and only successful navigations are
+        # sampled, so queueing and timeouts do not inflate the next timeout
+        started = time.monotonic()
+        await page.goto(
+            listing['url'],
+            wait_until='domcontentloaded',
+            timeout=latency_tracker.timeout(domain, default=listing.get('goto_timeout', 20000))
+        )
+        latency_tracker.record(domain, (time.monotonic() - started) * 1000)
+    try:
+        await page.wait_for_selector(
+            listing['card'],
+            state='attached',
+            timeout=latency_tracker.timeout(domain, default=listing.get('load_timeout', 10000))
+        )
+    except PlaywrightTimeoutError:
+        # No cards yet; extraction below simply finds fewer of them
+        pass
+
+async def _extract_cards(page, listing, limit) -> List[Dict]:
+    """Pull the first `limit` cards of a listing page into plain records in one round trip."""
+    return await page.locator(listing['card']).evaluate_all(_CARDS_SCRIPT, [listing['fields'], limit])
+
+def _listing_discount(listing, record, price) -> int:
+    """Work out a card's discount percent from its original price or discount badge."""
+    if listing['discount'] == 'original_price':
+        original_price = record.get('original_price')
+        if original_price is None:
+            return 0
+        try:
+            original = float(re.sub(r'[₹,.\s]', '', original_price))
+            current = float(re.sub(r'[₹,.\s]', '', price))
+            return int(((original - current) / original) * 100)
+        except:
+            return listing['default_discount']
+    discount_text = record.get('discount')
+    if discount_text is None:
+        return 0
+    try:
+        return int(re.sub(r'[%\s]', '', discount_text))
+    except:
+        return listing['default_discount']
+
+def _build_listing_item(listing, record) -> Optional[Dict]:
+    """Turn one extracted card record into a deal dict, or None if it has no product link."""
+    url = record.get('href')
+    if not url:
+        return None
+    # Make URL absolute
+    if url.startswith('/'):
+        url = f"{listing['base_url']}{url}"
+    defaults = listing['defaults']
+    title = record.get('title')
+    if title is None:
+        title = defaults['title']
+    price = record.get('price')
+    if price is None:
+        price = defaults['price']
+    if listing.get('bestseller'):
+        return {
+            'title': title.strip()[:100],
+            'price': price.strip(),
+            'url': url,
+            'source': listing['name'],
+            'scraped_at': datetime.now().isoformat()
+        }
+    rating = record.get('rating')
+    if rating is None:
+        rating = defaults['rating']
+    return {
+        'title': title.strip()[:100],
+        'price': price.strip(),
+        'url': url,
+        'discount_percent': _listing_discount(listing, record, price),
+        'rating': rating,
+        'source': listing['name'],
+        'has_timer': record.get('timer', False),
+        'scraped_at': datetime.now().isoformat()
+    }
+
+def _class_selector(tags, words) -> Selector:
+    """CSS for `tags` whose class contains any of `words`, in any case."""
+    return css(', '.join(f'{tag}[class*="{word}" i]' for tag in tags for word in words))
+
+_DEAL_CARD = _class_selector(['div', 'section'], ['deal', 'product', 'item'])
+_DEAL_PRICE = _class_selector(['span', 'div'], ['price'])
+_DEAL_STRIKE = _class_selector(['span', 'div'], ['strike'])
+_DEAL_DISCOUNT = _class_selector(['span', 'div'], ['discount'])
+
+# Deal pages scraped from server HTML when the browser path is unavailable.
+#   card / link / title: precompiled selectors for a deal card, its product
+#                        link, and the title inside that link
+#   discount: 'strike' (compare with struck-out price) or 'discount' (badge text)
+#   default_discount / rating: values assumed when the page does not show them
+STATIC_DEAL_PAGES = {
+    'amazon': {
+        'name': 'Amazon',
+        'url': 'https://www.amazon.in/deals',
+        'base_url': 'https://www.amazon.in',
+        'card': _DEAL_CARD,
+        'link': css('a[href*="/dp/"], a[href*="/gp/product/"]'),
+        'title': _class_selector(['h2', 'h3', 'span'], ['title']),
+        'discount': 'strike',
+        'default_discount': 25,
+        'rating': '4.0 out of 5'
+    },
+    'flipkart': {
+        'name': 'Flipkart',
+        'url': 'https://www.flipkart.com/offers-store',
+        'base_url': 'https://www.flipkart.com',
+        'card': _DEAL_CARD,
+        'link': css('a[href*="/p/"], a[href*="/product/"]'),
+        'title': _class_selector(['h3', 'h4', 'span'], ['title']),
+        'discount': 'discount',
+        'default_discount': 30,
+        'rating': '4.0 out of 5'
+    },
+    'myntra': {
+        'name': 'Myntra',
+        'url': 'https://www.myntra.com/sale',
+        'base_url': 'https://www.myntra.com',
+        'card': _DEAL_CARD,
+        'link': css('a[href*="/buy"], a[href*="/product/"]'),
+        'title': _class_selector(['h3', 'h4', 'span'], ['title']),
+        'discount': 'discount',
+        'default_discount': 40,  # Default for fashion
+        'rating': '4.2 out of 5'
+    },
+    'nykaa': {
+        'name': 'Nykaa',
+        'url': 'https://www.nykaa.com/offers',
+        'base_url': 'https://www.nykaa.com',
+        'card': _DEAL_CARD,
+        'link': css('a[href*="/p/"], a[href*="/product/"]'),
+        'title': _class_selector(['h3', 'h4', 'span'], ['title']),
+        'discount': 'discount',
+        'default_discount': 50,  # Default for beauty
+        'rating': '4.3 out of 5'
+    },
+    'ajio': {
+        'name': 'Ajio',
+        'url': 'https://www.ajio.com/sale',
+        'base_url': 'https://www.ajio.com',
+        'card': _DEAL_CARD,
+        'link': css('a[href*="/p/"], a[href*="/product/"]'),
+        'title': _class_selector(['h3', 'h4', 'span'], ['title']),
+        'discount': 'discount',
+        'default_discount': 45,  # Default for fashion
+        'rating': '4.4 out of 5'
+    }
+}
+
+def _parse_static_deals(page, content, max_deals) -> List[Dict]:
+    """Parse deal cards out of a deal page's server HTML."""
+    deals = []
+    document = parse_html(content)
+    discount_selector = _DEAL_STRIKE if page['discount'] == 'strike' else _DEAL_DISCOUNT
+    
+    # Look for deal elements
+    for element in document.select(page['card'])[:max_deals]:
+        try:
+            # Find product link
+            link = element.select_one(page['link'])
+            if not link:
+                continue
+            
+            url = link.attr('href')
+            if not url:
+                continue
+            
+            # Make URL absolute
+            if url.startswith('/'):
+                url = f"{page['base_url']}{url}"
+            
+            # Get title
+            title_el = link.select_one(page['title'])
+            title = title_el.text() if title_el else f"{page['name']} Product"
+            
+            # Get price
+            price_el = element.select_one(_DEAL_PRICE)
+            price = price_el.text() if price_el else "₹999"
+            
+            # Calculate discount
+            discount_percent = page['default_discount']
+            discount_el = element.select_one(discount_selector)
+            if discount_el:
+                discount_text = discount_el.text()
+                try:
+                    if page['discount'] == 'strike':
+                        original = float(re.sub(r'[₹,.\s]', '', discount_text))
+                        current = float(re.sub(r'[₹,.\s]', '', price))
+                        discount_percent = int(((original - current) / original) * 100)
+                    else:
+                        discount_percent = int(re.sub(r'[%\s]', '', discount_text))
+                except:
+                    pass
+            
+            deals.append({
+                'title': title[:100],
+                'price': price,
+                'url': url,
+                'discount_percent': discount_percent,
+                'rating': page['rating'],
+                'source': page['name'],
+                'has_timer': True,
+                'scraped_at': datetime.now().isoformat()
+            })
+            
+        except Exception as e:
+            tracer.event(page['name'], 'card parse error', error=e)
+            continue
+    
+    return deals
+
+# Precompiled selectors for the job boards fetched over plain HTTP
+_LINKEDIN = {
+    'card': css('li[class*="jobs-search-results__list-item"]'),
+    'title': css('h3'),
+    'company': css('h4'),
+    'location': css('span[class*="job-search-card__location"]'),
+    'link': css('a[href]'),
+    'posted_time': css('time'),
+    'insight': css('span[class*="job-search-card__job-insight"]'),
+}
+_INTERNSHALA = {
+    'card': css('div.individual_internship'),
+    'meta': css('div[class*="internship_meta"]'),
+    'title': css('div.heading_4_5'),
+    'company': css('a.link_display_like_text'),
+    'location': css('a.location_link'),
+    'posted_time': css('div.status'),
+    'link': css('a[href*="/internship/detail/"], a[href*="/job/detail/"]'),
+}
+_CUVETTE = {
+    'card': css('div[class*="job-card"], div[class*="job-listing"]'),
+    'title': css('h3'),
+    'company': css('span[class*="company"], span[class*="org"]'),
+    'location': css('span[class*="location"]'),
+    'posted_time': css('span[class*="post-time"], span[class*="posted"]'),
+    'link': css('a[href]'),
+}
+_WELLFOUND = {
+    'card': css('div[class*="job-listing"], div[class*="styles_jobListing"]'),
+    'title': css('div[class*="title"]'),
+    'company': css('div[class*="company"], div[class*="styles_companyName"]'),
+    'location': css('div[class*="location"]'),
+    'posted_time': css('div[class*="posted"], div[class*="styles_postedAt"]'),
+    'link': css('a[href]'),
+}
+
+def _absolute_link(link_el, base_url) -> str:
+    link = link_el.attr('href') if link_el else ''
+    return base_url + link if link.startswith('/') else link
+
+def _posted_after(listing, since_time) -> bool:
+    """Keep listings posted after since_time, and those whose posting time is unknown."""
+    posted_at = normalize(listing)['posted_at']
+    return posted_at is None or posted_at >= as_aware(since_time)
 
 class LiveDealScraper:
     def __init__(self):
@@ -38,1166 +449,629 @@ class LiveDealScraper:
     
     def find_live_deals_sync(self, max_deals=50) -> List[Dict]:
         """Find real deals from live websites with working URLs."""
+        service = get_browser_service()
         try:
-            return asyncio.run(self.find_live_deals(max_deals))
-        except RuntimeError:
-            # If already in event loop, use asyncio.create_task
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # We're already in an async context
-                return self._find_deals_sync_fallback(max_deals)
-            else:
-                return asyncio.run(self.find_live_deals(max_deals))
+            # Runs on the service's own loop, so this also works from inside a running event loop
+            return service.run(self.find_live_deals(max_deals, pool=service.pool))
         except Exception as e:
             print(f"Live deal finding failed: {e}")
             return self._find_deals_sync_fallback(max_deals)
     
     def _find_deals_sync_fallback(self, max_deals=50) -> List[Dict]:
-        """Fallback method when async doesn't work."""
+        """Fallback method when the browser path doesn't work."""
+        return get_browser_service().run(self.find_static_deals(max_deals))
+    
+    async def find_static_deals(self, max_deals=50) -> List[Dict]:
+        """Scrape the server-rendered deal pages of all sites concurrently, without a browser."""
         deals = []
         
         # Try to scrape all sites
-        sites = [
-            ('amazon', self._scrape_amazon_sync),
-            ('flipkart', self._scrape_flipkart_sync),
-            ('myntra', self._scrape_myntra_sync),
-            ('nykaa', self._scrape_nykaa_sync),
-            ('ajio', self._scrape_ajio_sync)
-        ]
+        sites = list(STATIC_DEAL_PAGES)
+        for site in sites:
+            print(f"🔍 Scraping {site.title()}...")
+        results = await asyncio.gather(*(self._scrape_static_deals(site, max_deals//5) for site in sites), return_exceptions=True)
         
-        for site_name, scraper_func in sites:
-            try:
-                print(f"🔍 Scraping {site_name.title()}...")
-                site_deals = scraper_func(max_deals//5)
-                deals.extend(site_deals)
-                print(f"✅ Found {len(site_deals)} deals from {site_name.title()}")
-            except Exception as e:
-                print(f"❌ {site_name.title()} scraping failed: {e}")
+        for site, result in zip(sites, results):
+            if isinstance(result, Exception):
+                print(f"❌ {site.title()} scraping failed: {result}")
+                continue
+            deals.extend(result)
+            print(f"✅ Found {len(result)} deals from {site.title()}")
         
+        http_cache.report()
+        get_rate_limiter().report()
         return deals[:max_deals]
     
-    def _scrape_amazon_sync(self, max_deals=10) -> List[Dict]:
-        """Synchronous Amazon scraper."""
-        deals = []
-        
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get('https://www.amazon.in/deals', headers=headers, timeout=15)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for deal elements
-                deal_elements = soup.find_all(['div', 'section'], class_=lambda x: x and any(word in x.lower() for word in ['deal', 'product', 'item']))
-                
-                for element in deal_elements[:max_deals]:
-                    try:
-                        # Find product link
-                        link = element.find('a', href=re.compile(r'/dp/|/gp/product/'))
-                        if not link:
-                            continue
-                        
-                        url = link.get('href')
-                        if not url:
-                            continue
-                        
-                        # Make URL absolute
-                        if url.startswith('/'):
-                            url = f"https://www.amazon.in{url}"
-                        
-                        # Get title
-                        title_el = link.find(['h2', 'h3', 'span'], class_=lambda x: x and 'title' in x.lower())
-                        title = title_el.get_text().strip() if title_el else "Amazon Product"
-                        
-                        # Get price
-                        price_el = element.find(['span', 'div'], class_=lambda x: x and 'price' in x.lower())
-                        price = price_el.get_text().strip() if price_el else "₹999"
-                        
-                        # Calculate discount
-                        original_price_el = element.find(['span', 'div'], class_=lambda x: x and 'strike' in x.lower())
-                        discount_percent = 25  # Default
-                        if original_price_el:
-                            original_price = original_price_el.get_text().strip()
-                            try:
-                                original = float(re.sub(r'[₹,.\s]', '', original_price))
-                                current = float(re.sub(r'[₹,.\s]', '', price))
-                                discount_percent = int(((original - current) / original) * 100)
-                            except:
-                                pass
-                        
-                        deals.append({
-                            'title': title[:100],
-                            'price': price,
-                            'url': url,
-                            'discount_percent': discount_percent,
-                            'rating': '4.0 out of 5',
-                            'source': 'Amazon',
-                            'has_timer': True,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                        
-                    except Exception as e:
-                        continue
-                        
-        except Exception as e:
-            print(f"Amazon sync scraping error: {e}")
-        
-        return deals
-    
-    def _scrape_flipkart_sync(self, max_deals=10) -> List[Dict]:
-        """Synchronous Flipkart scraper."""
-        deals = []
-        
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get('https://www.flipkart.com/offers-store', headers=headers, timeout=15)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for product elements
-                product_elements = soup.find_all(['div', 'section'], class_=lambda x: x and any(word in x.lower() for word in ['product', 'item', 'deal']))
-                
-                for element in product_elements[:max_deals]:
-                    try:
-                        # Find product link
-                        link = element.find('a', href=re.compile(r'/p/|/product/'))
-                        if not link:
-                            continue
-                        
-                        url = link.get('href')
-                        if not url:
-                            continue
-                        
-                        # Make URL absolute
-                        if url.startswith('/'):
-                            url = f"https://www.flipkart.com{url}"
-                        
-                        # Get title
-                        title_el = link.find(['h3', 'h4', 'span'], class_=lambda x: x and 'title' in x.lower())
-                        title = title_el.get_text().strip() if title_el else "Flipkart Product"
-                        
-                        # Get price
-                        price_el = element.find(['span', 'div'], class_=lambda x: x and 'price' in x.lower())
-                        price = price_el.get_text().strip() if price_el else "₹999"
-                        
-                        # Get discount
-                        discount_el = element.find(['span', 'div'], class_=lambda x: x and 'discount' in x.lower())
-                        discount_percent = 30  # Default
-                        if discount_el:
-                            discount_text = discount_el.get_text().strip()
-                            try:
-                                discount_percent = int(re.sub(r'[%\s]', '', discount_text))
-                            except:
-                                pass
-                        
-                        deals.append({
-                            'title': title[:100],
-                            'price': price,
-                            'url': url,
-                            'discount_percent': discount_percent,
-                            'rating': '4.0 out of 5',
-                            'source': 'Flipkart',
-                            'has_timer': True,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                        
-                    except Exception as e:
-                        continue
-                        
-        except Exception as e:
-            print(f"Flipkart sync scraping error: {e}")
-        
-        return deals
-    
-    def _scrape_myntra_sync(self, max_deals=10) -> List[Dict]:
-        """Synchronous Myntra scraper."""
-        deals = []
-        
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get('https://www.myntra.com/sale', headers=headers, timeout=15)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for product elements
-                product_elements = soup.find_all(['div', 'section'], class_=lambda x: x and any(word in x.lower() for word in ['product', 'item', 'deal']))
-                
-                for element in product_elements[:max_deals]:
-                    try:
-                        # Find product link
-                        link = element.find('a', href=re.compile(r'/buy|/product/'))
-                        if not link:
-                            continue
-                        
-                        url = link.get('href')
-                        if not url:
-                            continue
-                        
-                        # Make URL absolute
-                        if url.startswith('/'):
-                            url = f"https://www.myntra.com{url}"
-                        
-                        # Get title
-                        title_el = link.find(['h3', 'h4', 'span'], class_=lambda x: x and 'title' in x.lower())
-                        title = title_el.get_text().strip() if title_el else "Myntra Product"
-                        
-                        # Get price
-                        price_el = element.find(['span', 'div'], class_=lambda x: x and 'price' in x.lower())
-                        price = price_el.get_text().strip() if price_el else "₹999"
-                        
-                        # Get discount
-                        discount_el = element.find(['span', 'div'], class_=lambda x: x and 'discount' in x.lower())
-                        discount_percent = 40  # Default for fashion
-                        if discount_el:
-                            discount_text = discount_el.get_text().strip()
-                            try:
-                                discount_percent = int(re.sub(r'[%\s]', '', discount_text))
-                            except:
-                                pass
-                        
-                        deals.append({
-                            'title': title[:100],
-                            'price': price,
-                            'url': url,
-                            'discount_percent': discount_percent,
-                            'rating': '4.2 out of 5',
-                            'source': 'Myntra',
-                            'has_timer': True,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                        
-                    except Exception as e:
-                        continue
-                        
-        except Exception as e:
-            print(f"Myntra sync scraping error: {e}")
-        
-        return deals
-    
-    def _scrape_nykaa_sync(self, max_deals=10) -> List[Dict]:
-        """Synchronous Nykaa scraper."""
-        deals = []
-        
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get('https://www.nykaa.com/offers', headers=headers, timeout=15)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for product elements
-                product_elements = soup.find_all(['div', 'section'], class_=lambda x: x and any(word in x.lower() for word in ['product', 'item', 'deal']))
-                
-                for element in product_elements[:max_deals]:
-                    try:
-                        # Find product link
-                        link = element.find('a', href=re.compile(r'/p/|/product/'))
-                        if not link:
-                            continue
-                        
-                        url = link.get('href')
-                        if not url:
-                            continue
-                        
-                        # Make URL absolute
-                        if url.startswith('/'):
-                            url = f"https://www.nykaa.com{url}"
-                        
-                        # Get title
-                        title_el = link.find(['h3', 'h4', 'span'], class_=lambda x: x and 'title' in x.lower())
-                        title = title_el.get_text().strip() if title_el else "Nykaa Product"
-                        
-                        # Get price
-                        price_el = element.find(['span', 'div'], class_=lambda x: x and 'price' in x.lower())
-                        price = price_el.get_text().strip() if price_el else "₹999"
-                        
-                        # Get discount
-                        discount_el = element.find(['span', 'div'], class_=lambda x: x and 'discount' in x.lower())
-                        discount_percent = 50  # Default for beauty
-                        if discount_el:
-                            discount_text = discount_el.get_text().strip()
-                            try:
-                                discount_percent = int(re.sub(r'[%\s]', '', discount_text))
-                            except:
-                                pass
-                        
-                        deals.append({
-                            'title': title[:100],
-                            'price': price,
-                            'url': url,
-                            'discount_percent': discount_percent,
-                            'rating': '4.3 out of 5',
-                            'source': 'Nykaa',
-                            'has_timer': True,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                        
-                    except Exception as e:
-                        continue
-                        
-        except Exception as e:
-            print(f"Nykaa sync scraping error: {e}")
-        
-        return deals
-    
-    def _scrape_ajio_sync(self, max_deals=10) -> List[Dict]:
-        """Synchronous Ajio scraper."""
+    async def _scrape_static_deals(self, site, max_deals=10) -> List[Dict]:
+        """Fetch one site's deal page over the shared HTTP client and parse its server HTML."""
+        page = STATIC_DEAL_PAGES[site]
         deals = []
         
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get('https://www.ajio.com/sale', headers=headers, timeout=15)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for product elements
-                product_elements = soup.find_all(['div', 'section'], class_=lambda x: x and any(word in x.lower() for word in ['product', 'item', 'deal']))
-                
-                for element in product_elements[:max_deals]:
-                    try:
-                        # Find product link
-                        link = element.find('a', href=re.compile(r'/p/|/product/'))
-                        if not link:
-                            continue
-                        
-                        url = link.get('href')
-                        if not url:
-                            continue
-                        
-                        # Make URL absolute
-                        if url.startswith('/'):
-                            url = f"https://www.ajio.com{url}"
-                        
-                        # Get title
-                        title_el = link.find(['h3', 'h4', 'span'], class_=lambda x: x and 'title' in x.lower())
-                        title = title_el.get_text().strip() if title_el else "Ajio Product"
-                        
-                        # Get price
-                        price_el = element.find(['span', 'div'], class_=lambda x: x and 'price' in x.lower())
-                        price = price_el.get_text().strip() if price_el else "₹999"
-                        
-                        # Get discount
-                        discount_el = element.find(['span', 'div'], class_=lambda x: x and 'discount' in x.lower())
-                        discount_percent = 45  # Default for fashion
-                        if discount_el:
-                            discount_text = discount_el.get_text().strip()
-                            try:
-                                discount_percent = int(re.sub(r'[%\s]', '', discount_text))
-                            except:
-                                pass
-                        
-                        deals.append({
-                            'title': title[:100],
-                            'price': price,
-                            'url': url,
-                            'discount_percent': discount_percent,
-                            'rating': '4.4 out of 5',
-                            'source': 'Ajio',
-                            'has_timer': True,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                        
-                    except Exception as e:
-                        continue
-                        
+            deals = await get_client().fetch(
+                page['url'], page['name'], lambda content: _parse_static_deals(page, content, max_deals)
+            ) or []
         except Exception as e:
-            print(f"Ajio sync scraping error: {e}")
+            print(f"{page['name']} sync scraping error: {e}")
         
         return deals
     
-    async def find_live_deals(self, max_deals=50) -> List[Dict]:
-        """Find real deals from live websites with working URLs."""
+    async def find_live_deals(self, max_deals=50, pool: Optional[BrowserPool] = None) -> List[Dict]:
+        """
+        Find real deals from live websites with working URLs.
+        Pages come from `pool` (e.g. the browser service's) or from one
+        temporary Chromium shared by all sites.
+        """
         all_deals = []
         
-        # Scrape from multiple sites
-        tasks = [
-            self._scrape_amazon_deals(max_deals//5),
-            self._scrape_flipkart_deals(max_deals//5),
-            self._scrape_myntra_deals(max_deals//5),
-            self._scrape_nykaa_deals(max_deals//5),
-            self._scrape_ajio_deals(max_deals//5)
-        ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async with pool_or_temporary(pool, size=len(DEAL_SITES)) as pool:
+            # Scrape from multiple sites
+            tasks = [self._scrape_site_deals(site, max_deals//5, pool) for site in DEAL_SITES]
+            
+            results = await asyncio.gather(*tasks, return_exceptions=True)
         
         for result in results:
             if isinstance(result, list):
                 all_deals.extend(result)
         
+        resource_stats.report()
+        get_rate_limiter().report()
         return all_deals[:max_deals]
     
-    async def _scrape_amazon_deals(self, max_deals=10) -> List[Dict]:
-        """Scrape real deals from Amazon with working URLs."""
-        deals = []
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
-            
-            try:
-                # Try Amazon deals page
-                await page.goto('https://www.amazon.in/deals', timeout=20000)
-                await page.wait_for_load_state('domcontentloaded', timeout=10000)
-                
-                # Look for deal elements with timers
-                deal_elements = await page.query_selector_all('[data-component-type="s-deal-card"], .a-section.a-spacing-base, [class*="deal"]')
-                
-                for element in deal_elements[:max_deals]:
-                    try:
-                        # Get real product link
-                        link_el = await element.query_selector('a[href*="/dp/"], a[href*="/gp/product/"]')
-                        if not link_el:
-                            continue
-                        
-                        url = await link_el.get_attribute('href')
-                        if not url:
-                            continue
-                        
-                        # Make URL absolute
-                        if url.startswith('/'):
-                            url = f"https://www.amazon.in{url}"
-                        
-                        # Get title
-                        title_el = await element.query_selector('h2 a, h3 a, .a-text-normal, [class*="title"]')
-                        title = await title_el.inner_text() if title_el else "Amazon Product"
-                        
-                        # Get price
-                        price_el = await element.query_selector('.a-price .a-offscreen, .a-price-whole, [class*="price"]')
-                        price = await price_el.inner_text() if price_el else "₹999"
-                        
-                        # Check for timer/deal badge
-                        timer_el = await element.query_selector('[class*="timer"], [class*="countdown"], [class*="deal"]')
-                        has_timer = timer_el is not None
-                        
-                        # Calculate discount
-                        original_price_el = await element.query_selector('.a-text-strike, [class*="original"]')
-                        discount_percent = 0
-                        if original_price_el:
-                            original_price = await original_price_el.inner_text()
-                            try:
-                                original = float(re.sub(r'[₹,.\s]', '', original_price))
-                                current = float(re.sub(r'[₹,.\s]', '', price))
-                                discount_percent = int(((original - current) / original) * 100)
-                            except:
-                                discount_percent = 25  # Default
-                        
-                        # Get rating
-                        rating_el = await element.query_selector('.a-icon-alt, [class*="rating"]')
-                        rating = await rating_el.inner_text() if rating_el else "4.0 out of 5"
-                        
-                        deals.append({
-                            'title': title.strip()[:100],
-                            'price': price.strip(),
-                            'url': url,
-                            'discount_percent': discount_percent,
-                            'rating': rating,
-                            'source': 'Amazon',
-                            'has_timer': has_timer,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                        
-                    except Exception as e:
-                        continue
-                        
-            except Exception as e:
-                print(f"Amazon scraping error: {e}")
-            finally:
-                await context.close()
-                await browser.close()
-        
-        return deals
-    
-    async def _scrape_flipkart_deals(self, max_deals=10) -> List[Dict]:
-        """Scrape real deals from Flipkart with working URLs."""
-        deals = []
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
-            
-            try:
-                # Try Flipkart offers page
-                await page.goto('https://www.flipkart.com/offers-store', timeout=20000)
-                await page.wait_for_load_state('domcontentloaded', timeout=10000)
-                
-                # Look for product elements
-                product_elements = await page.query_selector_all('[class*="product"], [class*="item"], [class*="deal"]')
-                
-                for element in product_elements[:max_deals]:
-                    try:
-                        # Get real product link
-                        link_el = await element.query_selector('a[href*="/p/"], a[href*="/product/"]')
-                        if not link_el:
-                            continue
-                        
-                        url = await link_el.get_attribute('href')
-                        if not url:
-                            continue
-                        
-                        # Make URL absolute
-                        if url.startswith('/'):
-                            url = f"https://www.flipkart.com{url}"
-                        
-                        # Get title
-                        title_el = await element.query_selector('a[class*="title"], a[class*="name"], [class*="title"]')
-                        title = await title_el.inner_text() if title_el else "Flipkart Product"
-                        
-                        # Get price
-                        price_el = await element.query_selector('[class*="price"]')
-                        price = await price_el.inner_text() if price_el else "₹999"
-                        
-                        # Check for timer/deal badge
-                        timer_el = await element.query_selector('[class*="timer"], [class*="countdown"], [class*="deal"]')
-                        has_timer = timer_el is not None
-                        
-                        # Calculate discount
-                        discount_el = await element.query_selector('[class*="discount"]')
-                        discount_percent = 0
-                        if discount_el:
-                            discount_text = await discount_el.inner_text()
-                            try:
-                                discount_percent = int(re.sub(r'[%\s]', '', discount_text))
-                            except:
-                                discount_percent = 30  # Default
-                        
-                        # Get rating
-                        rating_el = await element.query_selector('[class*="rating"]')
-                        rating = await rating_el.inner_text() if rating_el else "4.0 out of 5"
-                        
-                        deals.append({
-                            'title': title.strip()[:100],
-                            'price': price.strip(),
-                            'url': url,
-                            'discount_percent': discount_percent,
-                            'rating': rating,
-                            'source': 'Flipkart',
-                            'has_timer': has_timer,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                        
-                    except Exception as e:
-                        continue
-                        
-            except Exception as e:
-                print(f"Flipkart scraping error: {e}")
-            finally:
-                await context.close()
-                await browser.close()
-        
-        return deals
-    
-    async def _scrape_myntra_deals(self, max_deals=10) -> List[Dict]:
-        """Scrape real deals from Myntra with working URLs."""
-        deals = []
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
-            
-            try:
-                # Try Myntra sale page
-                await page.goto('https://www.myntra.com/sale', timeout=20000)
-                await page.wait_for_load_state('domcontentloaded', timeout=10000)
-                
-                # Look for product elements
-                product_elements = await page.query_selector_all('[class*="product"], [class*="item"], [class*="deal"]')
-                
-                for element in product_elements[:max_deals]:
-                    try:
-                        # Get real product link
-                        link_el = await element.query_selector('a[href*="/buy"], a[href*="/product/"]')
-                        if not link_el:
-                            continue
-                        
-                        url = await link_el.get_attribute('href')
-                        if not url:
-                            continue
-                        
-                        # Make URL absolute
-                        if url.startswith('/'):
-                            url = f"https://www.myntra.com{url}"
-                        
-                        # Get title
-                        title_el = await element.query_selector('a[class*="title"], a[class*="name"], [class*="title"]')
-                        title = await title_el.inner_text() if title_el else "Myntra Product"
-                        
-                        # Get price
-                        price_el = await element.query_selector('[class*="price"]')
-                        price = await price_el.inner_text() if price_el else "₹999"
-                        
-                        # Check for timer/deal badge
-                        timer_el = await element.query_selector('[class*="timer"], [class*="countdown"], [class*="deal"]')
-                        has_timer = timer_el is not None
-                        
-                        # Calculate discount
-                        discount_el = await element.query_selector('[class*="discount"]')
-                        discount_percent = 0
-                        if discount_el:
-                            discount_text = await discount_el.inner_text()
-                            try:
-                                discount_percent = int(re.sub(r'[%\s]', '', discount_text))
-                            except:
-                                discount_percent = 40  # Default for fashion
-                        
-                        deals.append({
-                            'title': title.strip()[:100],
-                            'price': price.strip(),
-                            'url': url,
-                            'discount_percent': discount_percent,
-                            'rating': '4.2 out of 5',  # Default for fashion
-                            'source': 'Myntra',
-                            'has_timer': has_timer,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                        
-                    except Exception as e:
-                        continue
-                        
-            except Exception as e:
-                print(f"Myntra scraping error: {e}")
-            finally:
-                await context.close()
-                await browser.close()
-        
-        return deals
-    
-    async def _scrape_nykaa_deals(self, max_deals=10) -> List[Dict]:
-        """Scrape real deals from Nykaa with working URLs."""
-        deals = []
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
-            
-            try:
-                # Try Nykaa offers page
-                await page.goto('https://www.nykaa.com/offers', timeout=20000)
-                await page.wait_for_load_state('domcontentloaded', timeout=10000)
-                
-                # Look for product elements
-                product_elements = await page.query_selector_all('[class*="product"], [class*="item"], [class*="deal"]')
-                
-                for element in product_elements[:max_deals]:
-                    try:
-                        # Get real product link
-                        link_el = await element.query_selector('a[href*="/p/"], a[href*="/product/"]')
-                        if not link_el:
-                            continue
-                        
-                        url = await link_el.get_attribute('href')
-                        if not url:
-                            continue
-                        
-                        # Make URL absolute
-                        if url.startswith('/'):
-                            url = f"https://www.nykaa.com{url}"
-                        
-                        # Get title
-                        title_el = await element.query_selector('a[class*="title"], a[class*="name"], [class*="title"]')
-                        title = await title_el.inner_text() if title_el else "Nykaa Product"
-                        
-                        # Get price
-                        price_el = await element.query_selector('[class*="price"]')
-                        price = await price_el.inner_text() if price_el else "₹999"
-                        
-                        # Check for timer/deal badge
-                        timer_el = await element.query_selector('[class*="timer"], [class*="countdown"], [class*="deal"]')
-                        has_timer = timer_el is not None
-                        
-                        # Calculate discount
-                        discount_el = await element.query_selector('[class*="discount"]')
-                        discount_percent = 0
-                        if discount_el:
-                            discount_text = await discount_el.inner_text()
-                            try:
-                                discount_percent = int(re.sub(r'[%\s]', '', discount_text))
-                            except:
-                                discount_percent = 50  # Default for beauty
-                        
-                        deals.append({
-                            'title': title.strip()[:100],
-                            'price': price.strip(),
-                            'url': url,
-                            'discount_percent': discount_percent,
-                            'rating': '4.3 out of 5',  # Default for beauty
-                            'source': 'Nykaa',
-                            'has_timer': has_timer,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                        
-                    except Exception as e:
-                        continue
-                        
-            except Exception as e:
-                print(f"Nykaa scraping error: {e}")
-            finally:
-                await context.close()
-                await browser.close()
-        
-        return deals
-    
-    async def _scrape_ajio_deals(self, max_deals=10) -> List[Dict]:
-        """Scrape real deals from Ajio with working URLs."""
+    async def _scrape_site_deals(self, site, max_deals, pool: BrowserPool) -> List[Dict]:
+        """Scrape real deals from one site's listing page with working URLs."""
+        listing = DEAL_LISTINGS[site]
         deals = []
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
-            
-            try:
-                # Try Ajio sale page
-                await page.goto('https://www.ajio.com/sale', timeout=20000)
-                await page.wait_for_load_state('domcontentloaded', timeout=10000)
-                
-                # Look for product elements
-                product_elements = await page.query_selector_all('[class*="product"], [class*="item"], [class*="deal"]')
+        try:
+            async with pool.page(listing['profile']) as page:
+                await _open_listing(page, listing)
                 
-                for element in product_elements[:max_deals]:
-                    try:
-                        # Get real product link
-                        link_el = await element.query_selector('a[href*="/p/"], a[href*="/product/"]')
-                        if not link_el:
-                            continue
-                        
-                        url = await link_el.get_attribute('href')
-                        if not url:
-                            continue
-                        
-                        # Make URL absolute
-                        if url.startswith('/'):
-                            url = f"https://www.ajio.com{url}"
+                records = await _extract_cards(page, listing, max_deals)
+                deals = [deal for deal in (_build_listing_item(listing, record) for record in records) if deal]
                         
-                        # Get title
-                        title_el = await element.query_selector('a[class*="title"], a[class*="name"], [class*="title"]')
-                        title = await title_el.inner_text() if title_el else "Ajio Product"
-                        
-                        # Get price
-                        price_el = await element.query_selector('[class*="price"]')
-                        price = await price_el.inner_text() if price_el else "₹999"
-                        
-                        # Check for timer/deal badge
-                        timer_el = await element.query_selector('[class*="timer"], [class*="countdown"], [class*="deal"]')
-                        has_timer = timer_el is not None
-                        
-                        # Calculate discount
-                        discount_el = await element.query_selector('[class*="discount"]')
-                        discount_percent = 0
-                        if discount_el:
-                            discount_text = await discount_el.inner_text()
-                            try:
-                                discount_percent = int(re.sub(r'[%\s]', '', discount_text))
-                            except:
-                                discount_percent = 45  # Default for fashion
-                        
-                        deals.append({
-                            'title': title.strip()[:100],
-                            'price': price.strip(),
-                            'url': url,
-                            'discount_percent': discount_percent,
-                            'rating': '4.4 out of 5',  # Default for fashion
-                            'source': 'Ajio',
-                            'has_timer': has_timer,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                        
-                    except Exception as e:
-                        continue
-                        
-            except Exception as e:
-                print(f"Ajio scraping error: {e}")
-            finally:
-                await context.close()
-                await browser.close()
+        except Exception as e:
+            print(f"{listing['name']} scraping error: {e}")
         
         return deals
     
-    async def find_best_sellers(self, max_products=10) -> List[Dict]:
+    async def find_best_sellers(self, max_products=10, pool: Optional[BrowserPool] = None) -> List[Dict]:
         """Find best-selling products from multiple sites."""
+        listing = BEST_SELLER_LISTINGS['amazon']
         best_sellers = []
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
-            
-            try:
-                # Amazon bestsellers
-                await page.goto('https://www.amazon.in/gp/bestsellers', timeout=15000)
-                await page.wait_for_load_state('domcontentloaded', timeout=8000)
-                
-                bestseller_elements = await page.query_selector_all('[class*="product"], [class*="item"]')
-                
-                for element in bestseller_elements[:max_products//2]:
-                    try:
-                        link_el = await element.query_selector('a[href*="/dp/"]')
-                        if link_el:
-                            url = await link_el.get_attribute('href')
-                            if url.startswith('/'):
-                                url = f"https://www.amazon.in{url}"
-                            
-                            title_el = await element.query_selector('h2 a, h3 a, .a-text-normal')
-                            title = await title_el.inner_text() if title_el else "Amazon Bestseller"
-                            
-                            price_el = await element.query_selector('.a-price .a-offscreen')
-                            price = await price_el.inner_text() if price_el else "₹999"
-                            
-                            best_sellers.append({
-                                'title': title.strip()[:100],
-                                'price': price.strip(),
-                                'url': url,
-                                'source': 'Amazon Bestseller',
-                                'scraped_at': datetime.now().isoformat()
-                            })
-                    except:
-                        continue
+        try:
+            async with pool_or_temporary(pool, size=1) as pool:
+                async with pool.page(listing['profile']) as page:
+                    # Amazon bestsellers
+                    await _open_listing(page, listing)
+                    
+                    records = await _extract_cards(page, listing, max_products//2)
+                    best_sellers = [item for item in (_build_listing_item(listing, record) for record in records) if item]
                         
-            except Exception as e:
-                print(f"Bestseller scraping error: {e}")
-            finally:
-                await context.close()
-                await browser.close()
+        except Exception as e:
+            print(f"Bestseller scraping error: {e}")
         
+        resource_stats.report()
         return best_sellers 
 
+# Unstop renders competition cards server-side and loads more through its
+# opportunity search API as the page scrolls.
+UNSTOP_LISTING = {
+    'name': 'Unstop',
+    'profile': 'unstop',
+    'url': 'https://unstop.com/competitions',
+    'base_url': 'https://unstop.com/competitions',
+    'goto_timeout': 20000,
+    'load_timeout': 10000,
+    'card': '.single_profile[id^="i_"]',
+    'fields': {
+        'id': {'self': True, 'attr': 'id'},
+        'title': 'h2',
+        'organizer': '.content > p',
+        'stats': '.other_fields'
+    }
+}
+UNSTOP_API_PATH = '/api/public/opportunity/search-result'
+UNSTOP_TAGS = ['hackathon', 'competition', 'unstop']
+# How long to wait for another batch of cards after a scroll
+UNSTOP_SCROLL_TIMEOUT = 2500
+
+_TIME_LEFT_RE = re.compile(r'(\d+)\s*(day|hour|min)\w*\s+left', re.IGNORECASE)
+
+async def _scroll_until_stable(page, card_selector, max_cards, timeout=UNSTOP_SCROLL_TIMEOUT) -> int:
+    """Scroll until `max_cards` cards are attached or a scroll brings no new ones; returns the count."""
+    cards = page.locator(card_selector)
+    count = await cards.count()
+    while count < max_cards:
+        await page.mouse.wheel(0, 10000)
+        try:
+            await page.wait_for_function(
+                '([selector, count]) => document.querySelectorAll(selector).length > count',
+                arg=[card_selector, count],
+                timeout=timeout,
+                polling=100
+            )
+        except PlaywrightTimeoutError:
+            break
+        count = await cards.count()
+    return count
+
+def _unstop_slug(*parts) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', ' '.join(parts).lower()).strip('-')
+
+def _unstop_card_id(record) -> str:
+    # Card ids look like 'i_1525596_1'
+    match = re.match(r'i_(\d+)', record.get('id') or '')
+    return match.group(1) if match else ''
+
+def _deadline_from_time_left(text, now=None) -> str:
+    """'5 days left' -> aware ISO timestamp of the deadline; '' when the card shows no countdown."""
+    match = _TIME_LEFT_RE.search(text or '')
+    if not match:
+        return ''
+    amount, unit = int(match.group(1)), match.group(2).lower()
+    delta = timedelta(days=amount) if unit == 'day' else timedelta(hours=amount) if unit == 'hour' else timedelta(minutes=amount)
+    # Keep the time of day: '5 hours left' must not become midnight today, which has already passed
+    return as_aware((now or datetime.now()) + delta).isoformat(timespec='seconds')
+
+def _unstop_listing(title, organizer, link, deadline='', team_size='', tags=None, source_id='') -> Dict:
+    return {
+        'title': title,
+        'company': organizer,
+        'location': '',
+        'work_type': '',
+        'posted_time': '',
+        'deadline': deadline,
+        'team_size': team_size,
+        'eligibility': '',
+        'link': link,
+        'tags': list(dict.fromkeys(UNSTOP_TAGS + (tags or []))),
+        'source': 'Unstop',
+        'source_id': str(source_id or ''),
+    }
+
+def _unstop_card_listing(record) -> Optional[Dict]:
+    """Listing from a rendered card; the link is rebuilt from Unstop's slug-id URL scheme."""
+    listing_id = _unstop_card_id(record)
+    title = (record.get('title') or '').strip()
+    if not listing_id or not title:
+        return None
+    organizer = (record.get('organizer') or '').strip()
+    link = f"{UNSTOP_LISTING['base_url']}/{_unstop_slug(title, organizer)}-{listing_id}"
+    return _unstop_listing(title, organizer, link, deadline=_deadline_from_time_left(record.get('stats')), source_id=listing_id)
+
+def _unstop_api_items(payload) -> List[Dict]:
+    """Opportunity dicts from a search-result response (paginated under data.data)."""
+    data = payload.get('data') if isinstance(payload, dict) else None
+    if isinstance(data, dict):
+        data = data.get('data')
+    return [item for item in data or [] if isinstance(item, dict)]
+
+def _unstop_api_listing(item) -> Optional[Dict]:
+    """Listing from one opportunity object of Unstop's search API."""
+    title = (item.get('title') or '').strip()
+    if not title:
+        return None
+    organizer = ((item.get('organisation') or {}).get('name') or '').strip()
+    requirements = item.get('regnRequirements') or {}
+    if item.get('seo_url'):
+        link = item['seo_url']
+    elif item.get('public_url'):
+        link = f"https://unstop.com/{item['public_url'].lstrip('/')}"
+    else:
+        link = f"{UNSTOP_LISTING['base_url']}/{_unstop_slug(title, organizer)}-{item.get('id')}"
+    team_size = ''
+    if requirements.get('max_team_size'):
+        team_size = f"{requirements.get('min_team_size') or 1}-{requirements['max_team_size']}"
+    tags = [str(item['type']).lower()] if item.get('type') else []
+    return _unstop_listing(
+        title, organizer, link,
+        deadline=requirements.get('end_regn_dt') or item.get('end_date') or '',
+        team_size=team_size,
+        tags=tags,
+        source_id=item.get('id')
+    )
+
+# Consecutive already-seen cards after which a newest-first page stops parsing
+# (more than one, so a pinned or promoted card does not end the page early)
+KNOWN_STREAK_STOP = 3
+
+# Per-source budgets (seconds) for one fetch_all; a source that runs over
+# is cancelled and reported as 'timeout' while the others still return.
+SOURCE_TIMEOUTS = {
+    'LinkedIn': 60,
+    'Unstop': 90,
+    'Internshala': 45,
+    'Cuvette': 45,
+    'Wellfound': 45,
+}
+DEFAULT_SOURCE_TIMEOUT = 60
+
 class JobListingScraper:
     """Scrapes job/internship/competition listings from various platforms."""
-    def __init__(self):
+    def __init__(self, seen_index=None):
         self.last_run_time = None  # To be set by scheduler
+        self.source_status = {}  # Outcome of each source in the last fetch_all
+        self.source_count = 0  # Sources in the current or last fetch
+        self.seen_index = seen_index  # A JobStore; lets sorted result pages stop at known listings
 
-    def fetch_linkedin_jobs(self, keywords, since_time):
-        """Fetch jobs from LinkedIn matching keywords, posted after since_time."""
-        import requests
-        from bs4 import BeautifulSoup
-        from datetime import datetime, timedelta
-        import re
+    def finished_fraction(self) -> float:
+        """Fraction of the current fetch's sources that have finished, in [0, 1]."""
+        return len(self.source_status) / self.source_count if self.source_count else 0.0
+
+    def _unknown_listings(self, listings) -> List[Dict]:
+        """
+        Listings of a newest-first result page the job store does not know, stopping
+        at the first run of KNOWN_STREAK_STOP known ones (the rest are older).
+        Applied after fetch() so the cached parse never depends on the store.
+        """
+        if self.seen_index is None:
+            return list(listings or [])
+        unknown = []
+        known = 0
+        for listing in listings or []:
+            if self.seen_index.contains(listing):
+                known += 1
+                if known >= KNOWN_STREAK_STOP:
+                    break
+                continue
+            known = 0
+            unknown.append(listing)
+        return unknown
+
+    async def _fetch_keywords(self, source, keywords, fetch_keyword):
+        """
+        Run one source's per-keyword fetches concurrently and flatten the
+        results. Failed keywords are traced and skipped; when every keyword
+        failed, the first error is raised so the source reports 'error'.
+        """
+        keywords = list(keywords)
+        results = await asyncio.gather(*(fetch_keyword(keyword) for keyword in keywords), return_exceptions=True)
         listings = []
+        errors = []
+        for keyword, result in zip(keywords, results):
+            if isinstance(result, BaseException):
+                tracer.event(source, 'keyword fetch failed', keyword=keyword, error=result)
+                errors.append(result)
+            else:
+                listings.extend(result)
+        if errors and len(errors) == len(results):
+            raise errors[0]
+        return listings
+
+    async def fetch_linkedin_jobs(self, keywords, since_time):
+        """Fetch jobs from LinkedIn matching keywords, posted after since_time."""
         base_url = "https://www.linkedin.com/jobs/search/"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        for keyword in keywords:
+        async def fetch_keyword(keyword):
             params = {
                 'keywords': keyword,
                 'location': 'India',
                 'f_TPR': 'r86400',  # posted in last 24 hours
                 'f_E': '2,3',  # Entry level, Internship
+                'sortBy': 'DD',  # newest first, so parsing can stop at known jobs
                 'trk': 'public_jobs_jobs-search-bar_search-submit',
             }
-            try:
-                response = requests.get(base_url, params=params, headers=headers, timeout=15)
-                if response.status_code != 200:
-                    continue
-                soup = BeautifulSoup(response.content, 'html.parser')
-                job_cards = soup.find_all('li', class_=re.compile(r'jobs-search-results__list-item'))
-                for card in job_cards:
-                    try:
-                        title_el = card.find('h3')
-                        company_el = card.find('h4')
-                        location_el = card.find('span', class_=re.compile(r'job-search-card__location'))
-                        link_el = card.find('a', href=True)
-                        posted_time_el = card.find('time')
-                        title = title_el.get_text(strip=True) if title_el else ''
-                        company = company_el.get_text(strip=True) if company_el else ''
-                        location = location_el.get_text(strip=True) if location_el else ''
-                        link = link_el['href'] if link_el else ''
-                        posted_time = posted_time_el['datetime'] if posted_time_el and posted_time_el.has_attr('datetime') else ''
-                        # Parse posted_time to datetime
-                        posted_dt = None
-                        if posted_time:
-                            try:
-                                posted_dt = datetime.fromisoformat(posted_time.replace('Z', '+00:00'))
-                            except:
-                                posted_dt = None
-                        if posted_dt and posted_dt < since_time:
-                            continue  # Skip old jobs
-                        # Work type (Remote/Onsite/Hybrid) - LinkedIn may have a tag
-                        work_type = ''
-                        tag_els = card.find_all('span', class_=re.compile(r'job-search-card__job-insight'))
-                        tags = [keyword.lower()]
-                        for tag_el in tag_els:
-                            tag_text = tag_el.get_text(strip=True)
-                            if any(x in tag_text.lower() for x in ['remote', 'onsite', 'hybrid']):
-                                work_type = tag_text
-                            tags.append(tag_text.lower())
-                        listings.append({
-                            'title': title,
-                            'company': company,
-                            'location': location,
-                            'work_type': work_type,
-                            'posted_time': posted_time,
-                            'deadline': '',
-                            'link': link,
-                            'tags': list(set(tags)),
-                            'source': 'LinkedIn',
-                        })
-                    except Exception:
-                        continue
-            except Exception:
-                continue
-        print(f"[DEBUG] LinkedIn: {len(listings)} jobs fetched.")
+            listings = await get_client().fetch(
+                base_url, 'LinkedIn', lambda content: self._parse_linkedin_jobs(content, keyword), params=params
+            )
+            return [l for l in self._unknown_listings(listings) if _posted_after(l, since_time)]
+        listings = await self._fetch_keywords('LinkedIn', keywords, fetch_keyword)
+        tracer.event('LinkedIn', 'fetched', count=len(listings))
         return listings
 
-    async def fetch_unstop_events_playwright(self, since_time, max_events=5):
-        from playwright.async_api import async_playwright
-        from datetime import datetime
-        import re
-        import asyncio
+    def _parse_linkedin_jobs(self, content, keyword):
         listings = []
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
+        for card in parse_html(content).select(_LINKEDIN['card']):
             try:
-                await page.goto('https://unstop.com/competitions', timeout=20000)
-                await page.wait_for_load_state('domcontentloaded', timeout=10000)
-                await page.wait_for_selector('main', timeout=10000)
-                # Scroll to bottom to trigger lazy loading
-                for _ in range(5):
-                    await page.mouse.wheel(0, 10000)
-                    await asyncio.sleep(1)
-                await asyncio.sleep(3)  # Wait for JS to render cards
-                html = await page.content()
-                with open('unstop_debug.html', 'w', encoding='utf-8') as f:
-                    f.write(html)
-                print('[DEBUG] Unstop: Saved loaded HTML to unstop_debug.html')
-                # Try to find event cards after scrolling
-                cards = await page.query_selector_all('a[href*="/competitions/"]')
-                for card in cards:
-                    try:
-                        title_el = await card.query_selector('h3, h2, span')
-                        title = await title_el.inner_text() if title_el else ''
-                        link = await card.get_attribute('href')
-                        # Organizer, deadline, etc. may be in sibling or parent nodes
-                        # For now, just print the title and link
-                        print(f"[DEBUG] Unstop event: {title} | {link}")
-                        listings.append({
-                            'title': title.strip(),
-                            'company': '',
-                            'location': '',
-                            'work_type': '',
-                            'posted_time': '',
-                            'deadline': '',
-                            'team_size': '',
-                            'eligibility': '',
-                            'link': link,
-                            'tags': ['hackathon', 'competition', 'unstop'],
-                            'source': 'Unstop',
-                        })
-                    except Exception as e:
-                        print(f"[DEBUG] Unstop (Playwright): Error parsing card: {e}")
-                        continue
+                title_el = card.select_one(_LINKEDIN['title'])
+                company_el = card.select_one(_LINKEDIN['company'])
+                location_el = card.select_one(_LINKEDIN['location'])
+                link_el = card.select_one(_LINKEDIN['link'])
+                posted_time_el = card.select_one(_LINKEDIN['posted_time'])
+                title = title_el.text() if title_el else ''
+                company = company_el.text() if company_el else ''
+                location = location_el.text() if location_el else ''
+                link = link_el.attr('href') if link_el else ''
+                posted_time = (posted_time_el.attr('datetime') or '') if posted_time_el else ''
+                # Work type (Remote/Onsite/Hybrid) - LinkedIn may have a tag
+                work_type = ''
+                tags = [keyword.lower()]
+                for tag_el in card.select(_LINKEDIN['insight']):
+                    tag_text = tag_el.text()
+                    if any(x in tag_text.lower() for x in ['remote', 'onsite', 'hybrid']):
+                        work_type = tag_text
+                    tags.append(tag_text.lower())
+                listing = {
+                    'title': title,
+                    'company': company,
+                    'location': location,
+                    'work_type': work_type,
+                    'posted_time': posted_time,
+                    'deadline': '',
+                    'link': link,
+                    'tags': list(set(tags)),
+                    'source': 'LinkedIn',
+                }
+                listings.append(listing)
             except Exception as e:
-                print(f"[DEBUG] Unstop (Playwright): Error fetching competitions: {e}")
-            finally:
-                await context.close()
-                await browser.close()
-        print(f"[DEBUG] Unstop (Playwright): {len(listings)} events fetched.")
+                tracer.event('LinkedIn', 'card parse error', error=e)
+                continue
+        return listings
+
+    async def fetch_unstop_events_playwright(self, since_time, max_events=20, pool: Optional[BrowserPool] = None, capture_api=True):
+        """
+        Fetch competitions from Unstop. Scrolls only while new cards keep
+        loading and fewer than `max_events` are on the page. With
+        `capture_api`, cards are enriched from the opportunity JSON the page
+        itself downloads (deadline, organizer, team size). Browser errors
+        propagate so fetch_all reports the source as 'error'.
+        """
+        listings = []
+        api_responses = []
+        def on_response(response):
+            if UNSTOP_API_PATH in response.url and response.ok:
+                api_responses.append(response)
+        try:
+            async with pool_or_temporary(pool, size=1) as pool:
+                async with pool.page(UNSTOP_LISTING['profile']) as page:
+                    if capture_api:
+                        page.on('response', on_response)
+                    await _open_listing(page, UNSTOP_LISTING)
+                    await _scroll_until_stable(page, UNSTOP_LISTING['card'], max_events)
+                    records = await _extract_cards(page, UNSTOP_LISTING, max_events)
+                    if tracer.enabled:
+                        tracer.page('Unstop', page.url, await page.content())
+                        tracer.event('Unstop', 'cards extracted', cards=len(records), api_responses=len(api_responses))
+                    api_items = {}
+                    for response in api_responses:
+                        try:
+                            for item in _unstop_api_items(await response.json()):
+                                api_items.setdefault(str(item.get('id')), item)
+                        except Exception as e:
+                            tracer.event('Unstop', 'unreadable API response', url=response.url, error=e)
+                    for record in records:
+                        listing_id = _unstop_card_id(record)
+                        item = api_items.pop(listing_id, None)
+                        listing = _unstop_api_listing(item) if item else _unstop_card_listing(record)
+                        if listing:
+                            listings.append(listing)
+                    # Opportunities the API returned but the page had not rendered yet
+                    for item in api_items.values():
+                        listing = _unstop_api_listing(item)
+                        if listing and len(listings) < max_events:
+                            listings.append(listing)
+        finally:
+            resource_stats.report()
+        tracer.event('Unstop', 'fetched', count=len(listings))
         return listings[:max_events]
 
-    def fetch_internshala_internships(self, keywords, since_time):
+    async def fetch_internshala_internships(self, keywords, since_time):
         """Fetch internships from Internshala matching keywords, posted after since_time."""
-        import requests
-        from bs4 import BeautifulSoup
-        from datetime import datetime
-        import re
-        listings = []
         base_url = "https://internshala.com/internships/keywords-{}"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        for keyword in keywords:
+        async def fetch_keyword(keyword):
             url = base_url.format(keyword.replace(' ', '-').lower())
+            listings = await get_client().fetch(
+                url, 'Internshala', lambda content: self._parse_internshala_internships(content, keyword)
+            )
+            return [l for l in self._unknown_listings(listings) if _posted_after(l, since_time)]
+        listings = await self._fetch_keywords('Internshala', keywords, fetch_keyword)
+        tracer.event('Internshala', 'fetched', count=len(listings))
+        return listings
+
+    def _parse_internshala_internships(self, content, keyword):
+        listings = []
+        for card in parse_html(content).select(_INTERNSHALA['card']):
             try:
-                response = requests.get(url, headers=headers, timeout=15)
-                if response.status_code != 200:
+                meta = card.select_one(_INTERNSHALA['meta'])
+                if not meta:
                     continue
-                soup = BeautifulSoup(response.content, 'html.parser')
-                cards = soup.find_all('div', class_=re.compile(r'internship_meta'))
-                for card in cards:
-                    try:
-                        # Try to get the parent card for more info
-                        parent = card.find_parent('div', class_='individual_internship')
-                        title_el = parent.find('div', class_='heading_4_5') if parent else card.find_previous('div', class_='heading_4_5')
-                        company_el = parent.find('a', class_='link_display_like_text') if parent else card.find_previous('a', class_='link_display_like_text')
-                        location_el = card.find('a', class_='location_link')
-                        posted_time_el = card.find('div', class_='status')
-                        link_el = parent.find('a', href=True) if parent else card.find_previous('a', href=True)
-                        title = title_el.get_text(strip=True) if title_el else ''
-                        company = company_el.get_text(strip=True) if company_el else ''
-                        location = location_el.get_text(strip=True) if location_el else ''
-                        link = 'https://internshala.com' + link_el['href'] if link_el and link_el['href'].startswith('/') else (link_el['href'] if link_el else '')
-                        posted_time = posted_time_el.get_text(strip=True) if posted_time_el else ''
-                        # Parse posted_time to datetime if possible (e.g., 'Posted 1 day ago')
-                        posted_dt = None
-                        if posted_time:
-                            m = re.search(r'(\d+) day', posted_time)
-                            if m:
-                                days_ago = int(m.group(1))
-                                posted_dt = datetime.now() - timedelta(days=days_ago)
-                            elif 'today' in posted_time.lower():
-                                posted_dt = datetime.now()
-                        if posted_dt and posted_dt < since_time:
-                            continue
-                        tags = [keyword.lower(), 'internship']
-                        listings.append({
-                            'title': title,
-                            'company': company,
-                            'location': location,
-                            'work_type': '',
-                            'posted_time': posted_time,
-                            'deadline': '',
-                            'link': link,
-                            'tags': list(set(tags)),
-                            'source': 'Internshala',
-                        })
-                    except Exception as e:
-                        print(f"[DEBUG] Internshala: Error parsing card: {e}")
-                        continue
+                title_el = card.select_one(_INTERNSHALA['title'])
+                company_el = card.select_one(_INTERNSHALA['company'])
+                location_el = meta.select_one(_INTERNSHALA['location'])
+                posted_time_el = meta.select_one(_INTERNSHALA['posted_time'])
+                link_el = card.select_one(_INTERNSHALA['link'])
+                title = title_el.text() if title_el else ''
+                company = company_el.text() if company_el else ''
+                location = location_el.text() if location_el else ''
+                link = _absolute_link(link_el, 'https://internshala.com')
+                posted_time = posted_time_el.text() if posted_time_el else ''
+                tags = [keyword.lower(), 'internship']
+                listing = {
+                    'title': title,
+                    'company': company,
+                    'location': location,
+                    'work_type': '',
+                    'posted_time': posted_time,
+                    'deadline': '',
+                    'link': link,
+                    'tags': list(set(tags)),
+                    'source': 'Internshala',
+                    'source_id': card.attr('internshipid') or '',
+                }
+                listings.append(listing)
             except Exception as e:
-                print(f"[DEBUG] Internshala: Error fetching {url}: {e}")
+                tracer.event('Internshala', 'card parse error', error=e)
                 continue
-        print(f"[DEBUG] Internshala: {len(listings)} internships fetched.")
         return listings
 
-    def fetch_cuvette_roles(self, keywords, since_time):
+    async def fetch_cuvette_roles(self, keywords, since_time):
         """Fetch internships/junior roles from Cuvette matching keywords, posted after since_time."""
-        import requests
-        from bs4 import BeautifulSoup
-        from datetime import datetime
-        import re
-        listings = []
         base_url = "https://www.cuvette.tech/jobs?search={}"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        for keyword in keywords:
-            url = base_url.format(keyword.replace(' ', '%20'))
+        async def fetch_keyword(keyword):
+            listings = await get_client().fetch(
+                base_url.format(keyword.replace(' ', '%20')), 'Cuvette',
+                lambda content: self._parse_cuvette_roles(content, keyword)
+            )
+            return [l for l in listings or [] if _posted_after(l, since_time)]
+        listings = await self._fetch_keywords('Cuvette', keywords, fetch_keyword)
+        tracer.event('Cuvette', 'fetched', count=len(listings))
+        return listings
+
+    def _parse_cuvette_roles(self, content, keyword):
+        listings = []
+        for card in parse_html(content).select(_CUVETTE['card']):
             try:
-                response = requests.get(url, headers=headers, timeout=15)
-                if response.status_code != 200:
-                    continue
-                soup = BeautifulSoup(response.content, 'html.parser')
-                cards = soup.find_all('div', class_=re.compile(r'job-card|job-listing'))
-                for card in cards:
-                    try:
-                        title_el = card.find('h3')
-                        company_el = card.find('span', class_=re.compile(r'company|org'))
-                        location_el = card.find('span', class_=re.compile(r'location'))
-                        posted_time_el = card.find('span', class_=re.compile(r'post-time|posted'))
-                        link_el = card.find('a', href=True)
-                        title = title_el.get_text(strip=True) if title_el else ''
-                        company = company_el.get_text(strip=True) if company_el else ''
-                        location = location_el.get_text(strip=True) if location_el else ''
-                        link = 'https://www.cuvette.tech' + link_el['href'] if link_el and link_el['href'].startswith('/') else (link_el['href'] if link_el else '')
-                        posted_time = posted_time_el.get_text(strip=True) if posted_time_el else ''
-                        # Parse posted_time to datetime if possible (e.g., '2 days ago')
-                        posted_dt = None
-                        if posted_time:
-                            m = re.search(r'(\d+) day', posted_time)
-                            if m:
-                                days_ago = int(m.group(1))
-                                posted_dt = datetime.now() - timedelta(days=days_ago)
-                            elif 'today' in posted_time.lower():
-                                posted_dt = datetime.now()
-                        if posted_dt and posted_dt < since_time:
-                            continue
-                        tags = [keyword.lower(), 'cuvette']
-                        listings.append({
-                            'title': title,
-                            'company': company,
-                            'location': location,
-                            'work_type': '',
-                            'posted_time': posted_time,
-                            'deadline': '',
-                            'link': link,
-                            'tags': list(set(tags)),
-                            'source': 'Cuvette',
-                        })
-                    except Exception:
-                        continue
-            except Exception:
+                title_el = card.select_one(_CUVETTE['title'])
+                company_el = card.select_one(_CUVETTE['company'])
+                location_el = card.select_one(_CUVETTE['location'])
+                posted_time_el = card.select_one(_CUVETTE['posted_time'])
+                link_el = card.select_one(_CUVETTE['link'])
+                title = title_el.text() if title_el else ''
+                company = company_el.text() if company_el else ''
+                location = location_el.text() if location_el else ''
+                link = _absolute_link(link_el, 'https://www.cuvette.tech')
+                posted_time = posted_time_el.text() if posted_time_el else ''
+                tags = [keyword.lower(), 'cuvette']
+                listings.append({
+                    'title': title,
+                    'company': company,
+                    'location': location,
+                    'work_type': '',
+                    'posted_time': posted_time,
+                    'deadline': '',
+                    'link': link,
+                    'tags': list(set(tags)),
+                    'source': 'Cuvette',
+                })
+            except Exception as e:
+                tracer.event('Cuvette', 'card parse error', error=e)
                 continue
-        print(f"[DEBUG] Cuvette: {len(listings)} roles fetched.")
         return listings
 
-    def fetch_wellfound_roles(self, keywords, since_time):
+    async def fetch_wellfound_roles(self, keywords, since_time):
         """Fetch internships/junior roles from Wellfound matching keywords, posted after since_time."""
-        import requests
-        from bs4 import BeautifulSoup
-        from datetime import datetime
-        import re
-        listings = []
         base_url = "https://wellfound.com/jobs?keywords={}&remote=true"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        for keyword in keywords:
-            url = base_url.format(keyword.replace(' ', '%20'))
+        async def fetch_keyword(keyword):
+            listings = await get_client().fetch(
+                base_url.format(keyword.replace(' ', '%20')), 'Wellfound',
+                lambda content: self._parse_wellfound_roles(content, keyword)
+            )
+            return [l for l in listings or [] if _posted_after(l, since_time)]
+        listings = await self._fetch_keywords('Wellfound', keywords, fetch_keyword)
+        tracer.event('Wellfound', 'fetched', count=len(listings))
+        return listings
+
+    def _parse_wellfound_roles(self, content, keyword):
+        listings = []
+        for card in parse_html(content).select(_WELLFOUND['card']):
             try:
-                response = requests.get(url, headers=headers, timeout=15)
-                if response.status_code != 200:
-                    continue
-                soup = BeautifulSoup(response.content, 'html.parser')
-                cards = soup.find_all('div', class_=re.compile(r'job-listing|styles_jobListing'))
-                for card in cards:
-                    try:
-                        title_el = card.find('div', class_=re.compile(r'title|styles_title'))
-                        company_el = card.find('div', class_=re.compile(r'company|styles_companyName'))
-                        location_el = card.find('div', class_=re.compile(r'location|styles_location'))
-                        posted_time_el = card.find('div', class_=re.compile(r'posted|styles_postedAt'))
-                        link_el = card.find('a', href=True)
-                        title = title_el.get_text(strip=True) if title_el else ''
-                        company = company_el.get_text(strip=True) if company_el else ''
-                        location = location_el.get_text(strip=True) if location_el else ''
-                        link = 'https://wellfound.com' + link_el['href'] if link_el and link_el['href'].startswith('/') else (link_el['href'] if link_el else '')
-                        posted_time = posted_time_el.get_text(strip=True) if posted_time_el else ''
-                        # Parse posted_time to datetime if possible (e.g., '2 days ago')
-                        posted_dt = None
-                        if posted_time:
-                            m = re.search(r'(\d+) day', posted_time)
-                            if m:
-                                days_ago = int(m.group(1))
-                                posted_dt = datetime.now() - timedelta(days=days_ago)
-                            elif 'today' in posted_time.lower():
-                                posted_dt = datetime.now()
-                        if posted_dt and posted_dt < since_time:
-                            continue
-                        tags = [keyword.lower(), 'wellfound']
-                        listings.append({
-                            'title': title,
-                            'company': company,
-                            'location': location,
-                            'work_type': '',
-                            'posted_time': posted_time,
-                            'deadline': '',
-                            'link': link,
-                            'tags': list(set(tags)),
-                            'source': 'Wellfound',
-                        })
-                    except Exception:
-                        continue
-            except Exception:
+                title_el = card.select_one(_WELLFOUND['title'])
+                company_el = card.select_one(_WELLFOUND['company'])
+                location_el = card.select_one(_WELLFOUND['location'])
+                posted_time_el = card.select_one(_WELLFOUND['posted_time'])
+                link_el = card.select_one(_WELLFOUND['link'])
+                title = title_el.text() if title_el else ''
+                company = company_el.text() if company_el else ''
+                location = location_el.text() if location_el else ''
+                link = _absolute_link(link_el, 'https://wellfound.com')
+                posted_time = posted_time_el.text() if posted_time_el else ''
+                tags = [keyword.lower(), 'wellfound']
+                listings.append({
+                    'title': title,
+                    'company': company,
+                    'location': location,
+                    'work_type': '',
+                    'posted_time': posted_time,
+                    'deadline': '',
+                    'link': link,
+                    'tags': list(set(tags)),
+                    'source': 'Wellfound',
+                })
+            except Exception as e:
+                tracer.event('Wellfound', 'card parse error', error=e)
                 continue
-        print(f"[DEBUG] Wellfound: {len(listings)} roles fetched.")
         return listings
 
-    async def fetch_all(self, keywords, since_time):
-        jobs = self.fetch_linkedin_jobs(keywords, since_time)
-        events = await self.fetch_unstop_events_playwright(since_time)
-        internships = self.fetch_internshala_internships(keywords, since_time)
-        cuvette = self.fetch_cuvette_roles(keywords, since_time)
-        wellfound = self.fetch_wellfound_roles(keywords, since_time)
-        return jobs + events + internships + cuvette + wellfound 
\ No newline at end of file
+    async def _run_source(self, coro, timeout):
+        """Await one source under its own timeout and describe how it went."""
+        started = time.monotonic()
+        try:
+            listings = await asyncio.wait_for(coro, timeout)
+            status, error = 'ok', None
+        except asyncio.TimeoutError:
+            listings, status, error = [], 'timeout', f"no response within {timeout}s"
+        except Exception as e:
+            listings, status, error = [], 'error', str(e)
+        return {
+            'status': status,
+            'listings': listings or [],
+            'count': len(listings or []),
+            'elapsed': round(time.monotonic() - started, 2),
+            'error': error
+        }
+
+    def _source_coros(self, keywords, since_time, pool: Optional[BrowserPool] = None) -> Dict:
+        return {
+            'LinkedIn': self.fetch_linkedin_jobs(keywords, since_time),
+            'Unstop': self.fetch_unstop_events_playwright(since_time, pool=pool),
+            'Internshala': self.fetch_internshala_internships(keywords, since_time),
+            'Cuvette': self.fetch_cuvette_roles(keywords, since_time),
+            'Wellfound': self.fetch_wellfound_roles(keywords, since_time),
+        }
+
+    async def _fetch_source(self, source, coro) -> Dict:
+        """Run one source under its SOURCE_TIMEOUTS budget and record its status."""
+        result = await self._run_source(coro, SOURCE_TIMEOUTS.get(source, DEFAULT_SOURCE_TIMEOUT))
+        status = self.source_status[source] = {k: v for k, v in result.items() if k != 'listings'}
+        tracer.event(source, 'source finished', **status)
+        if status['status'] != 'ok':
+            tracer.failure(source, status['error'])
+        return result
+
+    async def fetch_sources(self, keywords, since_time, pool: Optional[BrowserPool] = None) -> Dict[str, Dict]:
+        """
+        Fetch every source concurrently, each under its SOURCE_TIMEOUTS budget.
+        Returns {source: {status, listings, count, elapsed, error}}, where
+        status is 'ok', 'timeout' or 'error'; a failed source never holds up
+        or discards the others.
+        """
+        self.source_status = {}
+        coros = self._source_coros(keywords, since_time, pool)
+        self.source_count = len(coros)
+        results = await asyncio.gather(*(self._fetch_source(source, coro) for source, coro in coros.items()))
+        return dict(zip(coros, results))
+
+    async def stream_listings(self, keywords, since_time, pool: Optional[BrowserPool] = None, queue_size=50):
+        """
+        Async generator over the listings of every source, yielded as soon as
+        each source finishes. Sources run concurrently; the bounded queue
+        makes them wait when the consumer falls behind.
+        """
+        self.source_status = {}
+        queue = asyncio.Queue(maxsize=queue_size)
+        done = object()
+
+        async def produce(source, coro):
+            result = await self._fetch_source(source, coro)
+            for listing in result['listings']:
+                await queue.put(listing)
+
+        coros = self._source_coros(keywords, since_time, pool)
+        self.source_count = len(coros)
+
+        async def produce_all():
+            try:
+                await asyncio.gather(*(produce(source, coro) for source, coro in coros.items()))
+            except Exception as e:
+                tracer.event('Listings', 'stream failed', error=e)
+            await queue.put(done)
+
+        producer = asyncio.create_task(produce_all())
+        try:
+            while True:
+                listing = await queue.get()
+                if listing is done:
+                    break
+                yield listing
+        finally:
+            if not producer.done():
+                producer.cancel()
+            http_cache.report()
+            get_rate_limiter().report()
+
+    async def fetch_all(self, keywords, since_time, pool: Optional[BrowserPool] = None):
+        """All listings from every source that answered; per-source outcomes go to self.source_status."""
+        results = await self.fetch_sources(keywords, since_time, pool=pool)
+        http_cache.report()
+        get_rate_limiter().report()
+        return [listing for result in results.values() for listing in result['listings']]
@@ -0,0 +1,79 @@
+import re
+from typing import Dict, Iterable, List, Optional
+
+# Keyword tables (category -> keywords) compiled once into a single regex.
+# The alternation is laid out as a trie ('phone|photo' -> 'pho(?:ne|to)'),
+# so matching costs one walk down the trie per text position however many
+# keywords the tables hold, and one pass over the text finds every label.
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A keyword ends here: the longer continuations stay optional (and greedy)
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+class KeywordMatcher:
+    """
+    Substring (or whole-word, with word_boundary=True) matching of lowercase
+    keyword tables. Labels come back in table order, so first() keeps the
+    priority of an if/elif chain over the same table.
+    """
+    def __init__(self, table: Dict[str, Iterable[str]], word_boundary: bool = False):
+        self.labels_order = list(table)
+        self.word_boundary = word_boundary
+        keywords = {}
+        for label, words in table.items():
+            for word in words:
+                keywords.setdefault(word.lower(), []).append(label)
+        # The regex reports the longest keyword starting at each position, so a
+        # keyword also carries the labels of every keyword that is its prefix
+        # (and, with word boundaries, ends on a boundary inside it).
+        self._labels = {}
+        for word in keywords:
+            labels = set()
+            for end in range(1, len(word) + 1):
+                prefix = word[:end]
+                if prefix not in keywords:
+                    continue
+                if word_boundary and end < len(word) and _is_word(word[end - 1]) == _is_word(word[end]):
+                    continue
+                labels.update(keywords[prefix])
+            self._labels[word] = labels
+        body = _trie_pattern(keywords)
+        if word_boundary:
+            body = fr'\b{body}\b'
+        # Lookahead so matches starting inside an earlier match are found too
+        self._pattern = re.compile(f'(?=({body}))') if keywords else None
+
+    def labels(self, text: str) -> List[str]:
+        """Every label with a keyword in `text`, in table order."""
+        if not text or self._pattern is None:
+            return []
+        found = set()
+        for match in self._pattern.finditer(text.lower()):
+            found.update(self._labels[match.group(1)])
+        return [label for label in self.labels_order if label in found]
+
+    def first(self, text: str, default: Optional[str] = None) -> Optional[str]:
+        """The highest-priority label matching `text`, else `default`."""
+        labels = self.labels(text)
+        return labels[0] if labels else default
+
+    def search(self, text: str) -> bool:
+        """True if any keyword occurs in `text`."""
+        return bool(text) and self._pattern is not None and self._pattern.search(text.lower()) is not None
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from .listing_normalizer import NORMALIZED_FIELDS
+from .seen_index import normalize_link
+
+MESSAGE_CACHE_FILE = Path(__file__).resolve().parent.parent / 'data' / 'gemini_messages.json'
+GEMINI_MODEL = 'models/gemini-pro'
+# Fields left out of the prompt: parsed values, ranking details, and the
+# relative posted time, which changes between runs for the same listing
+PROMPT_EXCLUDED_FIELDS = set(NORMALIZED_FIELDS) | {'score', 'posted_time'}
+# Fields that identify a cached message, besides the listing's ID (source_id,
+# else its link without the query) and its sorted tags; tag order and
+# tracking params differ between fetches of the same listing
+CACHE_KEY_FIELDS = ('source', 'title', 'company', 'deadline')
+# A stuck Gemini request gives up after this long, so it cannot hold up exit
+REQUEST_TIMEOUT_SECONDS = 60
+
+class MessageGenerator:
+    """
+    Gemini-written Telegram messages for listings. The client is configured
+    once; requests run on a small thread pool, and outputs are cached in
+    data/gemini_messages.json by a hash of the listing's identifying fields
+    (see cache_key). generate() gives up
+    when a listing's `budget_seconds` run out, and returns None so the caller
+    falls back to its template message. Requests that finish late are still
+    cached for the next run. close() cancels requests that have not started.
+    """
+    def __init__(self, api_key=None, model_name=GEMINI_MODEL, cache_path=MESSAGE_CACHE_FILE,
+                 max_concurrency=4, budget_seconds=20, ttl_days=30, complete: Optional[Callable[[str], str]] = None):
+        self.api_key = api_key or os.getenv("GEMINI_API_KEY")
+        self.model_name = model_name
+        self.cache_path = Path(cache_path)
+        self.budget_seconds = budget_seconds
+        self.ttl_days = ttl_days
+        # complete(prompt) -> text; defaults to the Gemini model
+        self._complete = complete
+        self._model = None
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='gemini')
+        self._lock = threading.Lock()
+        # hash -> future of requests started this run
+        self._inflight = {}
+        self._dirty = False
+        self.cache = self._load()
+
+    @property
+    def enabled(self) -> bool:
+        return self._complete is not None or bool(self.api_key)
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def prompt(self, listing: Dict, is_hackathon=False) -> str:
+        prompt = "Write a concise, engaging Telegram message for this "
+        prompt += "hackathon/competition" if is_hackathon else "job/internship"
+        return prompt + ":\n" + str({k: v for k, v in listing.items() if k not in PROMPT_EXCLUDED_FIELDS})
+
+    def cache_key(self, listing: Dict, is_hackathon=False) -> str:
+        canonical = {field: listing.get(field) for field in CACHE_KEY_FIELDS}
+        canonical['id'] = listing.get('source_id') or normalize_link(listing.get('link') or '')
+        canonical['tags'] = sorted(str(tag) for tag in listing.get('tags') or [])
+        canonical['kind'] = 'hackathon' if is_hackathon else 'job'
+        canonical['model'] = self.model_name
+        return hashlib.sha256(json.dumps(canonical, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def _call(self, prompt: str) -> str:
+        if self._complete is not None:
+            return self._complete(prompt)
+        with self._lock:
+            if self._model is None:
+                import google.generativeai as genai
+                genai.configure(api_key=self.api_key)
+                self._model = genai.GenerativeModel(self.model_name)
+        response = self._model.generate_content(prompt, request_options={'timeout': REQUEST_TIMEOUT_SECONDS})
+        return response.text.strip() if hasattr(response, 'text') else str(response)
+
+    def _request(self, key: str, prompt: str) -> str:
+        text = self._call(prompt)
+        with self._lock:
+            self.cache[key] = {'text': text, 'created': datetime.now().isoformat()}
+            self._dirty = True
+        return text
+
+    def prefetch(self, items: List[Tuple[Dict, bool]]) -> int:
+        """Start requests for (listing, is_hackathon) pairs without cached text; returns how many started."""
+        if not self.enabled:
+            return 0
+        started = 0
+        for listing, is_hackathon in items:
+            key = self.cache_key(listing, is_hackathon)
+            with self._lock:
+                if key in self.cache or key in self._inflight:
+                    continue
+                self._inflight[key] = self._executor.submit(self._request, key, self.prompt(listing, is_hackathon))
+            started += 1
+        return started
+
+    def generate(self, listing: Dict, is_hackathon=False, deadline: Optional[float] = None) -> Optional[str]:
+        """
+        Cached or freshly generated message; None when disabled, failed or
+        over budget. Waits until `deadline` (time.monotonic()), by default
+        `budget_seconds` from this call.
+        """
+        if not self.enabled:
+            return None
+        if deadline is None:
+            deadline = time.monotonic() + self.budget_seconds
+        key = self.cache_key(listing, is_hackathon)
+        if key in self.cache:
+            return self.cache[key]['text']
+        self.prefetch([(listing, is_hackathon)])
+        with self._lock:
+            future = self._inflight.get(key)
+            cached = self.cache.get(key)
+        if future is None:
+            # Finished, and pruned by save(), between the cache check and prefetch()
+            return cached['text'] if cached else None
+        try:
+            text = future.result(timeout=max(deadline - time.monotonic(), 0))
+            print("[Gemini] Success: Message generated.")
+            return text
+        except FutureTimeoutError:
+            print(f"[Gemini] Over the {self.budget_seconds}s budget; using the template message.")
+        except Exception as e:
+            print(f"[Gemini] Error: {e}")
+        return None
+
+    def generate_many(self, items: List[Tuple[Dict, bool]]) -> List[Optional[str]]:
+        """generate() for a batch, with all requests in flight at once under one budget."""
+        deadline = time.monotonic() + self.budget_seconds
+        self.prefetch(items)
+        return [self.generate(listing, is_hackathon, deadline) for listing, is_hackathon in items]
+
+    def save(self):
+        """Persist new outputs, dropping entries older than `ttl_days`."""
+        with self._lock:
+            if not self._dirty:
+                return
+            cutoff = (datetime.now() - timedelta(days=self.ttl_days)).isoformat()
+            self.cache = {key: entry for key, entry in self.cache.items() if entry['created'] >= cutoff}
+            # Requests of this run are done or abandoned; late ones still land in the cache
+            self._inflight = {key: future for key, future in self._inflight.items() if not future.done()}
+            entries = dict(self.cache)
+            self._dirty = False
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def close(self):
+        """Cancel queued requests and let the worker threads exit once their current call returns."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
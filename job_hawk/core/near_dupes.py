@@ -0,0 +1,50 @@
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+# The same role reposted on another source (or retitled slightly) has the
+# same normalized company, nearly the same title words and a compatible
+# location. Signatures are (company, title words, location words); the
+# company is matched exactly, so the job store looks candidates up by an
+# indexed company column and only compares titles within one company.
+# Titles match when their word sets have a Jaccard similarity of at least
+# TITLE_JACCARD; "Research Intern" vs "Marketing Intern" (1/3) stay apart.
+TITLE_JACCARD = 0.75
+
+# Words that vary between sources without changing the role
+NOISE_WORDS = {'inc', 'ltd', 'pvt', 'private', 'limited', 'llp', 'llc', 'corp', 'the', 'india', 'and', 'of', 'at', 'for'}
+# Further words dropped from company names only ("Acme Technologies" is "Acme")
+COMPANY_NOISE_WORDS = {'technologies', 'solutions', 'services', 'labs', 'systems', 'co', 'company'}
+ALIASES = {
+    'bengaluru': 'bangalore', 'gurugram': 'gurgaon', 'bombay': 'mumbai',
+    'sr': 'senior', 'jr': 'junior', 'dev': 'developer', 'engg': 'engineering', 'internship': 'intern'
+}
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+def tokens(text: str, noise=NOISE_WORDS) -> List[str]:
+    return [ALIASES.get(word, word) for word in _WORD_RE.findall((text or '').lower()) if word not in noise]
+
+def _words(text: str, noise=NOISE_WORDS) -> str:
+    return ' '.join(sorted(set(tokens(text, noise))))
+
+def listing_signature(listing: Dict) -> Optional[Tuple[str, str, str]]:
+    """(company, title words, location words) as normalized strings; None without a company or title."""
+    company = ' '.join(tokens(listing.get('company', ''), NOISE_WORDS | COMPANY_NOISE_WORDS))
+    title = _words(listing.get('title', ''))
+    if not company or not title:
+        return None
+    return company, title, _words(listing.get('location', ''))
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+def same_role(title: str, location: str, other_title: str, other_location: str) -> bool:
+    """
+    True for titles within TITLE_JACCARD of each other and locations where
+    one's words include the other's ("Bangalore" in "Bangalore, Karnataka");
+    a missing location matches any. The companies are assumed equal.
+    """
+    if jaccard(set(title.split()), set(other_title.split())) < TITLE_JACCARD:
+        return False
+    place, other_place = set(location.split()), set(other_location.split())
+    return place <= other_place or other_place <= place
@@ -0,0 +1,149 @@
+import asyncio
+from datetime import datetime
+from utils.trace import tracer
+from .listing_normalizer import normalize
+from .matcher import KeywordMatcher
+
+# Streaming stages for the job hunt. Each stage is an async generator that
+# takes an async iterable of listings and yields the ones that pass, so a
+# listing flows from its source to Telegram without waiting for the rest.
+
+# Filter out irrelevant domains (e.g., mechanical, civil, non-tech)
+RELEVANT_DOMAINS = [
+    'software', 'developer', 'design', 'ui', 'ux', 'machine learning', 'ai', 'product', 'research', 'frontend', 'backend', 'intern', 'engineer', 'data', 'python', 'javascript', 'web', 'app', 'cloud', 'fullstack', 'ml', 'dl', 'artificial intelligence', 'computer', 'technology', 'tech', 'product manager', 'product design', 'case competition', 'hackathon', 'sprint'
+]
+RELEVANT_MATCHER = KeywordMatcher({'relevant': RELEVANT_DOMAINS})
+HACKATHON_TAGS = {'hackathon', 'case competition', 'sprint', 'competition'}
+# Telegram messages per kind and run
+NOTIFY_LIMITS = {'hackathon': 5, 'job': 5}
+
+def is_relevant(listing) -> bool:
+    text = listing.get('title', '') + ' ' + ' '.join(listing.get('tags', []))
+    return RELEVANT_MATCHER.search(text)
+
+def listing_kind(listing) -> str:
+    """'hackathon' for hackathons/competitions, 'job' for jobs and internships."""
+    tags = set(t.lower() for t in listing.get('tags', []))
+    return 'hackathon' if tags & HACKATHON_TAGS else 'job'
+
+async def unseen(listings, job_store, stats: dict):
+    """Drop listings the job store already knows from earlier runs (counted in stats['known'])."""
+    async for listing in listings:
+        if job_store.contains(listing):
+            stats['known'] = stats.get('known', 0) + 1
+            continue
+        yield listing
+
+async def relevant(listings):
+    async for listing in listings:
+        if is_relevant(listing):
+            yield listing
+
+async def dedupe(listings):
+    """Drop repeats of (title, company, posted_time) within one run."""
+    seen = set()
+    async for listing in listings:
+        key = (listing.get('title', '').strip().lower(), listing.get('company', '').strip().lower(), listing.get('posted_time', '').strip())
+        if key not in seen:
+            seen.add(key)
+            yield listing
+
+async def normalized(listings):
+    """Parse each listing's posted and deadline strings into aware datetimes, once."""
+    async for listing in listings:
+        normalize(listing)
+        if listing.get('deadline') and listing['deadline_at'] is None:
+            tracer.event('Scheduler', 'unparseable deadline', deadline=listing['deadline'])
+        yield listing
+
+async def open_only(listings, stats: dict):
+    """Drop listings whose deadline has passed; counts them in stats['closed']."""
+    async for listing in listings:
+        deadline_at = normalize(listing)['deadline_at']
+        if deadline_at is not None and deadline_at < datetime.now().astimezone():
+            stats['closed'] = stats.get('closed', 0) + 1
+            continue
+        yield listing
+
+async def near_unique(listings, job_store, stats: dict):
+    """Drop near-duplicates of any listing in the job history (e.g. the same role on two sites)."""
+    async for listing in listings:
+        duplicate_of = job_store.near_duplicate(listing)
+        if duplicate_of:
+            stats['near_dupes'] = stats.get('near_dupes', 0) + 1
+            tracer.event('Scheduler', 'near-duplicate', title=listing.get('title'), source=listing.get('source'), duplicate_of=duplicate_of)
+            continue
+        yield listing
+
+def notify_eligible(listing: dict) -> bool:
+    """Hackathons are only sent when they come from Unstop."""
+    return listing_kind(listing) != 'hackathon' or listing.get('source') == 'Unstop'
+
+async def notify(listings, send, limits=NOTIFY_LIMITS, queue_size=5, ranker=None, prepare=None, progress=None, flush_every=2.0):
+    """
+    Pass every listing through, handing the first `limits[kind]` of each kind
+    to `send(listing, is_hackathon)` as they arrive. With a `ranker`
+    (core.ranking.Ranker) listings are scored as they pass instead, and
+    every `flush_every` seconds the ranker releases its best listings in
+    proportion to `progress()`, the fraction of sources finished; the rest
+    are sent once the stream ends. So a slow source delays only its own
+    share of the notifications.
+    `send` is blocking (Gemini, Telegram), so it runs on a worker thread fed
+    by a bounded queue; `prepare(listings)`, if given, is called (without
+    blocking) as listings are queued so their messages can be generated
+    concurrently. Only notify_eligible() listings are sent.
+    """
+    queue = asyncio.Queue(maxsize=queue_size)
+    sent = {kind: 0 for kind in limits}
+
+    async def worker():
+        while True:
+            listing = await queue.get()
+            if listing is None:
+                return
+            try:
+                await asyncio.to_thread(send, listing, listing_kind(listing) == 'hackathon')
+            except Exception as e:
+                print(f"Notification failed: {e}")
+
+    async def flush(fraction):
+        released = ranker.release(fraction)
+        if released and prepare is not None:
+            prepare(released)
+        for listing in released:
+            await queue.put(listing)
+
+    async def flush_periodically(stop):
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), flush_every)
+            except asyncio.TimeoutError:
+                await flush(progress())
+
+    sender = asyncio.create_task(worker())
+    stop = asyncio.Event()
+    flusher = asyncio.create_task(flush_periodically(stop)) if ranker is not None and progress is not None else None
+    try:
+        async for listing in listings:
+            kind = listing_kind(listing)
+            eligible = notify_eligible(listing)
+            if ranker is not None:
+                if eligible:
+                    ranker.add(listing)
+            elif eligible and sent.get(kind, 0) < limits.get(kind, 0):
+                sent[kind] += 1
+                if prepare is not None:
+                    prepare([listing])
+                await queue.put(listing)
+            yield listing
+        if flusher is not None:
+            # Let a flush in progress finish queueing what it released
+            stop.set()
+            await flusher
+        if ranker is not None:
+            await flush(1.0)
+    finally:
+        if flusher is not None and not flusher.done():
+            flusher.cancel()
+        await queue.put(None)
+        await sender
@@ -0,0 +1,155 @@
+import math
+from array import array
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DAY = 86400.0
+
+class PriceSeries:
+    """
+    One product's price history as two compact array('d') columns (unix time,
+    price). Points older than `raw_days` are folded into one daily low, and
+    points older than `retention_days` are dropped. Min/max over the retained
+    window, EMA, return volatility (Welford) and the lows of each window in
+    `windows` (monotonic deques) are kept up to date on append, so none of
+    them scan.
+    """
+    def __init__(self, windows=(30, 90), ema_alpha=0.3, raw_days=30, retention_days=730, compact_every=64):
+        self.times = array('d')
+        self.prices = array('d')
+        self.ema_alpha = ema_alpha
+        self.raw_days = raw_days
+        self.retention_days = retention_days
+        self.compact_every = compact_every
+        self.ema = None
+        self._returns = 0
+        self._mean_return = 0.0
+        self._m2 = 0.0
+        # days -> deque of (time, price) with strictly increasing prices
+        self._lows = {days: deque() for days in windows}
+        # Same for the retained window, plus one with strictly decreasing prices for the high
+        self._retained_lows = deque()
+        self._retained_highs = deque()
+        # Everything before this index is already one point per day
+        self._compacted = 0
+        self._appends = 0
+
+    @classmethod
+    def from_observations(cls, observations: Iterable[Tuple[float, float]], **kwargs) -> 'PriceSeries':
+        series = cls(**kwargs)
+        for observed_at, price in observations:
+            series.append(observed_at, price)
+        return series
+
+    def __len__(self):
+        return len(self.prices)
+
+    def append(self, observed_at: float, price: float):
+        price = float(price)
+        if self.times and observed_at < self.times[-1]:
+            observed_at = self.times[-1]  # keep the columns ordered
+        if self.prices and self.prices[-1] > 0:
+            # Welford update over relative price changes
+            change = price / self.prices[-1] - 1
+            self._returns += 1
+            delta = change - self._mean_return
+            self._mean_return += delta / self._returns
+            self._m2 += delta * (change - self._mean_return)
+        self.times.append(observed_at)
+        self.prices.append(price)
+        while self._retained_lows and self._retained_lows[-1][1] >= price:
+            self._retained_lows.pop()
+        self._retained_lows.append((observed_at, price))
+        while self._retained_highs and self._retained_highs[-1][1] <= price:
+            self._retained_highs.pop()
+        self._retained_highs.append((observed_at, price))
+        self.ema = price if self.ema is None else self.ema_alpha * price + (1 - self.ema_alpha) * self.ema
+        for lows in self._lows.values():
+            while lows and lows[-1][1] >= price:
+                lows.pop()
+            lows.append((observed_at, price))
+        self._appends += 1
+        if self._appends % self.compact_every == 0:
+            self._compact(observed_at)
+
+    def _retained(self, extremes: deque) -> Optional[float]:
+        if not self.times:
+            return None
+        cutoff = self.times[-1] - self.retention_days * DAY
+        while extremes and extremes[0][0] < cutoff:
+            extremes.popleft()
+        return extremes[0][1] if extremes else None
+
+    @property
+    def min(self) -> Optional[float]:
+        """Lowest price within `retention_days` of the latest observation."""
+        return self._retained(self._retained_lows)
+
+    @property
+    def max(self) -> Optional[float]:
+        """Highest price within `retention_days` of the latest observation."""
+        return self._retained(self._retained_highs)
+
+    def low(self, days: int, now: Optional[float] = None) -> Optional[float]:
+        """Lowest price seen in the last `days` days (one of the configured windows)."""
+        lows = self._lows[days]
+        if now is None:
+            now = self.times[-1] if self.times else 0
+        while lows and lows[0][0] < now - days * DAY:
+            lows.popleft()
+        return lows[0][1] if lows else None
+
+    def is_lowest(self, days: int = 90, price: Optional[float] = None, now: Optional[float] = None) -> bool:
+        """True if `price` (default: the latest) is at or below every price of the last `days` days."""
+        if price is None:
+            if not self.prices:
+                return False
+            price = self.prices[-1]
+        low = self.low(days, now)
+        return low is not None and price <= low
+
+    @property
+    def volatility(self) -> float:
+        """Standard deviation of relative price changes between observations."""
+        return math.sqrt(self._m2 / (self._returns - 1)) if self._returns > 1 else 0.0
+
+    def last(self, count: int) -> List[float]:
+        return list(self.prices[-count:])
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        return {
+            'min': self.min,
+            'max': self.max,
+            'ema': self.ema,
+            'volatility': self.volatility,
+            **{f"low_{days}d": self.low(days) for days in self._lows}
+        }
+
+    def _compact(self, now: float):
+        """Fold raw points older than `raw_days` into daily lows and drop points past retention."""
+        raw_cutoff = now - self.raw_days * DAY
+        keep_after = now - self.retention_days * DAY
+        end = self._compacted
+        while end < len(self.times) and self.times[end] < raw_cutoff:
+            end += 1
+        start = 0
+        while start < len(self.times) and self.times[start] < keep_after:
+            start += 1
+        if end <= self._compacted and start == 0:
+            return
+        times, prices = array('d'), array('d')
+        # Already-daily part, minus anything past retention
+        times.extend(self.times[start:self._compacted] if start < self._compacted else [])
+        prices.extend(self.prices[start:self._compacted] if start < self._compacted else [])
+        for i in range(max(start, self._compacted), end):
+            day = self.times[i] // DAY
+            if times and times[-1] // DAY == day:
+                prices[-1] = min(prices[-1], self.prices[i])
+            else:
+                times.append(day * DAY)
+                prices.append(self.prices[i])
+        compacted = len(times)
+        raw_from = max(start, end)
+        times.extend(self.times[raw_from:])
+        prices.extend(self.prices[raw_from:])
+        self.times, self.prices, self._compacted = times, prices, compacted
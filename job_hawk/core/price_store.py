@@ -0,0 +1,202 @@
+import atexit
+import json
+import sqlite3
+import time
+import weakref
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from .price_series import DAY
+
+PRICES_DB = Path(__file__).resolve().parent.parent / 'data' / 'prices.db'
+LEGACY_HISTORY_FILE = Path(__file__).resolve().parent.parent / 'data' / 'price_history.json'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    url TEXT PRIMARY KEY,
+    title TEXT,
+    first_seen TEXT NOT NULL,
+    last_updated TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS prices (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    observed_at REAL NOT NULL,
+    price REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS prices_url_time ON prices (url, observed_at);
+CREATE TABLE IF NOT EXISTS migrations (
+    name TEXT PRIMARY KEY,
+    applied_at TEXT NOT NULL
+);
+"""
+
+_UPSERT_PRODUCT = """
+INSERT INTO products (url, title, first_seen, last_updated) VALUES (?, ?, ?, ?)
+ON CONFLICT (url) DO UPDATE SET title = excluded.title, last_updated = excluded.last_updated
+"""
+
+# Keep the cheapest row of each product and day; SQLite takes the bare id from the MIN(price) row
+_FOLD_TO_DAILY_LOWS = """
+DELETE FROM prices WHERE observed_at < :cutoff AND id NOT IN (
+    SELECT id FROM (
+        SELECT id, MIN(price) FROM prices WHERE observed_at < :cutoff
+        GROUP BY url, CAST(observed_at / 86400 AS INTEGER)
+    )
+)
+"""
+
+# Stores that buffered rows, flushed once at exit; held weakly so stores can be freed
+_open_stores = weakref.WeakSet()
+
+@atexit.register
+def _flush_open_stores():
+    for store in list(_open_stores):
+        store.flush()
+
+class PriceStore:
+    """
+    Write-behind price history in SQLite (WAL). append() only buffers; rows
+    reach the database in one transaction every `flush_every` appends, on
+    flush() or close(), or at exit while the store is still referenced. WAL
+    plus a busy timeout lets the manual and scheduled runs write to the same
+    file safely. Stored rows follow PriceSeries' retention: about once a day
+    a flush folds rows older than `raw_days` into one daily low per product
+    and deletes rows older than `retention_days`.
+    """
+    def __init__(self, path=PRICES_DB, flush_every=50, legacy_json=LEGACY_HISTORY_FILE,
+                 raw_days=30, retention_days=730, compact_every=DAY):
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self.legacy_json = Path(legacy_json) if legacy_json else None
+        self.raw_days = raw_days
+        self.retention_days = retention_days
+        self.compact_every = compact_every
+        self._conn = None
+        self._compacted_at = None
+        # Buffered (url, title, observed_at, price) rows not yet written
+        self._pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), timeout=10, isolation_level=None)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA busy_timeout=10000')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(_SCHEMA)
+            if self.legacy_json is not None:
+                self._migrate_json(self.legacy_json)
+        return self._conn
+
+    def append(self, url: str, price: float, title: str = '', observed_at: Optional[float] = None):
+        """Buffer one observation; flushes when `flush_every` rows are pending."""
+        self._pending.append((url, title, observed_at or time.time(), float(price)))
+        _open_stores.add(self)
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all buffered rows in a single transaction; returns how many."""
+        if not self._pending:
+            return 0
+        rows, self._pending = self._pending, []
+        conn = self._connection()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            for url, title, observed_at, price in rows:
+                stamp = datetime.fromtimestamp(observed_at).isoformat()
+                conn.execute(_UPSERT_PRODUCT, (url, title, stamp, stamp))
+            conn.executemany(
+                'INSERT INTO prices (url, observed_at, price) VALUES (?, ?, ?)',
+                [(url, observed_at, price) for url, title, observed_at, price in rows]
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            self._pending = rows + self._pending
+            raise
+        if self._compacted_at is None or time.time() - self._compacted_at >= self.compact_every:
+            self.compact()
+        return len(rows)
+
+    def compact(self, now: Optional[float] = None) -> int:
+        """Apply the retention policy to stored rows; returns how many were deleted."""
+        now = now or time.time()
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            deleted = conn.execute('DELETE FROM prices WHERE observed_at < ?', (now - self.retention_days * DAY,)).rowcount
+            deleted += conn.execute(_FOLD_TO_DAILY_LOWS, {'cutoff': now - self.raw_days * DAY}).rowcount
+            conn.execute('DELETE FROM products WHERE url NOT IN (SELECT url FROM prices)')
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        self._compacted_at = now
+        return deleted
+
+    def product(self, url: str) -> Optional[Dict]:
+        """Title, first_seen and last_updated of a product, including unflushed rows."""
+        row = self._connection().execute(
+            'SELECT title, first_seen, last_updated FROM products WHERE url = ?', (url,)
+        ).fetchone()
+        info = {'title': row[0], 'first_seen': row[1], 'last_updated': row[2]} if row else None
+        for pending_url, title, observed_at, price in self._pending:
+            if pending_url == url:
+                stamp = datetime.fromtimestamp(observed_at).isoformat()
+                info = info or {'title': title, 'first_seen': stamp}
+                info.update({'title': title or info['title'], 'last_updated': stamp})
+        return info
+
+    def observations(self, url: str, since: Optional[float] = None) -> List[Tuple[float, float]]:
+        """(observed_at, price) pairs for a product, oldest first, including unflushed rows."""
+        query = 'SELECT observed_at, price FROM prices WHERE url = ?'
+        params = [url]
+        if since is not None:
+            query += ' AND observed_at >= ?'
+            params.append(since)
+        rows = self._connection().execute(query + ' ORDER BY observed_at, id', params).fetchall()
+        rows += [(observed_at, price) for pending_url, _, observed_at, price in self._pending
+                 if pending_url == url and (since is None or observed_at >= since)]
+        return rows
+
+    def _migrate_json(self, json_path: Path):
+        """One-time import of the old price_history.json (left in place)."""
+        name = f"json:{json_path.name}"
+        conn = self._conn
+        if conn.execute('SELECT 1 FROM migrations WHERE name = ?', (name,)).fetchone():
+            return
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+        except (OSError, ValueError):
+            history = {}
+        conn.execute('BEGIN IMMEDIATE')
+        for url, entry in history.items():
+            last_updated = entry.get('last_updated') or entry.get('first_seen') or datetime.now().isoformat()
+            conn.execute(_UPSERT_PRODUCT, (url, entry.get('title', ''), entry.get('first_seen') or last_updated, last_updated))
+            # The JSON kept no per-price times; keep their order, stamped at the last update
+            observed_at = datetime.fromisoformat(last_updated).timestamp()
+            conn.executemany(
+                'INSERT INTO prices (url, observed_at, price) VALUES (?, ?, ?)',
+                [(url, observed_at, float(price)) for price in entry.get('prices', [])]
+            )
+        conn.execute('INSERT INTO migrations (name, applied_at) VALUES (?, ?)', (name, datetime.now().isoformat()))
+        conn.execute('COMMIT')
+        if history:
+            print(f"📦 Migrated price history of {len(history)} products to {self.path.name}")
+
+    def close(self):
+        self.flush()
+        _open_stores.discard(self)
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
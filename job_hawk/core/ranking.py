@@ -0,0 +1,143 @@
+import heapq
+import itertools
+import math
+import re
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from .listing_normalizer import as_aware, normalize
+from .matcher import KeywordMatcher
+from .pipeline import RELEVANT_DOMAINS, listing_kind
+
+# Listing score = weighted sum of components in [0, 1]. Each scored listing
+# carries its breakdown under 'score' so a notification can be explained.
+SCORE_WEIGHTS = {'recency': 0.3, 'urgency': 0.2, 'source': 0.15, 'keywords': 0.25, 'discount': 0.1}
+SOURCE_WEIGHTS = {'LinkedIn': 1.0, 'Unstop': 1.0, 'Wellfound': 0.9, 'Internshala': 0.8, 'Cuvette': 0.7}
+DEFAULT_SOURCE_WEIGHT = 0.5
+# Recency halves every RECENCY_HALF_LIFE_DAYS; urgency is 0.5 with URGENCY_DAYS left
+RECENCY_HALF_LIFE_DAYS = 2
+URGENCY_DAYS = 7
+# Distinct relevant keywords for full keyword strength
+KEYWORD_SATURATION = 3
+# Components used when a listing has no posted time / no deadline
+UNKNOWN_RECENCY = 0.5
+UNKNOWN_URGENCY = 0.3
+
+KEYWORD_MATCHER = KeywordMatcher({domain: [domain] for domain in RELEVANT_DOMAINS})
+
+def _days(delta) -> float:
+    return delta.total_seconds() / 86400
+
+def score_listing(listing: Dict, now: Optional[datetime] = None) -> Dict[str, float]:
+    """Score a job/hackathon listing and store the breakdown in listing['score']."""
+    now = as_aware(now or datetime.now())
+    normalize(listing, now)
+    posted_at, deadline_at = listing['posted_at'], listing['deadline_at']
+    components = {
+        'recency': UNKNOWN_RECENCY if posted_at is None else 0.5 ** (max(_days(now - posted_at), 0) / RECENCY_HALF_LIFE_DAYS),
+        'urgency': UNKNOWN_URGENCY if deadline_at is None else (
+            0.0 if deadline_at < now else 1 / (1 + _days(deadline_at - now) / URGENCY_DAYS)
+        ),
+        'source': SOURCE_WEIGHTS.get(listing.get('source', ''), DEFAULT_SOURCE_WEIGHT),
+        'keywords': min(len(KEYWORD_MATCHER.labels(listing.get('title', '') + ' ' + ' '.join(listing.get('tags', [])))) / KEYWORD_SATURATION, 1.0),
+        'discount': min(max(float(listing.get('discount_percent') or 0), 0.0), 100.0) / 100
+    }
+    components['total'] = sum(SCORE_WEIGHTS[name] * components[name] for name in SCORE_WEIGHTS)
+    listing['score'] = components
+    return components
+
+def parse_rating(rating) -> float:
+    """4.3 from '4.3 out of 5 stars' (or a number); 0 when missing."""
+    if isinstance(rating, (int, float)):
+        return float(rating)
+    match = re.search(r'\d+(?:\.\d+)?', rating or '')
+    return float(match.group()) if match else 0.0
+
+def deal_rank(deal: Dict) -> tuple:
+    """Sort key for deals: discount, then numeric rating."""
+    return (deal.get('discount_percent') or 0, parse_rating(deal.get('rating')))
+
+class TopK:
+    """
+    The k highest-scoring items seen so far, in a bounded min-heap: O(log k)
+    per push, so ranking n items costs O(n log k). Equal scores keep the
+    earlier item.
+    """
+    def __init__(self, k: int, key: Optional[Callable] = None):
+        self.k = k
+        self.key = key
+        self._heap = []
+        self._order = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, item, score=None) -> bool:
+        """Offer an item; returns True if it is currently in the top k."""
+        if self.k <= 0:
+            return False
+        score = self.key(item) if score is None else score
+        # Later arrivals compare lower on ties, so they are evicted first
+        entry = (score, -next(self._order), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def extend(self, items):
+        for item in items:
+            self.push(item)
+        return self
+
+    def items(self) -> List:
+        """Best first."""
+        return [item for _, _, item in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
+
+    def take(self, n: int) -> List:
+        """Remove and return the best n items, best first; their slots stay used, so k shrinks by as many."""
+        entries = sorted(self._heap, key=lambda entry: entry[:2], reverse=True)
+        taken, self._heap = entries[:n], entries[n:]
+        heapq.heapify(self._heap)
+        self.k -= len(taken)
+        return [item for _, _, item in taken]
+
+class Ranker:
+    """
+    One TopK per listing kind ('job', 'hackathon'), fed as listings stream in.
+    release() hands out the best listings in installments, so the first ones
+    can be sent before every source has answered.
+    """
+    def __init__(self, limits: Dict[str, int], now: Optional[datetime] = None):
+        self.now = now
+        self.limits = dict(limits)
+        self.heaps = {kind: TopK(k) for kind, k in limits.items()}
+        self.released = {kind: 0 for kind in limits}
+
+    def add(self, listing: Dict) -> float:
+        total = score_listing(listing, self.now)['total']
+        heap = self.heaps.get(listing_kind(listing))
+        if heap is not None:
+            heap.push(listing, total)
+        return total
+
+    def top(self, kind: str) -> List[Dict]:
+        heap = self.heaps.get(kind)
+        return heap.items() if heap else []
+
+    def release(self, fraction: float = 1.0) -> List[Dict]:
+        """
+        Remove and return the best ranked listings so that each kind has
+        released ceil(limit * fraction) in total; 1.0 releases the rest.
+        Later listings only compete for the slots not yet released.
+        """
+        released = []
+        for kind, heap in self.heaps.items():
+            # Rounded so 5 * 0.6 is 3, not 4
+            due = math.ceil(round(self.limits[kind] * min(max(fraction, 0.0), 1.0), 6)) - self.released[kind]
+            if due > 0:
+                taken = heap.take(due)
+                self.released[kind] += len(taken)
+                released.extend(taken)
+        return released
@@ -1,13 +1,17 @@
 import schedule
 import time
-import json
 from datetime import datetime, timedelta
 from pathlib import Path
 from .live_scraper import JobListingScraper
 import os
 from .telegram_exporter import TelegramExporter
+from . import pipeline
+from .message_generator import MessageGenerator
+from .ranking import Ranker
+from .job_store import JobStore
+from utils.browser import get_browser_service
+from utils.trace import tracer
 import google.generativeai as genai
-import asyncio
 
 def list_gemini_models():
     api_key = os.getenv('GEMINI_API_KEY')
@@ -24,129 +28,81 @@ def list_gemini_models():
 
 class JobScheduler:
     def __init__(self):
-        self.scraper = JobListingScraper()
+        self.job_store = JobStore()
+        self.job_store.migrate_json()
+        self.scraper = JobListingScraper(seen_index=self.job_store)
+        # Chromium and the HTTP client stay warm between runs
+        self.browser_service = get_browser_service()
         self.last_run_time = None
         self.keywords = [
             "Frontend Developer", "UI/UX Designer", "Machine Learning", "Product Intern",
             "Software Engineer", "AI", "Research Intern", "Design Intern"
         ]
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        data_dir = os.path.join(base_dir, '..', 'data')
-        os.makedirs(data_dir, exist_ok=True)
-        self.active_jobs = []
-        self.job_file = os.path.join(data_dir, "active_jobs.json")
-        self._load_jobs()
         self.telegram_exporter = TelegramExporter()
-
-    def _load_jobs(self):
-        if os.path.exists(self.job_file):
-            with open(self.job_file, 'r') as f:
-                self.active_jobs = json.load(f)
-        else:
-            self.active_jobs = []
-
-    def _save_jobs(self):
-        with open(self.job_file, 'w') as f:
-            json.dump(self.active_jobs, f, indent=2)
+        self.message_generator = MessageGenerator()
 
     def run_job_hunt(self):
         print(f"🕐 Running job hunt at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         since_time = self.last_run_time or (datetime.now() - timedelta(hours=4))
-        print("[DEBUG] Fetching from all sources...")
-        new_listings = asyncio.run(self.scraper.fetch_all(self.keywords, since_time))
-        print(f"[DEBUG] Total listings fetched: {len(new_listings)}")
-        for src in ['LinkedIn', 'Unstop', 'Internshala', 'Cuvette', 'Wellfound']:
-            count = sum(1 for l in new_listings if l.get('source') == src)
-            print(f"[DEBUG] {src}: {count} listings fetched")
-        # Filter out irrelevant domains (e.g., mechanical, civil, non-tech)
-        relevant_domains = [
-            'software', 'developer', 'design', 'ui', 'ux', 'machine learning', 'ai', 'product', 'research', 'frontend', 'backend', 'intern', 'engineer', 'data', 'python', 'javascript', 'web', 'app', 'cloud', 'fullstack', 'ml', 'dl', 'artificial intelligence', 'computer', 'technology', 'tech', 'product manager', 'product design', 'case competition', 'hackathon', 'sprint'
-        ]
-        def is_relevant(listing):
-            text = (listing.get('title', '') + ' ' + ' '.join(listing.get('tags', []))).lower()
-            return any(domain in text for domain in relevant_domains)
-        filtered = [l for l in new_listings if is_relevant(l)]
-        # Deduplicate by (title, company, posted_time)
-        seen = set()
-        deduped = []
-        for l in filtered:
-            key = (l.get('title', '').strip().lower(), l.get('company', '').strip().lower(), l.get('posted_time', '').strip())
-            if key not in seen:
-                seen.add(key)
-                deduped.append(l)
-        # Only keep listings newer than last run (DISABLED: now include all open applications)
-        # if self.last_run_time:
-        #     def is_new(l):
-        #         pt = l.get('posted_time', '')
-        #         if not pt:
-        #             return True  # If no posted_time, keep
-        #         try:
-        #             from dateutil import parser
-        #             posted_dt = parser.parse(pt)
-        #             return posted_dt > self.last_run_time
-        #         except:
-        #             return True
-        #     deduped = [l for l in deduped if is_new(l)]
-        # Only filter out jobs/internships with a deadline in the past (if available)
-        from dateutil import parser
-        filtered_open = []
-        filtered_closed = []
-        for l in deduped:
-            deadline = l.get('deadline', '')
-            if deadline:
-                try:
-                    deadline_dt = parser.parse(deadline)
-                    if deadline_dt < datetime.now():
-                        filtered_closed.append(l)
-                        continue
-                except Exception as e:
-                    print(f"[DEBUG] Could not parse deadline '{deadline}': {e}")
-            filtered_open.append(l)
-        print(f"[DEBUG] {len(filtered_closed)} listings filtered out due to past deadline.")
-        deduped = filtered_open
-        # Separate hackathons/competitions and jobs/internships
-        hackathon_tags = {'hackathon', 'case competition', 'sprint', 'competition'}
-        hackathons = []
-        jobs = []
-        for l in deduped:
-            tags = set([t.lower() for t in l.get('tags', [])])
-            if tags & hackathon_tags:
-                hackathons.append(l)
-            else:
-                jobs.append(l)
-        # Sort hackathons by soonest deadline (if available)
-        from dateutil import parser
-        def deadline_key(l):
-            try:
-                return parser.parse(l.get('deadline', '2099-12-31'))
-            except:
-                return parser.parse('2099-12-31')
-        hackathons.sort(key=deadline_key)
-        # Sort jobs by most recent posted_time (if available)
-        def posted_key(l):
-            try:
-                return -parser.parse(l.get('posted_time', '1970-01-01')).timestamp()
-            except:
-                return 0
-        jobs.sort(key=posted_key)
-        # Send only the top 5 hackathons (Unstop) and top 5 jobs/internships
-        top_hackathons = [h for h in hackathons if h.get('source') == 'Unstop'][:5]
-        top_jobs = jobs[:5]
-        for h in top_hackathons:
-            msg = self._generate_gemini_message(h, is_hackathon=True) or self._format_job_message(h, is_hackathon=True)
-            self.telegram_exporter._send_message(msg)
-        for job in top_jobs:
-            msg = self._generate_gemini_message(job, is_hackathon=False) or self._format_job_message(job, is_hackathon=False)
-            self.telegram_exporter._send_message(msg)
-        self.active_jobs.extend(deduped)
-        self._save_jobs()
-        print(f"✅ Job hunt complete! {len(deduped)} new relevant jobs found.")
-        for job in deduped[:10]:
+        stats = self.browser_service.run(self._hunt(since_time))
+        expired = self.job_store.expire()
+        tracer.event(
+            'Scheduler', 'hunt finished',
+            failed_sources=[src for src, status in self.scraper.source_status.items() if status['status'] != 'ok'],
+            known=stats['known'], closed=stats['closed'], near_dupes=stats['near_dupes'],
+            expired=expired, active=self.job_store.count()
+        )
+        self.message_generator.save()
+        print(f"✅ Job hunt complete! {stats['kept']} new relevant jobs found.")
+        for job in stats['preview']:
             print(f"- {job['title']} at {job['company']} ({job['source']}) | {job['link']}")
-        if len(deduped) > 10:
-            print(f"...and {len(deduped)-10} more.")
+        if stats['kept'] > len(stats['preview']):
+            print(f"...and {stats['kept'] - len(stats['preview'])} more.")
         self.last_run_time = datetime.now()
 
+    async def _hunt(self, since_time):
+        """
+        Stream listings from all sources through relevance, dedupe, deadline and
+        near-duplicate filters into the store. The best-ranked listings of each
+        kind, including stored ones whose send failed in earlier runs, are
+        notified in installments as sources finish.
+        """
+        stats = {'known': 0, 'closed': 0, 'near_dupes': 0, 'kept': 0, 'preview': []}
+        listings = self.scraper.stream_listings(self.keywords, since_time, pool=self.browser_service.pool)
+        listings = pipeline.unseen(listings, self.job_store, stats)
+        listings = pipeline.relevant(listings)
+        listings = pipeline.normalized(listings)
+        listings = pipeline.dedupe(listings)
+        listings = pipeline.open_only(listings, stats)
+        listings = pipeline.near_unique(listings, self.job_store, stats)
+        ranker = Ranker(pipeline.NOTIFY_LIMITS)
+        for listing in self.job_store.pending():
+            if pipeline.notify_eligible(listing):
+                ranker.add(listing)
+        listings = pipeline.notify(
+            listings, self._send_listing, ranker=ranker, prepare=self._prepare_messages,
+            progress=self.scraper.finished_fraction
+        )
+        async for listing in listings:
+            self.job_store.upsert(listing)
+            stats['kept'] += 1
+            if len(stats['preview']) < 10:
+                stats['preview'].append(listing)
+        return stats
+
+    def _send_listing(self, listing, is_hackathon):
+        # The send may finish before the hunt stores the listing
+        self.job_store.upsert(listing)
+        sent = False
+        try:
+            msg = self._generate_gemini_message(listing, is_hackathon=is_hackathon) or self._format_job_message(listing, is_hackathon=is_hackathon)
+            sent = self.telegram_exporter._send_message(msg)
+        finally:
+            if sent:
+                self.job_store.mark_notified(listing)
+            else:
+                self.job_store.mark_send_failed(listing)
+
     def _format_job_message(self, job, is_hackathon=False):
         msg = ""
         if is_hackathon:
@@ -178,34 +134,28 @@ class JobScheduler:
         msg += f"🌐 *Source:* {job.get('source', '')}"
         return msg
 
+    def _prepare_messages(self, listings):
+        """Start Gemini requests for listings about to be sent; they run concurrently."""
+        self.message_generator.prefetch([(listing, pipeline.listing_kind(listing) == 'hackathon') for listing in listings])
+
     def _generate_gemini_message(self, job, is_hackathon=False):
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            return None
-        try:
-            genai.configure(api_key=api_key)
-            model = genai.GenerativeModel('models/gemini-pro')
-            prompt = "Write a concise, engaging Telegram message for this "
-            prompt += "hackathon/competition" if is_hackathon else "job/internship"
-            prompt += ":\n" + str(job)
-            response = model.generate_content(prompt)
-            print(f"[Gemini] Success: Message generated.")
-            return response.text.strip() if hasattr(response, 'text') else str(response)
-        except Exception as e:
-            print(f"[Gemini] Error: {e}")
-            return None
+        return self.message_generator.generate(job, is_hackathon=is_hackathon)
 
     def start_scheduler(self):
         print("🚀 Starting Job MCP Scheduler...")
         print("⏰ Will run every 3 hours")
         schedule.every(3).hours.do(self.run_job_hunt)
         self.run_job_hunt()
-        while True:
-            schedule.run_pending()
-            time.sleep(60)
+        try:
+            while True:
+                schedule.run_pending()
+                time.sleep(60)
+        finally:
+            self.message_generator.close()
 
 if __name__ == "__main__":
     print("[job_hawk] Running job/internship/competition tracker...")
     list_gemini_models()
     scheduler = JobScheduler()
-    scheduler.run_job_hunt() 
\ No newline at end of file
+    scheduler.run_job_hunt()
+    scheduler.message_generator.close() 
\ No newline at end of file
@@ -1,452 +1,332 @@
 import asyncio
 import re
-from typing import Optional, Dict
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+import time
+from typing import Optional, Dict, List
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from utils.browser import BrowserPool, get_browser_service, pool_or_temporary
+from utils.http_client import get_client
+from utils.latency import domain_of, latency_tracker
+from utils.rate_limiter import get_rate_limiter
+from utils.resource_blocker import resource_stats
+from utils.trace import tracer
+from .structured_data import extract_product
 
-# Supported e-commerce domains
-SUPPORTED_DOMAINS = [
-    'amazon.',
-    'flipkart.',
-    'myntra.',
-    'nykaa.',
-    'ajio.',
-    'nike.'
-]
+PRODUCT_FIELDS = ('title', 'price', 'rating')
 
-def is_supported_url(url: str) -> bool:
-    """Check if the URL belongs to a supported e-commerce site."""
-    return any(domain in url for domain in SUPPORTED_DOMAINS)
+# A product page counts as ready once these fields have rendered. Sites can
+# override this with a 'ready' entry in SITE_SELECTORS.
+READY_FIELDS = ('title', 'price')
 
-async def _scrape_amazon(page) -> Dict[str, Optional[str]]:
-    """Scrape product info from Amazon product page."""
-    try:
-        # Wait for page to load
-        await page.wait_for_load_state('networkidle', timeout=10000)
-        
-        # Try multiple title selectors
-        title = None
-        title_selectors = [
+# Selector cascades per supported domain. For each field the selectors are
+# tried in order and the first non-empty text wins. `profile` names the
+# utils.resource_blocker profile used for the page's context.
+SITE_SELECTORS = {
+    'amazon.': {
+        'name': 'Amazon',
+        'profile': 'amazon_product',
+        'title': [
             '#productTitle',
             'h1.a-size-large',
             'h1.a-size-base-plus',
             'span#productTitle'
-        ]
-        for selector in title_selectors:
-            try:
-                title_el = await page.query_selector(selector)
-                if title_el:
-                    title = await title_el.inner_text()
-                    if title and title.strip():
-                        break
-            except:
-                continue
-        
-        # Try multiple price selectors
-        price = None
-        price_selectors = [
+        ],
+        'price': [
             'span.a-price-whole',
             'span.a-price .a-offscreen',
             '#priceblock_ourprice',
             '#priceblock_dealprice',
             '#priceblock_saleprice',
             'span.a-price.a-text-price.a-size-medium.apexPriceToPay .a-offscreen'
-        ]
-        for selector in price_selectors:
-            try:
-                price_el = await page.query_selector(selector)
-                if price_el:
-                    price = await price_el.inner_text()
-                    if price and price.strip():
-                        break
-            except:
-                continue
-        
-        # Try to get rating
-        rating = None
-        rating_selectors = [
+        ],
+        'rating': [
             'span.a-icon-alt',
             'i.a-icon-star .a-icon-alt',
             'span[data-asin][data-attrid="average-customer-review"] span.a-icon-alt'
         ]
-        for selector in rating_selectors:
-            try:
-                rating_el = await page.query_selector(selector)
-                if rating_el:
-                    rating = await rating_el.inner_text()
-                    if rating and rating.strip():
-                        break
-            except:
-                continue
-        
-        return {
-            'title': title.strip() if title else None,
-            'price': price.strip() if price else None,
-            'rating': rating.strip() if rating else None
-        }
-    except Exception as e:
-        print(f"Amazon scraping error: {e}")
-        return {'title': None, 'price': None, 'rating': None}
-
-async def _scrape_flipkart(page) -> Dict[str, Optional[str]]:
-    """Scrape product info from Flipkart product page."""
-    try:
-        # Wait for page to load
-        await page.wait_for_load_state('networkidle', timeout=10000)
-        
-        # Try multiple title selectors
-        title = None
-        title_selectors = [
+    },
+    'flipkart.': {
+        'name': 'Flipkart',
+        'profile': 'flipkart_product',
+        'title': [
             'span.B_NuCI',
             'h1._2E8Pvb',
             'h1[class*="title"]',
             'span[class*="title"]'
-        ]
-        for selector in title_selectors:
-            try:
-                title_el = await page.query_selector(selector)
-                if title_el:
-                    title = await title_el.inner_text()
-                    if title and title.strip():
-                        break
-            except:
-                continue
-        
-        # Try multiple price selectors
-        price = None
-        price_selectors = [
+        ],
+        'price': [
             'div._30jeq3._16Jk6d',
             'div[class*="price"]',
             'span[class*="price"]',
             'div._1vC4OE._3qQ9m1'
-        ]
-        for selector in price_selectors:
-            try:
-                price_el = await page.query_selector(selector)
-                if price_el:
-                    price = await price_el.inner_text()
-                    if price and price.strip():
-                        break
-            except:
-                continue
-        
-        # Try to get rating
-        rating = None
-        rating_selectors = [
+        ],
+        'rating': [
             'div._3LWZlK',
             'div[class*="rating"]',
             'span[class*="rating"]'
         ]
-        for selector in rating_selectors:
-            try:
-                rating_el = await page.query_selector(selector)
-                if rating_el:
-                    rating = await rating_el.inner_text()
-                    if rating and rating.strip():
-                        break
-            except:
-                continue
-        
-        return {
-            'title': title.strip() if title else None,
-            'price': price.strip() if price else None,
-            'rating': rating.strip() if rating else None
-        }
-    except Exception as e:
-        print(f"Flipkart scraping error: {e}")
-        return {'title': None, 'price': None, 'rating': None}
-
-async def _scrape_myntra(page) -> Dict[str, Optional[str]]:
-    """Scrape product info from Myntra product page."""
-    try:
-        await page.wait_for_load_state('networkidle', timeout=10000)
-        
-        # Try multiple title selectors
-        title = None
-        title_selectors = [
+    },
+    'myntra.': {
+        'name': 'Myntra',
+        'profile': 'myntra_product',
+        'title': [
             'h1.pdp-title',
             'h1[class*="title"]',
             'span[class*="title"]'
-        ]
-        for selector in title_selectors:
-            try:
-                title_el = await page.query_selector(selector)
-                if title_el:
-                    title = await title_el.inner_text()
-                    if title and title.strip():
-                        break
-            except:
-                continue
-        
-        # Try multiple price selectors
-        price = None
-        price_selectors = [
+        ],
+        'price': [
             'span.pdp-price',
             'span.pdp-discounted-price',
             'span[class*="price"]',
             'div[class*="price"]'
-        ]
-        for selector in price_selectors:
-            try:
-                price_el = await page.query_selector(selector)
-                if price_el:
-                    price = await price_el.inner_text()
-                    if price and price.strip():
-                        break
-            except:
-                continue
-        
-        # Try to get rating
-        rating = None
-        rating_selectors = [
+        ],
+        'rating': [
             'div.index-overallRating',
             'span[class*="rating"]',
             'div[class*="rating"]'
         ]
-        for selector in rating_selectors:
-            try:
-                rating_el = await page.query_selector(selector)
-                if rating_el:
-                    rating = await rating_el.inner_text()
-                    if rating and rating.strip():
-                        break
-            except:
-                continue
-        
-        return {
-            'title': title.strip() if title else None,
-            'price': price.strip() if price else None,
-            'rating': rating.strip() if rating else None
-        }
-    except Exception as e:
-        print(f"Myntra scraping error: {e}")
-        return {'title': None, 'price': None, 'rating': None}
-
-async def _scrape_nykaa(page) -> Dict[str, Optional[str]]:
-    """Scrape product info from Nykaa product page."""
-    try:
-        await page.wait_for_load_state('networkidle', timeout=10000)
-        
-        # Try multiple title selectors
-        title = None
-        title_selectors = [
+    },
+    'nykaa.': {
+        'name': 'Nykaa',
+        'profile': 'nykaa_product',
+        'title': [
             'h1[class*="title"]',
             'h1[class*="product"]',
             'span[class*="title"]'
-        ]
-        for selector in title_selectors:
-            try:
-                title_el = await page.query_selector(selector)
-                if title_el:
-                    title = await title_el.inner_text()
-                    if title and title.strip():
-                        break
-            except:
-                continue
-        
-        # Try multiple price selectors
-        price = None
-        price_selectors = [
+        ],
+        'price': [
             'span[class*="price"]',
             'div[class*="price"]',
             'span[class*="discount"]'
-        ]
-        for selector in price_selectors:
-            try:
-                price_el = await page.query_selector(selector)
-                if price_el:
-                    price = await price_el.inner_text()
-                    if price and price.strip():
-                        break
-            except:
-                continue
-        
-        # Try to get rating
-        rating = None
-        rating_selectors = [
+        ],
+        'rating': [
             'span[class*="rating"]',
             'div[class*="rating"]',
             'span[class*="star"]'
         ]
-        for selector in rating_selectors:
-            try:
-                rating_el = await page.query_selector(selector)
-                if rating_el:
-                    rating = await rating_el.inner_text()
-                    if rating and rating.strip():
-                        break
-            except:
-                continue
-        
-        return {
-            'title': title.strip() if title else None,
-            'price': price.strip() if price else None,
-            'rating': rating.strip() if rating else None
-        }
-    except Exception as e:
-        print(f"Nykaa scraping error: {e}")
-        return {'title': None, 'price': None, 'rating': None}
-
-async def _scrape_ajio(page) -> Dict[str, Optional[str]]:
-    """Scrape product info from Ajio product page."""
-    try:
-        await page.wait_for_load_state('networkidle', timeout=10000)
-        
-        # Try multiple title selectors
-        title = None
-        title_selectors = [
+    },
+    'ajio.': {
+        'name': 'Ajio',
+        'profile': 'ajio_product',
+        'title': [
             'h1[class*="title"]',
             'h1[class*="product"]',
             'span[class*="title"]'
-        ]
-        for selector in title_selectors:
-            try:
-                title_el = await page.query_selector(selector)
-                if title_el:
-                    title = await title_el.inner_text()
-                    if title and title.strip():
-                        break
-            except:
-                continue
-        
-        # Try multiple price selectors
-        price = None
-        price_selectors = [
+        ],
+        'price': [
             'span[class*="price"]',
             'div[class*="price"]',
             'span[class*="discount"]'
-        ]
-        for selector in price_selectors:
-            try:
-                price_el = await page.query_selector(selector)
-                if price_el:
-                    price = await price_el.inner_text()
-                    if price and price.strip():
-                        break
-            except:
-                continue
-        
-        # Try to get rating
-        rating = None
-        rating_selectors = [
+        ],
+        'rating': [
             'span[class*="rating"]',
             'div[class*="rating"]',
             'span[class*="star"]'
         ]
-        for selector in rating_selectors:
-            try:
-                rating_el = await page.query_selector(selector)
-                if rating_el:
-                    rating = await rating_el.inner_text()
-                    if rating and rating.strip():
-                        break
-            except:
-                continue
-        
-        return {
-            'title': title.strip() if title else None,
-            'price': price.strip() if price else None,
-            'rating': rating.strip() if rating else None
-        }
-    except Exception as e:
-        print(f"Ajio scraping error: {e}")
-        return {'title': None, 'price': None, 'rating': None}
-
-async def _scrape_nike(page) -> Dict[str, Optional[str]]:
-    """Scrape product info from Nike product page."""
-    try:
-        await page.wait_for_load_state('networkidle', timeout=10000)
-        
-        # Try multiple title selectors
-        title = None
-        title_selectors = [
+    },
+    'nike.': {
+        'name': 'Nike',
+        'profile': 'nike_product',
+        'title': [
             'h1[class*="title"]',
             'h1[class*="product"]',
             'span[class*="title"]'
-        ]
-        for selector in title_selectors:
-            try:
-                title_el = await page.query_selector(selector)
-                if title_el:
-                    title = await title_el.inner_text()
-                    if title and title.strip():
-                        break
-            except:
-                continue
-        
-        # Try multiple price selectors
-        price = None
-        price_selectors = [
+        ],
+        'price': [
             'span[class*="price"]',
             'div[class*="price"]',
             'span[class*="discount"]'
-        ]
-        for selector in price_selectors:
-            try:
-                price_el = await page.query_selector(selector)
-                if price_el:
-                    price = await price_el.inner_text()
-                    if price and price.strip():
-                        break
-            except:
-                continue
-        
-        # Try to get rating
-        rating = None
-        rating_selectors = [
+        ],
+        'rating': [
             'span[class*="rating"]',
             'div[class*="rating"]',
             'span[class*="star"]'
         ]
-        for selector in rating_selectors:
-            try:
-                rating_el = await page.query_selector(selector)
-                if rating_el:
-                    rating = await rating_el.inner_text()
-                    if rating and rating.strip():
-                        break
-            except:
-                continue
-        
-        return {
-            'title': title.strip() if title else None,
-            'price': price.strip() if price else None,
-            'rating': rating.strip() if rating else None
+    }
+}
+
+# Supported e-commerce domains
+SUPPORTED_DOMAINS = list(SITE_SELECTORS)
+
+STATIC_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Language': 'en-IN,en;q=0.9'
+}
+
+# Which tier answered, per domain: {'amazon.in': {'static': 3, 'browser': 1}}
+tier_stats = {}
+
+# Runs inside the page: walks every field's selector cascade and returns the
+# whole record, so extraction costs one CDP round trip per page. Returns null
+# while any of the `required` fields is still missing, which lets the same
+# script drive page.wait_for_function.
+_EXTRACT_SCRIPT = """
+({fields, required}) => {
+    const record = {};
+    for (const [field, selectors] of Object.entries(fields)) {
+        record[field] = null;
+        for (const selector of selectors) {
+            let el = null;
+            try {
+                el = document.querySelector(selector);
+            } catch (e) {
+                continue;
+            }
+            if (!el) continue;
+            const text = (el.innerText || el.textContent || '').trim();
+            if (text) {
+                record[field] = text;
+                break;
+            }
         }
-    except Exception as e:
-        print(f"Nike scraping error: {e}")
-        return {'title': None, 'price': None, 'rating': None}
+    }
+    return required.every((field) => record[field] !== null) ? record : null;
+}
+"""
+
+def is_supported_url(url: str) -> bool:
+    """Check if the URL belongs to a supported e-commerce site."""
+    return any(domain in url for domain in SUPPORTED_DOMAINS)
 
-async def _scrape_product(url: str) -> Dict[str, Optional[str]]:
-    """Dispatch to the correct scraper based on URL."""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context()
-        page = await context.new_page()
+def _site_for_url(url: str) -> Optional[str]:
+    for domain in SUPPORTED_DOMAINS:
+        if domain in url:
+            return domain
+    return None
+
+async def _extract_product(page, site: str, timeout: int = 10000) -> Dict[str, Optional[str]]:
+    """Scrape product info for `site` as soon as its key fields are on the page."""
+    config = SITE_SELECTORS[site]
+    fields = {field: config[field] for field in PRODUCT_FIELDS}
+    try:
         try:
-            await page.goto(url, timeout=20000)
-            if 'amazon.' in url:
-                data = await _scrape_amazon(page)
-            elif 'flipkart.' in url:
-                data = await _scrape_flipkart(page)
-            elif 'myntra.' in url:
-                data = await _scrape_myntra(page)
-            elif 'nykaa.' in url:
-                data = await _scrape_nykaa(page)
-            elif 'ajio.' in url:
-                data = await _scrape_ajio(page)
-            elif 'nike.' in url:
-                data = await _scrape_nike(page)
-            else:
-                raise ValueError('Unsupported URL/domain')
-            data['url'] = url
-            return data
+            handle = await page.wait_for_function(
+                _EXTRACT_SCRIPT,
+                arg={'fields': fields, 'required': list(config.get('ready', READY_FIELDS))},
+                polling=100,
+                timeout=timeout
+            )
+            record = await handle.json_value()
         except PlaywrightTimeoutError:
-            return {'title': None, 'price': None, 'rating': None, 'url': url, 'error': 'Timeout while loading page'}
+            # Not fully rendered in time; keep whatever fields did appear
+            record = await page.evaluate(_EXTRACT_SCRIPT, {'fields': fields, 'required': []})
+        return {field: record.get(field) for field in PRODUCT_FIELDS}
+    except Exception as e:
+        print(f"{config['name']} scraping error: {e}")
+        return {field: None for field in PRODUCT_FIELDS}
+
+async def _scrape_page(page, url: str) -> Dict[str, Optional[str]]:
+    """Dispatch to the correct scraper based on URL, using an already open page."""
+    domain = domain_of(url)
+    try:
+        async with get_rate_limiter().slot(url):
+            # Timed inside the slot and sampled only on success (see live_scraper._open_listing)
+            started = time.monotonic()
+            await page.goto(url, wait_until='domcontentloaded', timeout=latency_tracker.timeout(domain, default=20000))
+            latency_tracker.record(domain, (time.monotonic() - started) * 1000)
+        site = _site_for_url(url)
+        if site is None:
+            raise ValueError('Unsupported URL/domain')
+        data = await _extract_product(page, site, timeout=latency_tracker.timeout(domain))
+        data['url'] = url
+        return data
+    except PlaywrightTimeoutError:
+        return _error_result(url, 'Timeout while loading page')
+    except Exception as e:
+        return _error_result(url, str(e))
+
+async def _scrape_with_pool(pool: BrowserPool, url: str, slots: asyncio.Semaphore) -> Dict[str, Optional[str]]:
+    """Tier 2: render the page in Chromium, holding one of the caller's `slots` and a pool page."""
+    site = _site_for_url(url)
+    if site is None:
+        return _error_result(url, 'Unsupported URL')
+    async with slots:
+        try:
+            async with pool.page(SITE_SELECTORS[site]['profile']) as page:
+                return await _scrape_page(page, url)
         except Exception as e:
-            return {'title': None, 'price': None, 'rating': None, 'url': url, 'error': str(e)}
-        finally:
-            await context.close()
-            await browser.close()
+            return _error_result(url, str(e))
+
+def _error_result(url: str, error: str) -> Dict[str, Optional[str]]:
+    return {'title': None, 'price': None, 'rating': None, 'url': url, 'error': error}
+
+async def _fetch_static(url: str) -> Optional[Dict[str, Optional[str]]]:
+    # The shared client waits for the domain's rate-limit slot itself
+    response = await get_client().get(url, headers=STATIC_HEADERS, timeout=10)
+    if response.status_code != 200:
+        return None
+    return extract_product(response.text)
+
+async def _scrape_static(url: str, slots: asyncio.Semaphore) -> Optional[Dict[str, Optional[str]]]:
+    """Tier 1: plain HTTP GET plus structured data. Returns None when the browser is needed."""
+    if not is_supported_url(url):
+        return None
+    async with slots:
+        try:
+            record = await _fetch_static(url)
+        except Exception:
+            return None
+    if not record or not all(record.get(field) for field in READY_FIELDS):
+        return None
+    record['url'] = url
+    return record
+
+def _record_tier(url: str, tier: str):
+    counters = tier_stats.setdefault(domain_of(url), {'static': 0, 'browser': 0})
+    counters[tier] += 1
+
+def report_tier_stats():
+    """Print which fetch tier answered for each domain (only when tracer.reporting)."""
+    if not tracer.reporting:
+        return
+    for domain, counters in sorted(tier_stats.items()):
+        print(f"📶 {domain}: {counters['static']} static, {counters['browser']} browser")
+
+async def get_products_info_async(urls: List[str], concurrency: int = 4, static_first: bool = True,
+                                  pool: Optional[BrowserPool] = None) -> List[dict]:
+    """
+    Scrape many product URLs, running up to `concurrency` fetches at once.
+    With `static_first`, each URL is first tried with a plain HTTP GET and the
+    page's structured data; only URLs missing title or price go to Chromium,
+    using `pool` if given or a temporary one otherwise. A shared `pool` also
+    caps browser fetches at its own size.
+    Returns one result dict per URL, in the same order as `urls`.
+    """
+    urls = list(urls)
+    if not any(is_supported_url(url) for url in urls):
+        return [_error_result(url, 'Unsupported URL') for url in urls]
+    results = [None] * len(urls)
+    slots = asyncio.Semaphore(max(1, concurrency))
+    if static_first:
+        results = await asyncio.gather(*(_scrape_static(url, slots) for url in urls))
+        for url, result in zip(urls, results):
+            if result is not None:
+                result['tier'] = 'static'
+                _record_tier(url, 'static')
+    misses = [i for i, result in enumerate(results) if result is None]
+    if any(is_supported_url(urls[i]) for i in misses):
+        async with pool_or_temporary(pool, size=concurrency) as pool:
+            scraped = await asyncio.gather(*(_scrape_with_pool(pool, urls[i], slots) for i in misses))
+        for i, result in zip(misses, scraped):
+            if not result.get('error'):
+                result['tier'] = 'browser'
+                _record_tier(urls[i], 'browser')
+            results[i] = result
+        resource_stats.report()
+    else:
+        for i in misses:
+            results[i] = _error_result(urls[i], 'Unsupported URL')
+    report_tier_stats()
+    get_rate_limiter().report()
+    return results
+
+def get_products_info(urls: List[str], concurrency: int = 4) -> List[dict]:
+    """Synchronous wrapper around get_products_info_async, using the warm browser service."""
+    urls = list(urls)
+    service = get_browser_service()
+    try:
+        return service.run(get_products_info_async(urls, concurrency, pool=service.pool))
+    except Exception as e:
+        return [_error_result(url, str(e)) for url in urls]
 
 def get_product_info(url: str) -> dict:
     """
@@ -455,8 +335,5 @@ def get_product_info(url: str) -> dict:
     Handles errors gracefully.
     """
     if not is_supported_url(url):
-        return {'title': None, 'price': None, 'rating': None, 'url': url, 'error': 'Unsupported URL'}
-    try:
-        return asyncio.run(_scrape_product(url))
-    except Exception as e:
-        return {'title': None, 'price': None, 'rating': None, 'url': url, 'error': str(e)} 
\ No newline at end of file
+        return _error_result(url, 'Unsupported URL')
+    return get_products_info([url], concurrency=1)[0]
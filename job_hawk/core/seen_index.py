@@ -0,0 +1,25 @@
+from typing import Dict, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+# Listing identity. Whether a key was seen in an earlier run is answered by
+# JobStore.contains() from jobs.db.
+
+def normalize_link(link: str) -> str:
+    """Listing URL without query, fragment, trailing slash or 'www.' (tracking params vary per fetch)."""
+    parts = urlsplit(link.strip())
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return urlunsplit(('', host, parts.path.rstrip('/'), '', '')).lstrip('/')
+
+def listing_key(listing: Dict) -> Optional[str]:
+    """Stable identity of a listing: its source ID, else its normalized link, else title and company."""
+    source = listing.get('source', '')
+    if listing.get('source_id'):
+        return f"{source}:{listing['source_id']}"
+    if listing.get('link'):
+        return f"{source}:{normalize_link(listing['link'])}"
+    title = listing.get('title', '').strip().lower()
+    if not title:
+        return None
+    return f"{source}:{title}|{listing.get('company', '').strip().lower()}"
@@ -0,0 +1,99 @@
+import html
+import json
+import re
+from typing import Dict, Optional
+
+# Regex scanning is enough here: we only need the JSON-LD blocks and the
+# <meta> tags, and it is far cheaper than building a DOM for the whole page.
+_JSON_LD_RE = re.compile(
+    r'<script[^>]*type\s*=\s*["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+_META_RE = re.compile(r'<meta\s[^>]*>', re.IGNORECASE)
+_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+
+CURRENCY_SYMBOLS = {'INR': '₹', 'USD': '$', 'EUR': '€', 'GBP': '£'}
+
+def _json_ld_blocks(page_html: str):
+    for match in _JSON_LD_RE.finditer(page_html):
+        try:
+            yield json.loads(match.group(1).strip())
+        except ValueError:
+            continue
+
+def _walk_nodes(data):
+    """Yield every JSON-LD object, flattening lists and @graph containers."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _walk_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        if '@graph' in data:
+            yield from _walk_nodes(data['@graph'])
+
+def _has_type(node, type_name) -> bool:
+    node_type = node.get('@type')
+    if isinstance(node_type, list):
+        return type_name in node_type
+    return node_type == type_name
+
+def _meta_tags(page_html: str) -> Dict[str, str]:
+    """Map lowercased property/name/itemprop to content for every <meta> tag."""
+    meta = {}
+    for tag in _META_RE.finditer(page_html):
+        attrs = {name.lower(): html.unescape(double if double is not None else single)
+                 for name, double, single in _ATTR_RE.findall(tag.group(0))}
+        key = attrs.get('property') or attrs.get('name') or attrs.get('itemprop')
+        if key and attrs.get('content'):
+            meta.setdefault(key.lower(), attrs['content'].strip())
+    return meta
+
+def format_price(amount, currency=None) -> Optional[str]:
+    """Render a numeric price the way the page scrapers report it, e.g. '₹1,299'."""
+    try:
+        value = float(str(amount).replace(',', ''))
+    except (TypeError, ValueError):
+        return None
+    symbol = CURRENCY_SYMBOLS.get((currency or 'INR').upper(), f"{currency} ")
+    return f"{symbol}{value:,.0f}"
+
+def _offer_price(offers):
+    """First (price, currency) found in an Offer, AggregateOffer or list of them."""
+    for offer in offers if isinstance(offers, list) else [offers]:
+        if not isinstance(offer, dict):
+            continue
+        price = offer.get('price') or offer.get('lowPrice')
+        if price is None and isinstance(offer.get('priceSpecification'), dict):
+            price = offer['priceSpecification'].get('price')
+        if price is not None:
+            return price, offer.get('priceCurrency')
+    return None, None
+
+def extract_product(page_html: str) -> Dict[str, Optional[str]]:
+    """
+    Read title, price and rating from a product page's JSON-LD Product/Offer
+    blocks, falling back to OpenGraph/product meta tags.
+    Returns a dict: {title, price, rating}; missing fields are None.
+    """
+    record = {'title': None, 'price': None, 'rating': None}
+    for block in _json_ld_blocks(page_html):
+        for node in _walk_nodes(block):
+            if not _has_type(node, 'Product'):
+                continue
+            if not record['title'] and node.get('name'):
+                record['title'] = html.unescape(str(node['name'])).strip()
+            if not record['price'] and node.get('offers'):
+                amount, currency = _offer_price(node['offers'])
+                record['price'] = format_price(amount, currency)
+            rating = node.get('aggregateRating')
+            if not record['rating'] and isinstance(rating, dict) and rating.get('ratingValue') is not None:
+                record['rating'] = f"{rating['ratingValue']} out of {rating.get('bestRating', 5)}"
+    if not record['title'] or not record['price']:
+        meta = _meta_tags(page_html)
+        if not record['title']:
+            record['title'] = meta.get('og:title')
+        if not record['price']:
+            amount = meta.get('product:price:amount') or meta.get('og:price:amount') or meta.get('price')
+            currency = meta.get('product:price:currency') or meta.get('og:price:currency') or meta.get('pricecurrency')
+            record['price'] = format_price(amount, currency) if amount else None
+    return record
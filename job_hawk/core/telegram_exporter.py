@@ -8,8 +8,6 @@ class TelegramExporter:
         load_dotenv()
         self.bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
         self.chat_id = os.getenv("TELEGRAM_CHAT_ID")
-        print(f"[DEBUG] TELEGRAM_BOT_TOKEN: {self.bot_token}")
-        print(f"[DEBUG] TELEGRAM_CHAT_ID: {self.chat_id}")
         self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
     
     def export_decision(self, deal: Dict):
@@ -126,11 +124,11 @@ class TelegramExporter:
         self._send_message(message)
         print(f"Summary sent: {len(deals)} deals")
     
-    def _send_message(self, message: str):
-        """Send message to Telegram."""
+    def _send_message(self, message: str) -> bool:
+        """Send message to Telegram; returns True when it was delivered."""
         if not self.bot_token or not self.chat_id:
             print("Telegram bot token or chat ID not set.")
-            return
+            return False
             
         try:
             url = f"{self.base_url}/sendMessage"
@@ -144,9 +142,12 @@ class TelegramExporter:
             response = requests.post(url, data=data, timeout=10)
             if response.status_code != 200:
                 print(f"Telegram API error: {response.text}")
+                return False
+            return True
                 
         except Exception as e:
             print(f"Failed to send Telegram message: {e}")
+            return False
     
     def send_error(self, error_message: str):
         """Send error message to Telegram."""
@@ -1,5 +1,5 @@
 from apscheduler.schedulers.background import BackgroundScheduler
-from .scraper import get_product_info
+from .scraper import get_product_info, get_products_info
 
 class PriceTracker:
     def __init__(self, watcher):
@@ -12,6 +12,8 @@ class PriceTracker:
         return get_product_info(url)
 
     def check_all_prices(self):
-        for product in self.watcher.get_all_products():
-            info = self.check_price(product['url'])
-            # Here you would log or process the info 
\ No newline at end of file
+        products = self.watcher.get_all_products()
+        infos = get_products_info([product['url'] for product in products])
+        for product, info in zip(products, infos):
+            # Here you would log or process the info
+            pass 
\ No newline at end of file
@@ -42,11 +42,13 @@ def main():
         
         if deals:
             print(f"🎯 Found {len(deals)} live deals for testing")
-            for deal in deals[:5]:  # Test with first 5 deals
-                verdict = decision_engine.decide(deal)
+            # Test with first 5 deals
+            for deal, verdict in zip(deals[:5], decision_engine.decide_many(deals[:5])):
                 deal['verdict'] = verdict
                 telegram_exporter.export_decision(deal)
             
+            decision_engine.flush()
+            
             # Test categorization
             categorized = decision_engine.get_best_deals_by_category(deals)
             print("\n📊 Deals by Category:")
@@ -71,14 +73,11 @@ def main():
             return
         
         # Filter and process good deals
-        good_deals = []
-        for deal in deals:
-            if deal_finder.is_good_deal(deal):
-                # Get detailed product info for real deals
-                detailed_info = get_product_info(deal['url'])
-                if detailed_info.get('title'):
-                    deal.update(detailed_info)
-                good_deals.append(deal)
+        good_deals = [deal for deal in deals if deal_finder.is_good_deal(deal)]
+        # Get detailed product info for all good deals in one browser session
+        for deal, detailed_info in zip(good_deals, get_products_info([deal['url'] for deal in good_deals])):
+            if detailed_info.get('title'):
+                deal.update(detailed_info)
         
         if not good_deals:
             print("No good real deals found.")
@@ -88,13 +87,12 @@ def main():
         # Send real deals to Telegram
         print(f"Found {len(good_deals)} real good deals! Sending to Telegram...")
         
-        for deal in good_deals:
-            # Make decision
-            verdict = decision_engine.decide(deal)
+        for deal, verdict in zip(good_deals, decision_engine.decide_many(good_deals)):
             deal['verdict'] = verdict
             
             # Send to Telegram
             telegram_exporter.export_decision(deal)
+        decision_engine.flush()
         
         # Send summary of real deals
         summary = f"🎯 Found {len(good_deals)} real deals!\n"
@@ -104,10 +102,10 @@ def main():
         telegram_exporter.send_alert(summary)
         print("Real deal hunt complete! Check your Telegram for details.")
 
-def get_product_info(url):
-    """Get detailed product info using existing scraper."""
-    from core.scraper import get_product_info as scrape_product
-    return scrape_product(url)
+def get_products_info(urls):
+    """Get detailed product info for many URLs using the shared-browser scraper."""
+    from core.scraper import get_products_info as scrape_products
+    return scrape_products(urls)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
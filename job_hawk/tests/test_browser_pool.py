@@ -0,0 +1,78 @@
+import asyncio
+
+class FakePage:
+    async def close(self):
+        pass
+
+class FakeContext:
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        pass
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.handlers = []
+
+    def on(self, event, handler):
+        self.handlers.append(handler)
+
+    def is_connected(self):
+        return self.connected
+
+    def crash(self):
+        self.connected = False
+        for handler in self.handlers:
+            handler(self)
+
+    async def close(self):
+        self.connected = False
+
+class FakePlaywright:
+    def __init__(self):
+        self.browsers = []
+        self.chromium = self
+
+    async def start(self):
+        return self
+
+    async def launch(self, headless=True):
+        self.browsers.append(FakeBrowser())
+        return self.browsers[-1]
+
+    async def stop(self):
+        pass
+
+def test_pool_recycles_after_max_pages_and_after_crash(monkeypatch):
+    import utils.browser as browser_module
+    fake = FakePlaywright()
+    monkeypatch.setattr(browser_module, 'async_playwright', lambda: fake)
+    async def fake_new_context(browser, profile='default', **kwargs):
+        return FakeContext()
+    monkeypatch.setattr(browser_module, 'new_context', fake_new_context)
+
+    async def run():
+        async with browser_module.BrowserPool(size=2, max_pages=3, max_rss_mb=None) as pool:
+            async def visit():
+                async with pool.page() as page:
+                    assert isinstance(page, FakePage)
+                    await asyncio.sleep(0)
+            await asyncio.gather(*(visit() for _ in range(3)))
+            assert pool.launches == 1
+            await visit()
+            assert pool.launches == 2
+            fake.browsers[-1].crash()
+            await visit()
+            assert pool.launches == 3
+    asyncio.run(run())
+
+def test_browser_service_runs_on_its_own_loop():
+    from utils.browser import BrowserService
+    service = BrowserService()
+    async def loop_id():
+        return id(asyncio.get_running_loop())
+    first = service.run(loop_id())
+    assert service.run(loop_id()) == first
+    service.close()
@@ -4,4 +4,28 @@ def test_decision_engine():
     info = {"price": "999"}
     verdict = engine.decide(info)
     assert "verdict" in verdict
-    assert "timestamp" in verdict 
\ No newline at end of file
+    assert "timestamp" in verdict 
+
+
+def test_decide_many_matches_decide(tmp_path):
+    from core.decision_engine import DecisionEngine
+    url = 'https://www.amazon.in/dp/B0BATCH'
+    deals = [
+        {'title': 'Gaming Laptop', 'price': '₹45,000', 'discount_percent': 20, 'rating': '4.3 out of 5 stars', 'url': 'https://x.in/1'},
+        {'title': 'Cotton Shirt', 'price': '₹800', 'discount_percent': 10, 'rating': '3.9', 'url': 'https://x.in/2'},
+        {'title': 'Novel', 'price': None, 'discount_percent': 55},
+        {'title': 'Kettle', 'price': '₹1,500', 'discount_percent': 16, 'rating': '', 'url': url},
+        {'title': 'Kettle', 'price': '₹1,400', 'discount_percent': 16, 'rating': '', 'url': url},
+        {'title': 'Kettle', 'price': '₹1,450', 'discount_percent': 16, 'rating': '', 'url': url},
+        {'title': 'Kettle', 'price': '₹1,300', 'discount_percent': 12, 'rating': '', 'url': url},
+        {'title': 'Yoga Mat', 'price': '₹3,000', 'discount_percent': 45, 'rating': 'n/a'},
+    ]
+    scalar = DecisionEngine(history_path=tmp_path / 'scalar.db')
+    batch = DecisionEngine(history_path=tmp_path / 'batch.db')
+    expected = [scalar.decide(deal) for deal in deals]
+    got = batch.decide_many(deals)
+    for verdict in expected + got:
+        verdict.pop('timestamp')
+    assert got == expected
+    assert [v['confidence'] for v in got] == [85, 30, 95, 30, 30, 80, 30, 70]
+    assert got[6]['lowest_90d']
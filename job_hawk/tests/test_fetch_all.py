@@ -0,0 +1,48 @@
+import asyncio
+import time
+
+def test_fetch_all_runs_sources_concurrently_and_reports_status(monkeypatch):
+    import core.live_scraper as live_scraper
+    monkeypatch.setattr(live_scraper, 'SOURCE_TIMEOUTS', {'Unstop': 0.3})
+    monkeypatch.setattr(live_scraper, 'DEFAULT_SOURCE_TIMEOUT', 2)
+    scraper = live_scraper.JobListingScraper()
+
+    def source(name, delay):
+        async def fetch(*args, **kwargs):
+            await asyncio.sleep(delay)
+            return [{'title': name, 'source': name}]
+        return fetch
+
+    async def broken(*args, **kwargs):
+        raise RuntimeError('blocked')
+
+    monkeypatch.setattr(scraper, 'fetch_linkedin_jobs', source('LinkedIn', 0.2))
+    monkeypatch.setattr(scraper, 'fetch_unstop_events_playwright', source('Unstop', 5))
+    monkeypatch.setattr(scraper, 'fetch_internshala_internships', source('Internshala', 0.2))
+    monkeypatch.setattr(scraper, 'fetch_cuvette_roles', broken)
+    monkeypatch.setattr(scraper, 'fetch_wellfound_roles', source('Wellfound', 0.2))
+
+    started = time.monotonic()
+    listings = asyncio.run(scraper.fetch_all(['python'], None))
+    assert time.monotonic() - started < 1
+    assert sorted(l['source'] for l in listings) == ['Internshala', 'LinkedIn', 'Wellfound']
+    assert scraper.source_status['Unstop']['status'] == 'timeout'
+    assert scraper.source_status['Cuvette']['status'] == 'error'
+    assert scraper.source_status['LinkedIn'] == {'status': 'ok', 'count': 1, 'elapsed': scraper.source_status['LinkedIn']['elapsed'], 'error': None}
+
+def test_source_reports_error_only_when_every_keyword_failed():
+    import core.live_scraper as live_scraper
+    scraper = live_scraper.JobListingScraper()
+
+    async def fetch_keyword(keyword):
+        if keyword == 'rust':
+            return [{'title': keyword}]
+        raise ConnectionError(f"{keyword} refused")
+
+    partial = asyncio.run(scraper._fetch_keywords('LinkedIn', ['python', 'rust'], fetch_keyword))
+    assert partial == [{'title': 'rust'}]
+
+    result = asyncio.run(scraper._fetch_source('LinkedIn', scraper._fetch_keywords('LinkedIn', ['python', 'go'], fetch_keyword)))
+    assert result['status'] == 'error'
+    assert result['error'] == 'python refused'
+    assert scraper.source_status['LinkedIn']['status'] == 'error'
@@ -0,0 +1,45 @@
+import pytest
+from utils.html_parser import available_backends, parse_html
+
+LINKEDIN_HTML = '''<ul><li class="result-card jobs-search-results__list-item">
+<a href="https://www.linkedin.com/jobs/view/1"><h3> Python Intern </h3></a>
+<h4>Acme</h4><span class="job-search-card__location">Bengaluru</span>
+<span class="job-search-card__job-insight">Remote</span>
+<time datetime="2024-05-01">1 day ago</time></li></ul>'''
+
+@pytest.mark.parametrize('backend', available_backends())
+def test_linkedin_parser_on_every_backend(backend, monkeypatch):
+    from core.live_scraper import JobListingScraper
+    monkeypatch.setenv('HTML_PARSER_BACKEND', backend)
+    listing = JobListingScraper()._parse_linkedin_jobs(LINKEDIN_HTML, 'python')[0]
+    assert listing['title'] == 'Python Intern'
+    assert listing['company'] == 'Acme'
+    assert listing['location'] == 'Bengaluru'
+    assert listing['work_type'] == 'Remote'
+    assert listing['posted_time'] == '2024-05-01'
+    assert listing['link'] == 'https://www.linkedin.com/jobs/view/1'
+
+@pytest.mark.parametrize('backend', available_backends())
+def test_class_selector_ignores_case(backend):
+    from core.live_scraper import _DEAL_CARD
+    html = '<div class="PRODUCT-tile">a</div><section class="dealCard">b</section><div class="grid">c</div>'
+    assert [node.text() for node in parse_html(html, backend).select(_DEAL_CARD)] == ['a', 'b']
+
+def test_incomplete_backend_fails_on_instantiation():
+    from utils.html_parser import Node
+
+    class Partial(Node):
+        def select(self, selector):
+            return []
+
+    with pytest.raises(TypeError):
+        Partial(None)
+
+@pytest.mark.parametrize('backend', available_backends())
+def test_select_never_matches_the_context_node(backend):
+    from core.live_scraper import _DEAL_CARD, _DEAL_PRICE
+    html = '<div class="product-price-card"><h3>Kettle</h3></div><div class="product"><span class="price">999</span></div>'
+    cards = parse_html(html, backend).select(_DEAL_CARD)
+    assert cards[0].select_one(_DEAL_PRICE) is None
+    assert cards[0].select('div') == []
+    assert cards[1].select_one(_DEAL_PRICE).text() == '999'
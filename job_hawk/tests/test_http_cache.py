@@ -0,0 +1,34 @@
+import asyncio
+import httpx
+
+def test_normalize_url_sorts_query_and_drops_fragment():
+    from utils.http_cache import normalize_url
+    assert normalize_url('HTTPS://WWW.Example.com:443/jobs?b=2&a=1#top') == 'https://www.example.com/jobs?a=1&b=2'
+    assert normalize_url('https://example.com/jobs', {'b': 2, 'a': 1}) == 'https://example.com/jobs?a=1&b=2'
+
+def test_fetch_returns_cached_parse_on_304(tmp_path):
+    from utils.http_cache import ConditionalCache
+    from utils.http_client import HttpClient
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={'ETag': '"v1"'}, content=b'hello')
+
+    async def run():
+        client = HttpClient(transport=httpx.MockTransport(handler))
+        cache = ConditionalCache(tmp_path)
+        parses = []
+        parse = lambda content: parses.append(content) or content.decode().upper()
+        first = await client.fetch('https://example.com/deals', 'Example', parse, cache=cache)
+        second = await client.fetch('https://example.com/deals', 'Example', parse, cache=cache)
+        await client.aclose()
+        return first, second, parses, cache.stats
+
+    first, second, parses, stats = asyncio.run(run())
+    assert first == second == 'HELLO'
+    assert len(parses) == 1
+    assert requests_seen == [None, '"v1"']
+    assert stats == {'Example': {'hits': 1, 'misses': 1}}
@@ -0,0 +1,62 @@
+import json
+from datetime import datetime
+
+def test_job_store_upserts_expires_and_migrates(tmp_path):
+    from core.job_store import JobStore
+    legacy = tmp_path / 'active_jobs.json'
+    job = {'title': 'Python Intern', 'company': 'Acme', 'link': 'https://internshala.com/internship/detail/1', 'source': 'Internshala'}
+    legacy.write_text(json.dumps([job, job]), encoding='utf-8')
+    store = JobStore(tmp_path / 'jobs.db', ttl_days=30)
+    assert len(store.migrate_json(legacy)) == 2
+    assert store.migrate_json(legacy) == []
+    assert store.count() == 1
+    assert store.pending() == []
+
+    hackathon = {'title': 'Hack', 'link': 'https://unstop.com/competitions/hack-9', 'source': 'Unstop', 'source_id': '9', 'deadline': '2024-06-01T23:59:00+05:30'}
+    store.upsert(hackathon, now=datetime(2024, 5, 1))
+    store.upsert({**hackathon, 'title': 'Hack 2.0'}, now=datetime(2024, 5, 2))
+    assert store.count('Unstop') == 1
+    assert store.find_by_link(hackathon['link'])['title'] == 'Hack 2.0'
+
+    # The hackathon's deadline has passed; the undated job was seen within the TTL
+    assert store.expire(now=datetime(2024, 6, 5)) == 1
+    assert store.count() == 1
+    store.close()
+
+def test_job_store_retries_only_failed_sends(tmp_path):
+    from core.job_store import JobStore
+    store = JobStore(tmp_path / 'jobs.db', max_send_attempts=2)
+    job = {'title': 'Python Intern', 'company': 'Acme', 'link': 'https://internshala.com/internship/detail/1', 'source': 'Internshala'}
+    ranked_out = {'title': 'Data Intern', 'company': 'Beta', 'link': 'https://internshala.com/internship/detail/2', 'source': 'Internshala'}
+    closed = {'title': 'Hack', 'link': 'https://unstop.com/competitions/hack-9', 'source': 'Unstop', 'source_id': '9', 'deadline': '2024-06-01T23:59:00+05:30'}
+    for listing in (job, ranked_out, closed):
+        store.upsert(listing, now=datetime(2024, 6, 4))
+    store.mark_send_failed(job)
+    store.mark_send_failed(closed)
+    # The ranker never tried ranked_out, and the closed hackathon is past its deadline
+    pending = store.pending(now=datetime(2024, 6, 5))
+    assert [listing['title'] for listing in pending] == ['Python Intern']
+    assert pending[0]['deadline_at'] is None
+    assert store.mark_notified(job)
+    assert store.pending(now=datetime(2024, 6, 5)) == []
+    # A second failure uses up the attempts
+    store.mark_send_failed(ranked_out)
+    assert len(store.pending(now=datetime(2024, 6, 5))) == 1
+    store.mark_send_failed(ranked_out)
+    assert store.pending(now=datetime(2024, 6, 5)) == []
+    store.close()
+
+def test_job_store_pending_keeps_first_seen_dates(tmp_path):
+    from core.job_store import JobStore
+    from core.listing_normalizer import normalize
+    from core.ranking import score_listing
+    store = JobStore(tmp_path / 'jobs.db')
+    job = {'title': 'Python Intern', 'company': 'Acme', 'link': 'https://internshala.com/internship/detail/1', 'source': 'Internshala', 'posted_time': '1 day ago'}
+    normalize(job, now=datetime(2024, 6, 1))
+    store.upsert(job, now=datetime(2024, 6, 1))
+    store.mark_send_failed(job)
+    pending = store.pending(now=datetime(2024, 6, 21))
+    assert pending[0]['posted_at'] == job['posted_at']
+    # Twenty days old, not re-read as one day old
+    assert score_listing(pending[0], now=datetime(2024, 6, 21))['recency'] < 0.01
+    store.close()
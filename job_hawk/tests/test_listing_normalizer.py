@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta, timezone
+
+def test_parse_when_fast_paths():
+    from core.listing_normalizer import parse_when
+    now = datetime(2025, 3, 10, 12, 0, tzinfo=timezone.utc)
+    assert parse_when('2025-07-30T23:59:00+05:30') == datetime(2025, 7, 30, 18, 29, tzinfo=timezone.utc)
+    assert parse_when('2025-07-30').tzinfo is not None
+    assert parse_when('Posted 2 days ago', field='posted', now=now) == now - timedelta(days=2)
+    assert parse_when('3 weeks', field='posted', now=now) == now - timedelta(weeks=3)
+    assert parse_when('5 days left', now=now) == now + timedelta(days=5)
+    assert parse_when('Just now', field='posted', now=now) == now
+    assert parse_when('Today', field='posted', now=now) == now
+    # A deadline of today is still open until the day ends
+    assert parse_when('Closes today', now=now) == datetime(2025, 3, 10, 23, 59, 59, tzinfo=timezone.utc)
+    assert parse_when('', field='posted') is None
+
+def test_parse_when_caches_formats_and_failures():
+    from core import listing_normalizer
+    from core.listing_normalizer import parse_when
+    assert parse_when("15 Jul' 25", source='Internshala').date().isoformat() == '2025-07-15'
+    assert listing_normalizer._format_cache[('Internshala', 'deadline')] == "%d %b' %y"
+    assert parse_when('Actively hiring') is None
+    assert 'Actively hiring' in listing_normalizer._failures
+
+def test_posted_after_compares_aware_and_naive():
+    from core.live_scraper import _posted_after
+    since = datetime.now() - timedelta(hours=4)
+    # Offset-aware ISO posting times used to be dropped against a naive since_time
+    assert _posted_after({'posted_time': datetime.now(timezone.utc).isoformat()}, since)
+    assert not _posted_after({'posted_time': '3 days ago'}, since)
+    assert _posted_after({'posted_time': 'Actively hiring'}, since)
+    listing = {'posted_time': 'Today', 'deadline': '2001-01-01'}
+    assert _posted_after(listing, since) and listing['deadline_at'].year == 2001
@@ -0,0 +1,29 @@
+def test_keyword_matcher_labels_and_priority():
+    from core.matcher import KeywordMatcher
+    matcher = KeywordMatcher({'electronics': ['phone', 'smartphone'], 'fashion': ['shoes'], 'sports': ['running', 'run']})
+    assert matcher.labels('Running Shoes with Smartphone pocket') == ['electronics', 'fashion', 'sports']
+    assert matcher.first('Running shoes') == 'fashion'
+    assert matcher.first('Kettle', 'general') == 'general'
+    # A shorter keyword inside a longer one at the same position still counts
+    assert KeywordMatcher({'a': ['product manager'], 'b': ['product']}).labels('Product Manager') == ['a', 'b']
+
+def test_keyword_matcher_word_boundary():
+    from core.matcher import KeywordMatcher
+    matcher = KeywordMatcher({'ai': ['ai', 'ml'], 'apps': ['app', 'apple watch']}, word_boundary=True)
+    assert not matcher.search('Maintenance of chairs in HTML')
+    assert matcher.labels('AI/ML intern') == ['ai']
+    assert matcher.labels('Apple Watch band') == ['apps']
+    assert not matcher.search('Apple juice')
+
+def test_matcher_agrees_with_substring_scans():
+    import random
+    from core.decision_engine import CATEGORY_KEYWORDS, DecisionEngine
+    from core.pipeline import RELEVANT_DOMAINS, is_relevant
+    words = [w for table in CATEGORY_KEYWORDS.values() for w in table] + RELEVANT_DOMAINS + ['chair', 'kettle', 'x', 'smart']
+    engine = DecisionEngine.__new__(DecisionEngine)
+    rng = random.Random(7)
+    for _ in range(500):
+        title = ''.join(rng.choice(words) + rng.choice([' ', '', '-']) for _ in range(rng.randint(1, 4)))
+        expected = next((c for c, table in CATEGORY_KEYWORDS.items() if any(w in title for w in table)), 'general')
+        assert engine._determine_category(title) == expected
+        assert is_relevant({'title': title.upper()}) == any(d in title for d in RELEVANT_DOMAINS)
@@ -0,0 +1,79 @@
+import time
+
+def test_message_generator_caches_by_content(tmp_path):
+    from core.message_generator import MessageGenerator
+    calls = []
+
+    def complete(prompt):
+        calls.append(prompt)
+        return f"message {len(calls)}"
+
+    cache = tmp_path / 'messages.json'
+    generator = MessageGenerator(cache_path=cache, complete=complete)
+    listing = {'title': 'ML Intern', 'company': 'Acme', 'posted_time': '2 days ago'}
+    assert generator.generate(listing) == 'message 1'
+    generator.save()
+    # A later run, when the relative posted time has moved on, reuses the text
+    again = MessageGenerator(cache_path=cache, complete=complete)
+    assert again.generate({**listing, 'posted_time': '3 days ago', 'score': {'total': 0.5}}) == 'message 1'
+    assert again.generate(listing, is_hackathon=True) == 'message 2'
+    assert len(calls) == 2
+
+def test_message_generator_runs_concurrently_within_budget(tmp_path):
+    from core.message_generator import MessageGenerator
+
+    def complete(prompt):
+        time.sleep(1.5 if 'Slow' in prompt else 0.3)
+        return 'ok'
+
+    generator = MessageGenerator(cache_path=tmp_path / 'messages.json', complete=complete, max_concurrency=4, budget_seconds=0.8)
+    items = [({'title': f'Role {i}'}, False) for i in range(3)] + [({'title': 'Slow Role'}, False)]
+    started = time.monotonic()
+    assert generator.generate_many(items) == ['ok', 'ok', 'ok', None]
+    assert time.monotonic() - started < 1.2
+
+def test_message_generator_disabled_without_key(tmp_path, monkeypatch):
+    from core.message_generator import MessageGenerator
+    monkeypatch.delenv('GEMINI_API_KEY', raising=False)
+    generator = MessageGenerator(cache_path=tmp_path / 'messages.json')
+    assert not generator.enabled and generator.generate({'title': 'x'}) is None
+
+def test_message_cache_key_ignores_tag_order_and_tracking_params(tmp_path):
+    from core.message_generator import MessageGenerator
+    generator = MessageGenerator(cache_path=tmp_path / 'messages.json', complete=lambda prompt: 'ok')
+    listing = {'title': 'ML Intern', 'company': 'Acme', 'source': 'LinkedIn', 'tags': ['ml', 'python', 'ai'],
+               'link': 'https://www.linkedin.com/jobs/view/42/?trackingId=abc&refId=1'}
+    same = {**listing, 'tags': ['python', 'ai', 'ml'], 'link': 'https://linkedin.com/jobs/view/42?trackingId=xyz', 'score': {'total': 0.4}}
+    assert generator.cache_key(listing) == generator.cache_key(same)
+    assert generator.cache_key(listing) != generator.cache_key({**listing, 'link': 'https://linkedin.com/jobs/view/43'})
+    assert generator.cache_key(listing) != generator.cache_key(listing, is_hackathon=True)
+
+def test_message_generator_close_cancels_queued_requests(tmp_path):
+    from core.message_generator import MessageGenerator
+
+    def complete(prompt):
+        time.sleep(0.3)
+        return 'ok'
+
+    generator = MessageGenerator(cache_path=tmp_path / 'messages.json', complete=complete, max_concurrency=1)
+    assert generator.prefetch([({'title': f'Role {i}'}, False) for i in range(3)]) == 3
+    generator.close()
+    futures = list(generator._inflight.values())
+    assert sum(future.cancelled() for future in futures) == 2
+
+def test_generate_waits_from_its_own_call_and_survives_pruned_requests(tmp_path):
+    import time
+    from core.message_generator import MessageGenerator
+    generator = MessageGenerator(cache_path=tmp_path / 'messages.json', complete=lambda prompt: time.sleep(0.6) or 'ok', budget_seconds=0.5)
+    job = {'title': 'Python Intern', 'company': 'Acme', 'source': 'LinkedIn'}
+    # Prefetched 0.3s earlier; the 0.5s wait starts at the call, so the answer at 0.6s arrives in time
+    generator.prefetch([(job, False)])
+    time.sleep(0.3)
+    assert generator.generate(job) == 'ok'
+
+    other = {'title': 'Data Intern', 'company': 'Beta', 'source': 'LinkedIn'}
+    key = generator.cache_key(other)
+    # Finished and pruned between generate()'s cache check and its prefetch()
+    generator.prefetch = lambda items: generator.cache.update({key: {'text': 'late', 'created': '2099-01-01'}})
+    assert generator.generate(other) == 'late'
+    generator.close()
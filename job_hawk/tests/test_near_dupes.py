@@ -0,0 +1,46 @@
+def _match(a, b):
+    from core.near_dupes import listing_signature, same_role
+    (company, title, location), (other_company, other_title, other_location) = listing_signature(a), listing_signature(b)
+    return company == other_company and same_role(title, location, other_title, other_location)
+
+def test_signatures_match_reposts_of_the_same_role():
+    from core.near_dupes import listing_signature
+    linkedin = {'title': 'Sr. Frontend Dev (React)', 'company': 'Zomato Pvt Ltd', 'location': 'Gurgaon'}
+    wellfound = {'title': 'Senior Frontend Developer - React', 'company': 'Zomato', 'location': 'Gurugram, India'}
+    assert _match(linkedin, wellfound)
+    intern = {'title': 'Data Science Intern', 'company': 'Acme', 'location': 'Bengaluru'}
+    assert _match(intern, {'title': 'Data Science Internship', 'company': 'Acme Technologies', 'location': 'Bengaluru, Karnataka'})
+    assert _match(intern, {'title': 'Data Science Intern', 'company': 'Acme'})
+    assert listing_signature({'title': ''}) is None
+    assert listing_signature({'title': 'Data Science Intern'}) is None
+
+def test_signatures_keep_different_roles_apart():
+    # Different roles at the same company and place
+    assert not _match({'title': 'DevOps Engineer', 'company': 'Razorpay', 'location': 'Remote'},
+                      {'title': 'Business Analyst', 'company': 'Razorpay', 'location': 'Remote'})
+    assert not _match({'title': 'Research Intern', 'company': 'Acme', 'location': 'Mumbai'},
+                      {'title': 'Marketing Intern', 'company': 'Acme', 'location': 'Mumbai'})
+    assert not _match({'title': 'Senior Frontend Developer', 'company': 'Zomato', 'location': 'Gurgaon'},
+                      {'title': 'Senior Backend Developer', 'company': 'Zomato', 'location': 'Gurgaon'})
+    # Same role elsewhere, or at another company
+    assert not _match({'title': 'Data Science Intern', 'company': 'Acme', 'location': 'Mumbai'},
+                      {'title': 'Data Science Intern', 'company': 'Acme', 'location': 'Pune'})
+    assert not _match({'title': 'Senior Frontend Developer', 'company': 'Zomato', 'location': 'Gurgaon'},
+                      {'title': 'Senior Frontend Developer', 'company': 'Swiggy', 'location': 'Gurgaon'})
+
+def test_job_store_finds_near_duplicates_across_runs(tmp_path):
+    from core.job_store import JobStore
+    db = tmp_path / 'jobs.db'
+    original = {'title': 'Software Engineer Intern', 'company': 'Razorpay', 'location': 'Bengaluru', 'source': 'LinkedIn', 'link': 'https://linkedin.com/jobs/view/1'}
+    JobStore(db).upsert(original)
+    store = JobStore(db)
+    repost = {'title': 'Software Engineer - Internship', 'company': 'Razorpay Pvt Ltd', 'location': 'Bangalore, Karnataka', 'source': 'Wellfound', 'link': 'https://wellfound.com/jobs/2'}
+    assert store.near_duplicate(repost) == 'LinkedIn:linkedin.com/jobs/view/1'
+    # Refreshing the same listing is not a duplicate of itself
+    assert store.near_duplicate(original) is None
+    other = {'title': 'Data Scientist', 'company': 'Razorpay', 'location': 'Bengaluru', 'source': 'Cuvette', 'link': 'https://cuvette.tech/job/3'}
+    assert store.near_duplicate(other) is None
+    # ...but it claimed its signature, so a copy later in the run is caught
+    assert store.near_duplicate({**other, 'source': 'Internshala', 'link': 'https://internshala.com/4'}) == 'Cuvette:cuvette.tech/job/3'
+    analyst = {'title': 'Business Analyst', 'company': 'Razorpay', 'location': 'Bengaluru', 'source': 'LinkedIn', 'link': 'https://linkedin.com/jobs/view/5'}
+    assert store.near_duplicate(analyst) is None
@@ -0,0 +1,30 @@
+import asyncio
+import time
+
+def test_pipeline_notifies_before_slow_sources_finish():
+    from core import pipeline
+    sent = []
+    started = time.monotonic()
+
+    async def listings():
+        yield {'title': 'Python Intern', 'company': 'Acme', 'tags': ['python'], 'source': 'LinkedIn'}
+        yield {'title': 'Python Intern', 'company': 'Acme', 'tags': ['python'], 'source': 'LinkedIn'}
+        yield {'title': 'Site Supervisor', 'company': 'Build', 'tags': ['civil'], 'source': 'LinkedIn'}
+        yield {'title': 'Old Hackathon', 'tags': ['hackathon'], 'deadline': '2001-01-01', 'source': 'Unstop'}
+        await asyncio.sleep(0.5)
+        for i in range(7):
+            yield {'title': f'Hackathon {i}', 'tags': ['hackathon'], 'source': 'Unstop'}
+
+    def send(listing, is_hackathon):
+        sent.append((listing['title'], is_hackathon, time.monotonic() - started))
+
+    async def run():
+        stats = {}
+        stream = pipeline.notify(pipeline.open_only(pipeline.dedupe(pipeline.relevant(listings())), stats), send)
+        return [listing['title'] async for listing in stream], stats
+
+    kept, stats = asyncio.run(run())
+    assert kept[0] == 'Python Intern' and len(kept) == 8
+    assert stats == {'closed': 1}
+    assert sent[0][:2] == ('Python Intern', False) and sent[0][2] < 0.4
+    assert [title for title, is_hackathon, _ in sent if is_hackathon] == [f'Hackathon {i}' for i in range(5)]
@@ -0,0 +1,66 @@
+def test_price_series_rolling_stats():
+    from core.price_series import DAY, PriceSeries
+    series = PriceSeries.from_observations([(0, 100), (DAY, 80), (2 * DAY, 120), (40 * DAY, 90)])
+    assert (series.min, series.max) == (80, 120)
+    assert series.low(90) == 80
+    # The 80 is 39 days old by now, outside the 30-day window
+    assert series.low(30) == 90
+    assert series.is_lowest(30) and not series.is_lowest(90)
+    assert series.is_lowest(90, price=75)
+    assert series.volatility > 0
+    assert 80 < series.ema < 120
+
+def test_price_series_downsamples_old_points():
+    from core.price_series import DAY, PriceSeries
+    series = PriceSeries(raw_days=2, retention_days=10, compact_every=8)
+    # Four observations a day for eight days
+    for i in range(32):
+        series.append(i * DAY / 4, 100 + (i % 4))
+    assert len(series) < 32
+    # Old days keep their low, recent points stay raw
+    assert list(series.prices[:3]) == [100, 100, 100]
+    assert list(series.times) == sorted(series.times)
+    assert series.min == 100 and series.low(90) == 100
+
+def test_decision_engine_uses_series(tmp_path):
+    from core.decision_engine import DecisionEngine
+    engine = DecisionEngine(history_path=tmp_path / 'prices.db')
+    url = 'https://www.amazon.in/dp/B0SERIES'
+    for price in ('₹1,200', '₹1,100', '₹1,150'):
+        engine.decide({'title': 'Kettle', 'price': price, 'url': url, 'discount_percent': 10})
+    result = engine.decide({'title': 'Kettle', 'price': '₹1,000', 'url': url, 'discount_percent': 10})
+    assert result['lowest_90d']
+    history = engine.get_price_history(url)
+    assert history['prices'] == [1200, 1100, 1150, 1000]
+    assert history['low_90d'] == 1000
+
+def test_decision_engine_bounds_cached_histories(tmp_path):
+    from core.decision_engine import DecisionEngine
+    engine = DecisionEngine(history_path=tmp_path / 'prices.db', max_cached_products=2)
+    urls = [f'https://www.amazon.in/dp/B0LRU{i}' for i in range(3)]
+    for url in urls:
+        engine.decide({'title': 'Kettle', 'price': '₹1,200', 'url': url})
+    assert list(engine.price_history) == urls[1:]
+    engine.flush()
+    # An evicted product is read back from the store
+    assert engine.get_price_history(urls[0])['prices'] == [1200]
+    assert list(engine.price_history) == [urls[2], urls[0]]
+
+def test_price_series_min_max_follow_retention():
+    from core.price_series import DAY, PriceSeries
+    series = PriceSeries.from_observations([(0, 50), (DAY, 500), (5 * DAY, 200), (12 * DAY, 250)], retention_days=10)
+    # The 50 and the 500 are past the 10-day retention by the last observation
+    assert (series.min, series.max) == (200, 250)
+
+def test_decision_engine_caches_unknown_products(tmp_path):
+    from core.decision_engine import DecisionEngine
+    engine = DecisionEngine(history_path=tmp_path / 'prices.db')
+    lookups = []
+    product = engine.price_store.product
+    engine.price_store.product = lambda url: lookups.append(url) or product(url)
+    url = 'https://www.amazon.in/dp/B0NONE'
+    assert engine.get_price_history(url) == {}
+    assert engine.get_price_history(url) == {}
+    assert lookups == [url]
+    engine.decide({'title': 'Kettle', 'price': '₹1,200', 'url': url})
+    assert engine.get_price_history(url)['prices'] == [1200]
@@ -0,0 +1,56 @@
+import json
+
+def test_decision_engine_writes_price_history_behind(tmp_path):
+    from core.decision_engine import DecisionEngine
+    from core.price_store import PriceStore
+    db = tmp_path / 'prices.db'
+    engine = DecisionEngine(history_path=db)
+    engine.price_store.flush_every = 3
+    url = 'https://www.amazon.in/dp/B0TEST'
+    engine.decide({'title': 'Phone', 'price': '₹1,000', 'url': url})
+    engine.decide({'title': 'Phone', 'price': '₹900', 'url': url})
+    # Nothing written yet, but the engine already sees both prices
+    assert PriceStore(db, legacy_json=None).observations(url) == []
+    assert engine.decide({'title': 'Phone', 'price': '₹800', 'url': url})['price_trend'] == 'decreasing'
+    assert [price for _, price in PriceStore(db, legacy_json=None).observations(url)] == [1000, 900, 800]
+
+def test_price_store_migrates_legacy_json(tmp_path):
+    from core.price_store import PriceStore
+    legacy = tmp_path / 'price_history.json'
+    legacy.write_text(json.dumps({'https://x.in/p/1': {
+        'title': 'Kettle', 'prices': [1500.0, 1400.0], 'first_seen': '2024-01-01T10:00:00', 'last_updated': '2024-02-01T10:00:00'
+    }}), encoding='utf-8')
+    store = PriceStore(tmp_path / 'prices.db', legacy_json=legacy)
+    assert [price for _, price in store.observations('https://x.in/p/1')] == [1500.0, 1400.0]
+    assert store.product('https://x.in/p/1')['first_seen'] == '2024-01-01T10:00:00'
+    store.close()
+    assert len(PriceStore(tmp_path / 'prices.db', legacy_json=legacy).observations('https://x.in/p/1')) == 2
+
+def test_price_store_downsamples_and_trims_stored_rows(tmp_path):
+    import gc
+    import time
+    from core import price_store
+    from core.price_series import DAY
+    now = time.time()
+    store = price_store.PriceStore(tmp_path / 'prices.db', legacy_json=None)
+    url = 'https://x.in/p/1'
+    day = (now - 40 * DAY) // DAY * DAY
+    for observed_at, price in [(now - 800 * DAY, 100.0), (day + 3600, 500.0), (day + 7200, 450.0), (day + 10800, 480.0), (now - DAY, 300.0), (now - DAY + 60, 310.0)]:
+        store.append(url, price, 'Kettle', observed_at=observed_at)
+    # The first flush of a store compacts
+    store.flush()
+    # Past retention gone, the 40-day-old day folded to its low, recent rows kept raw
+    assert store.observations(url) == [(day + 7200, 450.0), (now - DAY, 300.0), (now - DAY + 60, 310.0)]
+    assert store.compact() == 0
+    store.close()
+
+    # Only stores holding buffered rows are kept for the exit flush, and only weakly
+    with price_store.PriceStore(tmp_path / 'prices.db', legacy_json=None) as store:
+        store.append(url, 290.0, 'Kettle')
+        assert store in price_store._open_stores
+    assert store not in price_store._open_stores
+    store = price_store.PriceStore(tmp_path / 'prices.db', legacy_json=None)
+    store.append(url, 280.0, 'Kettle')
+    del store
+    gc.collect()
+    assert len(price_store._open_stores) == 0
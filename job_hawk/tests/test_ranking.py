@@ -0,0 +1,84 @@
+import asyncio
+from datetime import datetime, timedelta
+
+def test_topk_keeps_best_and_earliest_on_ties():
+    from core.ranking import TopK
+    top = TopK(3)
+    for i, score in enumerate([5, 1, 9, 5, 7, 5]):
+        top.push(f'item{i}', score)
+    assert top.items() == ['item2', 'item4', 'item0']
+    assert len(top) == 3 and not top.push('low', 0)
+
+def test_deal_rank_handles_string_ratings():
+    from core.ranking import TopK, deal_rank
+    deals = [
+        {'title': 'a', 'discount_percent': 40, 'rating': '4.1 out of 5 stars'},
+        {'title': 'b', 'discount_percent': 40, 'rating': '4.6 out of 5 stars'},
+        {'title': 'c', 'discount_percent': 60},
+        {'title': 'd', 'discount_percent': 10, 'rating': 4.9},
+    ]
+    assert [d['title'] for d in TopK(3, key=deal_rank).extend(deals).items()] == ['c', 'b', 'a']
+
+def test_notify_sends_ranked_top_listings():
+    from core import pipeline
+    from core.ranking import Ranker
+    now = datetime.now()
+    sent = []
+
+    async def listings():
+        yield {'title': 'Python Developer Intern', 'source': 'Cuvette', 'posted_time': (now - timedelta(days=6)).isoformat()}
+        yield {'title': 'Backend Python Developer', 'source': 'LinkedIn', 'posted_time': now.isoformat()}
+        yield {'title': 'Data Intern', 'source': 'Internshala', 'posted_time': '1 day ago'}
+        yield {'title': 'AI Hackathon', 'tags': ['hackathon'], 'source': 'Unstop', 'deadline': (now + timedelta(days=2)).isoformat()}
+        yield {'title': 'Web Hackathon', 'tags': ['hackathon'], 'source': 'Devfolio'}
+
+    async def run():
+        stream = pipeline.notify(listings(), lambda listing, is_hackathon: sent.append(listing['title']), ranker=Ranker({'job': 2, 'hackathon': 1}, now=now))
+        return [listing async for listing in stream]
+
+    kept = asyncio.run(run())
+    assert len(kept) == 5
+    assert sent == ['Backend Python Developer', 'Data Intern', 'AI Hackathon']
+    assert kept[1]['score']['total'] > kept[0]['score']['total'] and 0 < kept[1]['score']['recency'] <= 1
+
+def test_ranker_releases_best_listings_in_installments():
+    from core.ranking import Ranker
+    now = datetime.now()
+    ranker = Ranker({'job': 5}, now=now)
+    for days in (3, 1, 5):
+        ranker.add({'title': f'Python Intern {days}', 'source': 'LinkedIn', 'posted_time': (now - timedelta(days=days)).isoformat()})
+    assert [l['title'] for l in ranker.release(0.2)] == ['Python Intern 1']
+    assert ranker.release(0.2) == []
+    assert [l['title'] for l in ranker.release(0.6)] == ['Python Intern 3', 'Python Intern 5']
+    # Only the two unreleased slots remain
+    for days in range(3):
+        ranker.add({'title': f'Fresh Python Intern {days}', 'source': 'LinkedIn', 'posted_time': (now - timedelta(hours=days)).isoformat()})
+    assert [l['title'] for l in ranker.release()] == ['Fresh Python Intern 0', 'Fresh Python Intern 1']
+    assert ranker.released == {'job': 5}
+
+def test_notify_releases_ranked_listings_as_sources_finish():
+    import time
+    from core import pipeline
+    from core.ranking import Ranker
+    now = datetime.now()
+    sources = {'done': 0}
+    sent = []
+    started = time.monotonic()
+
+    async def listings():
+        yield {'title': 'Python Developer Intern', 'source': 'LinkedIn', 'posted_time': now.isoformat()}
+        sources['done'] = 1
+        await asyncio.sleep(0.3)
+        yield {'title': 'Data Intern', 'source': 'Internshala', 'posted_time': now.isoformat()}
+        sources['done'] = 2
+
+    async def run():
+        stream = pipeline.notify(
+            listings(), lambda listing, is_hackathon: sent.append((listing['title'], time.monotonic() - started)),
+            ranker=Ranker({'job': 2}, now=now), progress=lambda: sources['done'] / 2, flush_every=0.05
+        )
+        return [listing async for listing in stream]
+
+    asyncio.run(run())
+    assert [title for title, _ in sent] == ['Python Developer Intern', 'Data Intern']
+    assert sent[0][1] < 0.25
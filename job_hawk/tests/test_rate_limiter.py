@@ -0,0 +1,39 @@
+import asyncio
+
+def test_rate_limiter_caps_in_flight_and_shares_slots_fairly():
+    from utils.rate_limiter import RateLimiter
+    limiter = RateLimiter(limits={'slow.com': {'rate': 1000, 'burst': 10, 'max_in_flight': 1}}, max_in_flight=2)
+    order = []
+    peak = {'slow.com': 0}
+
+    async def fetch(url):
+        async with limiter.slot(url):
+            order.append(limiter.key_for(url))
+            if limiter.key_for(url) == 'slow.com':
+                peak['slow.com'] = max(peak['slow.com'], limiter._buckets['slow.com']['in_flight'])
+            await asyncio.sleep(0.01)
+
+    async def run():
+        urls = [f'https://www.slow.com/{i}' for i in range(4)] + [f'https://fast.org/{i}' for i in range(4)]
+        await asyncio.gather(*(fetch(url) for url in urls))
+
+    asyncio.run(run())
+    assert peak['slow.com'] == 1
+    # The fast domain is not stuck behind the slow one's backlog
+    assert order[:2] == ['slow.com', 'fast.org']
+    assert limiter.wait_stats()['slow.com']['requests'] == 4
+
+def test_rate_limiter_spaces_requests_by_rate():
+    from utils.rate_limiter import RateLimiter
+    limiter = RateLimiter(limits={'example.com': {'rate': 20, 'burst': 1, 'max_in_flight': 4}})
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for _ in range(3):
+            async with limiter.slot('https://example.com/'):
+                pass
+        return loop.time() - started
+
+    assert asyncio.run(run()) >= 0.09
+    assert limiter.key_for('https://in.linkedin.com/jobs') == 'linkedin.com'
@@ -0,0 +1,52 @@
+def test_job_store_knows_stored_and_signed_listings_across_tracking_params(tmp_path):
+    from core.job_store import JobStore
+    store = JobStore(tmp_path / 'jobs.db')
+    job = {'source': 'LinkedIn', 'title': 'Python Intern', 'company': 'Acme', 'link': 'https://in.linkedin.com/jobs/view/python-intern-123?trk=abc&refId=1'}
+    signed = {'source': 'Internshala', 'title': 'Data Intern', 'company': 'Beta', 'source_id': '7'}
+    store.upsert(job)
+    assert store.near_duplicate(signed) is None
+    store.close()
+    reopened = JobStore(tmp_path / 'jobs.db')
+    assert reopened.contains({'source': 'LinkedIn', 'link': 'https://in.linkedin.com/jobs/view/python-intern-123/?refId=2'})
+    assert reopened.contains({'source': 'Internshala', 'source_id': '7'})
+    assert not reopened.contains({'source': 'LinkedIn', 'link': 'https://in.linkedin.com/jobs/view/python-intern-456'})
+    assert not reopened.contains({'source': 'Unstop'})
+    reopened.close()
+
+def test_linkedin_stops_at_known_jobs_after_a_cached_fetch(tmp_path, monkeypatch):
+    import asyncio
+    import httpx
+    from core.live_scraper import JobListingScraper
+    from core.job_store import JobStore
+    from utils import http_client
+    from utils.http_cache import ConditionalCache
+    cards = ''.join(
+        f'<li class="jobs-search-results__list-item"><a href="https://www.linkedin.com/jobs/view/{i}"><h3>Job {i}</h3></a></li>'
+        for i in range(10)
+    )
+
+    def handler(request):
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={'ETag': '"v1"'}, text=f'<ul>{cards}</ul>')
+
+    monkeypatch.setattr(http_client, 'http_cache', ConditionalCache(tmp_path / 'cache'))
+    store = JobStore(tmp_path / 'jobs.db')
+    scraper = JobListingScraper(seen_index=store)
+
+    async def run():
+        client = http_client._clients[asyncio.get_running_loop()] = http_client.HttpClient(transport=httpx.MockTransport(handler))
+        try:
+            first = await scraper.fetch_linkedin_jobs(['python'], None)
+            for i in range(2, 10):
+                store.upsert({'source': 'LinkedIn', 'title': f'Job {i}', 'link': f'https://www.linkedin.com/jobs/view/{i}'})
+            # Served from the cache, but filtered against the store as it is now
+            second = await scraper.fetch_linkedin_jobs(['python'], None)
+            return first, second
+        finally:
+            await client.aclose()
+            store.close()
+
+    first, second = asyncio.run(run())
+    assert len(first) == 10
+    assert [listing['title'] for listing in second] == ['Job 0', 'Job 1']
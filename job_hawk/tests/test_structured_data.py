@@ -0,0 +1,19 @@
+def test_extract_product_from_json_ld():
+    from core.structured_data import extract_product
+    html = '''<html><head><script type="application/ld+json">
+    {"@context": "https://schema.org", "@graph": [{"@type": "Product", "name": "Boat Airdopes 141",
+     "offers": {"@type": "Offer", "price": "1299.00", "priceCurrency": "INR"},
+     "aggregateRating": {"ratingValue": 4.1, "bestRating": 5}}]}
+    </script></head></html>'''
+    result = extract_product(html)
+    assert result == {'title': 'Boat Airdopes 141', 'price': '₹1,299', 'rating': '4.1 out of 5'}
+
+def test_extract_product_from_meta_tags():
+    from core.structured_data import extract_product
+    html = '''<meta property="og:title" content="Nike Air Max &amp; More">
+    <meta property="product:price:amount" content="7995">
+    <meta property="product:price:currency" content="INR">'''
+    result = extract_product(html)
+    assert result['title'] == 'Nike Air Max & More'
+    assert result['price'] == '₹7,995'
+    assert result['rating'] is None
@@ -0,0 +1,35 @@
+import json
+
+def test_tracer_is_silent_when_disabled(tmp_path):
+    from utils.trace import Tracer
+    tracer = Tracer(enabled=False, directory=tmp_path)
+    tracer.page('LinkedIn', 'https://example.com', b'<html></html>')
+    tracer.event('LinkedIn', 'card parse error', error=ValueError('x'))
+    assert tracer.failure('LinkedIn', 'boom') == []
+    assert list(tmp_path.iterdir()) == []
+
+def test_tracer_keeps_a_bounded_buffer_and_dumps_on_failure(tmp_path):
+    from utils.trace import Tracer
+    tracer = Tracer(enabled=True, max_pages=2, directory=tmp_path)
+    for i in range(3):
+        tracer.page('Cuvette', f'https://example.com/{i}', f'<p>{i}</p>'.encode())
+    [path] = tracer.failure('Cuvette', TimeoutError('no response'))
+    dump = json.loads(path.read_text(encoding='utf-8'))
+    assert dump['reason'] == 'no response'
+    assert [page['url'] for page in dump['pages']] == ['https://example.com/1', 'https://example.com/2']
+    assert dump['pages'][1]['content'] == '<p>2</p>'
+    assert dump['events'][-1]['message'] == 'failure'
+
+def test_counter_reports_print_only_when_tracing_or_verbose(tmp_path, monkeypatch, capsys):
+    from utils import trace
+    from utils.http_cache import ConditionalCache
+    cache = ConditionalCache(tmp_path)
+    monkeypatch.setattr(trace.tracer, 'enabled', False)
+    monkeypatch.setattr(trace.tracer, 'verbose', False)
+    cache.record('LinkedIn', hit=True)
+    cache.report()
+    assert capsys.readouterr().out == '' and cache.stats == {}
+    monkeypatch.setattr(trace.tracer, 'verbose', True)
+    cache.record('LinkedIn', hit=True)
+    cache.report()
+    assert 'LinkedIn: 1 cache hits' in capsys.readouterr().out
@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+
+def test_unstop_card_listing_rebuilds_link_and_deadline():
+    from core.live_scraper import _deadline_from_time_left, _unstop_card_listing
+    record = {
+        'id': 'i_1526661_1',
+        'title': ' Business Case Study Presentation Challenge ',
+        'organizer': 'Textify AI',
+        'stats': '52 Registered\n10   days left'
+    }
+    listing = _unstop_card_listing(record)
+    assert listing['link'] == 'https://unstop.com/competitions/business-case-study-presentation-challenge-textify-ai-1526661'
+    assert listing['company'] == 'Textify AI'
+    deadline = datetime.fromisoformat(listing['deadline'])
+    assert abs(deadline - datetime.now().astimezone() - timedelta(days=10)) < timedelta(minutes=1)
+    now = datetime(2024, 5, 30, 10, 0).astimezone()
+    assert datetime.fromisoformat(_deadline_from_time_left('2 days left', now=now)) == now + timedelta(days=2)
+    # Hours left keep the time of day, so the listing is still open
+    assert datetime.fromisoformat(_deadline_from_time_left('5 hours left', now=now)) == now + timedelta(hours=5)
+    assert _deadline_from_time_left('10,023 Registered') == ''
+
+def test_unstop_api_listing_reads_deadline_and_organizer():
+    from core.live_scraper import _unstop_api_items, _unstop_api_listing
+    payload = {'data': {'current_page': 2, 'data': [{
+        'id': 1525596,
+        'title': 'Threaded Futures: A Phulkari Revival Case',
+        'type': 'competitions',
+        'public_url': 'competitions/threaded-futures-1525596',
+        'organisation': {'name': 'IIM Bangalore'},
+        'regnRequirements': {'end_regn_dt': '2025-07-30T23:59:00+05:30', 'min_team_size': 1, 'max_team_size': 3}
+    }]}}
+    listing = _unstop_api_listing(_unstop_api_items(payload)[0])
+    assert listing['deadline'] == '2025-07-30T23:59:00+05:30'
+    assert listing['company'] == 'IIM Bangalore'
+    assert listing['team_size'] == '1-3'
+    assert listing['link'] == 'https://unstop.com/competitions/threaded-futures-1525596'
+    assert 'hackathon' in listing['tags'] and listing['source'] == 'Unstop'
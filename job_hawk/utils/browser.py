@@ -1,13 +1,242 @@
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+from contextlib import asynccontextmanager
+from typing import Optional
 from playwright.async_api import async_playwright
+from .resource_blocker import new_context
 
 class BrowserContextManager:
+    def __init__(self, profile='default'):
+        self.profile = profile
+
     async def __aenter__(self):
         self.playwright = await async_playwright().start()
         self.browser = await self.playwright.chromium.launch(headless=True)
-        self.context = await self.browser.new_context()
+        self.context = await new_context(self.browser, self.profile)
         return self.context
 
     async def __aexit__(self, exc_type, exc, tb):
         await self.context.close()
         await self.browser.close()
-        await self.playwright.stop() 
\ No newline at end of file
+        await self.playwright.stop()
+
+def _process_tree_rss_mb() -> Optional[float]:
+    """RSS of every child process (Playwright driver and Chromium), or None without psutil."""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    total = 0
+    for child in psutil.Process().children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except psutil.Error:
+            continue
+    return total / (1024 * 1024)
+
+class BrowserPool:
+    """
+    Keeps one Chromium alive and hands out pages from a bounded pool of contexts.
+    Chromium is relaunched after `max_pages` pages, when the browser processes
+    pass `max_rss_mb` (needs psutil), or as soon as it crashes or disconnects.
+    """
+    def __init__(self, size=4, headless=True, max_pages=200, max_rss_mb=1500, rss_check_every=10):
+        self.size = max(1, size)
+        self.headless = headless
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.rss_check_every = rss_check_every
+        self.playwright = None
+        self.browser = None
+        self.launches = 0
+        self.pages_served = 0
+        # Idle contexts per resource profile, reused by later borrowers
+        self._idle_contexts = {}
+        self._slots = None
+        self._state = None
+        self._in_flight = 0
+        self._recycle_reason = None
+
+    async def start(self):
+        """Launch Chromium once; later calls are no-ops."""
+        if self._state is None:
+            self._state = asyncio.Condition()
+            self._slots = asyncio.Semaphore(self.size)
+        async with self._state:
+            if self.browser is None:
+                await self._launch()
+        return self
+
+    async def _launch(self):
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+        browser = await self.playwright.chromium.launch(headless=self.headless)
+        browser.on('disconnected', self._on_disconnected)
+        self.browser = browser
+        self.launches += 1
+        self.pages_served = 0
+        self._recycle_reason = None
+
+    def _on_disconnected(self, browser):
+        # Ignore browsers we closed ourselves while recycling
+        if browser is self.browser:
+            self._mark_recycle('disconnected')
+
+    def _mark_recycle(self, reason: str):
+        if self._recycle_reason is None:
+            self._recycle_reason = reason
+
+    async def _discard_browser(self):
+        for contexts in self._idle_contexts.values():
+            for context in contexts:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+        self._idle_contexts = {}
+        browser, self.browser = self.browser, None
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+
+    async def _acquire_browser(self):
+        """Return a live browser, relaunching it first if it crashed or is due for recycling."""
+        async with self._state:
+            if self.browser is not None and not self.browser.is_connected():
+                self._mark_recycle('disconnected')
+            if self._recycle_reason == 'disconnected':
+                # Nothing in flight survives a crash, so restart right away
+                print("♻️ Chromium disconnected, relaunching")
+                await self._discard_browser()
+            elif self._recycle_reason is not None:
+                # Let pages on the old browser finish before swapping it out
+                await self._state.wait_for(lambda: self._in_flight == 0)
+                if self._recycle_reason is not None:
+                    print(f"♻️ Recycling Chromium ({self._recycle_reason})")
+                    await self._discard_browser()
+            if self.browser is None:
+                await self._launch()
+            self._in_flight += 1
+            return self.browser
+
+    async def _release_browser(self):
+        async with self._state:
+            self._in_flight -= 1
+            self.pages_served += 1
+            if self.max_pages and self.pages_served >= self.max_pages:
+                self._mark_recycle(f"{self.pages_served} pages")
+            elif self.max_rss_mb and self.pages_served % self.rss_check_every == 0:
+                rss = _process_tree_rss_mb()
+                if rss is not None and rss > self.max_rss_mb:
+                    self._mark_recycle(f"RSS {rss:.0f} MB")
+            self._state.notify_all()
+
+    async def close(self):
+        await self._discard_browser()
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @asynccontextmanager
+    async def page(self, profile='default'):
+        """Borrow a fresh page under a resource profile; at most `size` pages are open at once."""
+        await self.start()
+        async with self._slots:
+            browser = await self._acquire_browser()
+            try:
+                idle = self._idle_contexts.setdefault(profile, [])
+                context = idle.pop() if idle else await new_context(browser, profile)
+                page = await context.new_page()
+                try:
+                    yield page
+                finally:
+                    try:
+                        await page.close()
+                        if len(idle) < self.size and browser is self.browser:
+                            idle.append(context)
+                        else:
+                            await context.close()
+                    except Exception:
+                        # Context died with the page; let the next borrower open a new one
+                        pass
+            finally:
+                await self._release_browser()
+
+@asynccontextmanager
+async def pool_or_temporary(pool: Optional[BrowserPool], size=4):
+    """Use `pool` if given, otherwise a BrowserPool that lives for this block only."""
+    if pool is not None:
+        yield pool
+    else:
+        async with BrowserPool(size=size) as temporary:
+            yield temporary
+
+class BrowserService:
+    """
+    Long-lived owner of a BrowserPool. The pool lives on a private event loop
+    in a daemon thread, so Chromium (and the shared HTTP client) stay warm
+    across scheduler runs. Submit coroutines with run() from sync code or
+    run_async() from another event loop.
+    """
+    def __init__(self, size=4, **pool_options):
+        self.pool = BrowserPool(size=size, **pool_options)
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name='browser-service', daemon=True)
+                self._thread.start()
+        return self._loop
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def run(self, coro):
+        """Run `coro` on the service loop and block until it finishes."""
+        return self.submit(coro).result()
+
+    async def run_async(self, coro):
+        """Await `coro` on the service loop from a different event loop."""
+        return await asyncio.wrap_future(self.submit(coro))
+
+    def close(self):
+        """Close Chromium and the service loop's HTTP client, then stop the loop."""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        async def shutdown():
+            from .http_client import close_client
+            await self.pool.close()
+            await close_client()
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout=30)
+        except Exception as e:
+            print(f"Browser service shutdown error: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=5)
+        loop.close()
+
+_service = None
+
+def get_browser_service() -> BrowserService:
+    """The process-wide BrowserService, started on first use and closed at exit."""
+    global _service
+    if _service is None:
+        _service = BrowserService()
+        atexit.register(_service.close)
+    return _service
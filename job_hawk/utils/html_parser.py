@@ -0,0 +1,154 @@
+import functools
+import importlib.util
+import os
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+# HTML parsing for the request-based scrapers. Three backends sit behind the
+# same Node API: selectolax (lexbor), lxml with cssselect, and BeautifulSoup
+# when neither is installed. Selectors are created once with css() and keep a
+# compiled form per backend, so parse loops never re-parse selector strings.
+BACKENDS = ('selectolax', 'lxml', 'bs4')
+
+@functools.lru_cache(maxsize=None)
+def available_backends() -> List[str]:
+    found = []
+    if importlib.util.find_spec('selectolax'):
+        found.append('selectolax')
+    if importlib.util.find_spec('lxml') and importlib.util.find_spec('cssselect'):
+        found.append('lxml')
+    found.append('bs4')
+    return found
+
+def default_backend() -> str:
+    """Fastest installed backend, unless HTML_PARSER_BACKEND picks one."""
+    requested = os.getenv('HTML_PARSER_BACKEND')
+    if requested and requested in available_backends():
+        return requested
+    return available_backends()[0]
+
+class Selector:
+    """A CSS selector compiled lazily, once per backend."""
+    def __init__(self, selector: str):
+        self.selector = selector
+        self._compiled = {}
+
+    def compiled(self, backend: str):
+        if backend not in self._compiled:
+            if backend == 'lxml':
+                from cssselect import GenericTranslator
+                from lxml import etree
+                # 'descendant::' so a node never matches itself, like bs4
+                self._compiled[backend] = etree.XPath(GenericTranslator().css_to_xpath(self.selector, prefix='descendant::'))
+            elif backend == 'bs4':
+                import soupsieve
+                self._compiled[backend] = soupsieve.compile(self.selector)
+            else:
+                # lexbor compiles and caches selectors internally
+                self._compiled[backend] = self.selector
+        return self._compiled[backend]
+
+_selectors = {}
+
+def css(selector: str) -> Selector:
+    """Return the shared Selector for a CSS string."""
+    if selector not in _selectors:
+        _selectors[selector] = Selector(selector)
+    return _selectors[selector]
+
+def _as_selector(selector) -> Selector:
+    return selector if isinstance(selector, Selector) else css(selector)
+
+class Node(ABC):
+    """Backend-neutral element wrapper."""
+    backend = None
+
+    def __init__(self, node):
+        self.node = node
+
+    @abstractmethod
+    def select(self, selector) -> List['Node']:
+        ...
+
+    def select_one(self, selector) -> Optional['Node']:
+        matches = self.select(selector)
+        return matches[0] if matches else None
+
+    @abstractmethod
+    def text(self) -> str:
+        """Text content with surrounding whitespace stripped."""
+
+    @abstractmethod
+    def attr(self, name: str) -> Optional[str]:
+        ...
+
+class _SelectolaxNode(Node):
+    backend = 'selectolax'
+
+    # lexbor matches the context node itself; drop it (by identity, since
+    # selectolax nodes compare equal by their HTML) like the other backends
+
+    def select(self, selector):
+        own_id = self.node.mem_id
+        return [
+            _SelectolaxNode(node) for node in self.node.css(_as_selector(selector).compiled(self.backend))
+            if node.mem_id != own_id
+        ]
+
+    def select_one(self, selector):
+        node = self.node.css_first(_as_selector(selector).compiled(self.backend))
+        if node is not None and node.mem_id == self.node.mem_id:
+            return super().select_one(selector)
+        return _SelectolaxNode(node) if node is not None else None
+
+    def text(self):
+        return self.node.text(deep=True).strip()
+
+    def attr(self, name):
+        return self.node.attributes.get(name)
+
+class _LxmlNode(Node):
+    backend = 'lxml'
+
+    def select(self, selector):
+        return [_LxmlNode(node) for node in _as_selector(selector).compiled(self.backend)(self.node)]
+
+    def text(self):
+        return self.node.text_content().strip()
+
+    def attr(self, name):
+        return self.node.get(name)
+
+class _Bs4Node(Node):
+    backend = 'bs4'
+
+    def select(self, selector):
+        return [_Bs4Node(node) for node in _as_selector(selector).compiled(self.backend).select(self.node)]
+
+    def select_one(self, selector):
+        node = _as_selector(selector).compiled(self.backend).select_one(self.node)
+        return _Bs4Node(node) if node is not None else None
+
+    def text(self):
+        return self.node.get_text().strip()
+
+    def attr(self, name):
+        value = self.node.get(name)
+        # bs4 splits class-like attributes into lists
+        return ' '.join(value) if isinstance(value, list) else value
+
+def parse_html(content, backend: Optional[str] = None) -> Node:
+    """Parse an HTML document (bytes or str) and return its root Node."""
+    backend = backend or default_backend()
+    if backend == 'selectolax':
+        from selectolax.lexbor import LexborHTMLParser
+        return _SelectolaxNode(LexborHTMLParser(content).root)
+    if backend == 'lxml':
+        import lxml.html
+        from lxml import etree
+        try:
+            return _LxmlNode(lxml.html.document_fromstring(content))
+        except (etree.ParserError, ValueError):
+            return _LxmlNode(lxml.html.document_fromstring('<html></html>'))
+    from bs4 import BeautifulSoup
+    return _Bs4Node(BeautifulSoup(content, 'html.parser'))
@@ -0,0 +1,74 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlencode, urlsplit, urlunsplit, parse_qsl
+from .trace import tracer
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / 'data' / 'http_cache'
+
+def normalize_url(url: str, params: Optional[dict] = None) -> str:
+    """Canonical form of a URL plus query params: lowercase host, sorted query, no fragment."""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query.extend((key, str(value)) for key, value in params.items())
+    host = (parts.hostname or '').lower()
+    if parts.port and not (parts.scheme == 'https' and parts.port == 443) and not (parts.scheme == 'http' and parts.port == 80):
+        host = f"{host}:{parts.port}"
+    return urlunsplit((parts.scheme.lower(), host, parts.path or '/', urlencode(sorted(query)), ''))
+
+class ConditionalCache:
+    """
+    On-disk HTTP validator cache. Each entry keeps the ETag/Last-Modified a
+    server sent and the result we parsed from the body, so a 304 costs
+    neither the download nor the parse.
+    """
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = Path(directory)
+        self.stats = {}
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    def load(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, key: str, entry: dict):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    def validators(self, entry: Optional[dict]) -> dict:
+        """Conditional request headers for a cached entry."""
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def record(self, source: str, hit: bool):
+        counters = self.stats.setdefault(source, {'hits': 0, 'misses': 0})
+        counters['hits' if hit else 'misses'] += 1
+
+    def report(self, reset=True):
+        """Print cache hits and misses per source (only when tracer.reporting)."""
+        if not tracer.reporting:
+            if reset:
+                self.stats = {}
+            return
+        for source, counters in sorted(self.stats.items()):
+            print(f"🗄️ {source}: {counters['hits']} cache hits, {counters['misses']} misses")
+        if reset:
+            self.stats = {}
+
+http_cache = ConditionalCache()
@@ -0,0 +1,103 @@
+import asyncio
+import importlib.util
+import weakref
+import httpx
+from .http_cache import http_cache, normalize_url
+from .rate_limiter import get_rate_limiter
+from .trace import tracer
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# HTTP/2 and the extra content encodings need optional packages (h2, brotli, zstandard)
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+def default_accept_encoding() -> str:
+    encodings = ['gzip', 'deflate']
+    if importlib.util.find_spec('brotli') or importlib.util.find_spec('brotlicffi'):
+        encodings.append('br')
+    if importlib.util.find_spec('zstandard'):
+        encodings.append('zstd')
+    return ', '.join(encodings)
+
+class HttpClient:
+    """
+    Async HTTP client shared by the scrapers: pooled keep-alive connections,
+    per-domain rate limits via the loop's RateLimiter, and HTTP/2 when `h2`
+    is installed. Pass `accept_encoding='identity'` to skip compression entirely.
+    """
+    def __init__(self, max_connections=64, timeout=15, http2=None, accept_encoding=None, transport=None, limiter=None):
+        self.limiter = limiter
+        self._client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE if http2 is None else http2,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout,
+            follow_redirects=True,
+            transport=transport,
+            headers={
+                'User-Agent': USER_AGENT,
+                'Accept-Encoding': accept_encoding or default_accept_encoding()
+            }
+        )
+
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+
+    async def get(self, url, params=None, headers=None, timeout=None) -> httpx.Response:
+        """GET `url`, waiting for a rate-limited slot for its domain first."""
+        async with (self.limiter or get_rate_limiter()).slot(url):
+            kwargs = {'params': params, 'headers': headers}
+            if timeout is not None:
+                kwargs['timeout'] = timeout
+            return await self._client.get(url, **kwargs)
+
+    async def fetch(self, url, source, parse, params=None, cache=None):
+        """
+        Conditional GET through the validator cache. Returns `parse(body)`, or
+        the cached parse result when the server answers 304 Not Modified.
+        Returns None for any other non-200 response. `parse` must return
+        something JSON-serializable.
+        """
+        cache = cache or http_cache
+        key = normalize_url(url, params)
+        entry = cache.load(key)
+        response = await self.get(url, params=params, headers=cache.validators(entry))
+        if response.status_code == 304 and entry is not None:
+            cache.record(source, hit=True)
+            return entry['parsed']
+        cache.record(source, hit=False)
+        if response.status_code != 200:
+            tracer.event(source, 'unexpected status', url=str(response.url), status=response.status_code)
+            return None
+        tracer.page(source, str(response.url), response.content)
+        parsed = parse(response.content)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            cache.save(key, {
+                'url': key,
+                'etag': etag,
+                'last_modified': last_modified,
+                'parsed': parsed
+            })
+        return parsed
+
+    async def aclose(self):
+        await self._client.aclose()
+
+# One client per event loop: connections and semaphores are bound to the loop
+_clients = weakref.WeakKeyDictionary()
+
+def get_client() -> HttpClient:
+    """Return the shared client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.closed:
+        client = _clients[loop] = HttpClient()
+    return client
+
+async def close_client():
+    """Close the running loop's shared client, if one was created."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,42 @@
+import math
+from collections import deque
+from typing import Optional
+from urllib.parse import urlsplit
+
+def domain_of(url: str) -> str:
+    """Host of `url` without a leading 'www.'."""
+    host = (urlsplit(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+class LatencyTracker:
+    """Keeps recent page latencies per domain and turns their p95 into timeouts."""
+    def __init__(self, window=50, factor=1.5, min_samples=5,
+                 default_timeout=10000, min_timeout=3000, max_timeout=30000):
+        self.window = window
+        self.factor = factor
+        self.min_samples = min_samples
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.samples = {}
+
+    def record(self, domain: str, elapsed_ms: float):
+        if domain not in self.samples:
+            self.samples[domain] = deque(maxlen=self.window)
+        self.samples[domain].append(elapsed_ms)
+
+    def p95(self, domain: str) -> Optional[float]:
+        samples = self.samples.get(domain)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+    def timeout(self, domain: str, default: Optional[int] = None) -> int:
+        """Timeout in ms for the next request to `domain`."""
+        samples = self.samples.get(domain)
+        if not samples or len(samples) < self.min_samples:
+            return default or self.default_timeout
+        return int(min(self.max_timeout, max(self.min_timeout, self.p95(domain) * self.factor)))
+
+latency_tracker = LatencyTracker()
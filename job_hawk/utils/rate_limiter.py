@@ -0,0 +1,182 @@
+import asyncio
+import time
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+from .latency import domain_of
+from .trace import tracer
+
+# Per-domain politeness limits. Subdomains share their parent's entry
+# (in.linkedin.com uses 'linkedin.com'); anything unlisted uses 'default'.
+#   rate: requests started per second, refilled continuously
+#   burst: requests that may start back to back after an idle period
+#   max_in_flight: requests to the domain open at the same time
+RATE_LIMITS = {
+    'default': {'rate': 2.0, 'burst': 4, 'max_in_flight': 4},
+    'amazon.in': {'rate': 1.0, 'burst': 3, 'max_in_flight': 2},
+    'flipkart.com': {'rate': 1.0, 'burst': 3, 'max_in_flight': 2},
+    'myntra.com': {'rate': 1.0, 'burst': 2, 'max_in_flight': 2},
+    'nykaa.com': {'rate': 1.0, 'burst': 2, 'max_in_flight': 2},
+    'ajio.com': {'rate': 1.0, 'burst': 2, 'max_in_flight': 2},
+    'linkedin.com': {'rate': 0.5, 'burst': 2, 'max_in_flight': 1},
+    'internshala.com': {'rate': 1.0, 'burst': 3, 'max_in_flight': 2},
+    'unstop.com': {'rate': 0.5, 'burst': 1, 'max_in_flight': 1},
+}
+
+class RateLimiter:
+    """
+    Token bucket per domain plus a global in-flight cap. Waiting requests
+    queue per domain, and free slots are handed out round-robin across
+    domains, so a backlog for one site never starves the others.
+    """
+    def __init__(self, limits: Optional[Dict[str, dict]] = None, max_in_flight=16):
+        self.limits = {domain: dict(limit) for domain, limit in RATE_LIMITS.items()}
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.stats = {}
+        self._buckets = {}
+        # Domains with queued requests, in round-robin order
+        self._ready = deque()
+        self._timer = None
+        for domain, limit in (limits or {}).items():
+            self.configure(domain, **limit)
+
+    def configure(self, domain: str, **limit):
+        """Set rate / burst / max_in_flight for a domain (missing keys come from 'default')."""
+        base = self.limits.get(domain) or self.limits['default']
+        self.limits[domain] = {**base, **limit}
+        self._buckets.pop(domain, None)
+
+    def key_for(self, url: str) -> str:
+        """The RATE_LIMITS entry that governs `url`, or its bare domain when none does."""
+        domain = domain_of(url) if '/' in url else url
+        labels = domain.split('.')
+        for i in range(len(labels) - 1):
+            candidate = '.'.join(labels[i:])
+            if candidate in self.limits:
+                return candidate
+        return domain
+
+    def _bucket(self, key: str) -> dict:
+        if key not in self._buckets:
+            limit = self.limits.get(key) or self.limits['default']
+            self._buckets[key] = {
+                'limit': limit,
+                'tokens': float(limit['burst']),
+                'updated': time.monotonic(),
+                'in_flight': 0,
+                'waiters': deque()
+            }
+        return self._buckets[key]
+
+    def _refill(self, bucket: dict, now: float):
+        limit = bucket['limit']
+        bucket['tokens'] = min(limit['burst'], bucket['tokens'] + (now - bucket['updated']) * limit['rate'])
+        bucket['updated'] = now
+
+    def _dispatch(self):
+        """Grant as many queued requests as the limits allow, one per domain per round."""
+        now = time.monotonic()
+        next_refill = None
+        granted = True
+        while granted and self._ready and self.in_flight < self.max_in_flight:
+            granted = False
+            for _ in range(len(self._ready)):
+                key = self._ready.popleft()
+                bucket = self._buckets[key]
+                waiters = bucket['waiters']
+                while waiters and waiters[0].done():
+                    waiters.popleft()  # cancelled while queued
+                if not waiters:
+                    continue
+                self._refill(bucket, now)
+                if bucket['tokens'] < 1:
+                    wait = (1 - bucket['tokens']) / bucket['limit']['rate']
+                    next_refill = wait if next_refill is None else min(next_refill, wait)
+                elif bucket['in_flight'] < bucket['limit']['max_in_flight'] and self.in_flight < self.max_in_flight:
+                    bucket['tokens'] -= 1
+                    bucket['in_flight'] += 1
+                    self.in_flight += 1
+                    waiters.popleft().set_result(None)
+                    granted = True
+                if waiters:
+                    self._ready.append(key)
+        if next_refill is not None:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = asyncio.get_running_loop().call_later(next_refill, self._dispatch)
+
+    async def acquire(self, url: str) -> str:
+        """Wait for a slot to fetch `url`; returns the key to pass to release()."""
+        key = self.key_for(url)
+        bucket = self._bucket(key)
+        waiter = asyncio.get_running_loop().create_future()
+        bucket['waiters'].append(waiter)
+        if key not in self._ready:
+            self._ready.append(key)
+        started = time.monotonic()
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just as we were cancelled: hand the slot back
+                self.release(key)
+            raise
+        self._record_wait(key, (time.monotonic() - started) * 1000)
+        return key
+
+    def release(self, key: str):
+        bucket = self._buckets[key]
+        bucket['in_flight'] -= 1
+        self.in_flight -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Hold one rate-limited slot for `url` for the duration of the block."""
+        key = await self.acquire(url)
+        try:
+            yield
+        finally:
+            self.release(key)
+
+    def _record_wait(self, key: str, waited_ms: float):
+        counters = self.stats.setdefault(key, {'requests': 0, 'total_wait_ms': 0.0, 'max_wait_ms': 0.0})
+        counters['requests'] += 1
+        counters['total_wait_ms'] += waited_ms
+        counters['max_wait_ms'] = max(counters['max_wait_ms'], waited_ms)
+
+    def wait_stats(self) -> Dict[str, dict]:
+        """Queue wait per domain: request count, average and max wait in ms."""
+        return {
+            key: {
+                'requests': counters['requests'],
+                'avg_wait_ms': counters['total_wait_ms'] / counters['requests'],
+                'max_wait_ms': counters['max_wait_ms']
+            }
+            for key, counters in self.stats.items()
+        }
+
+    def report(self, reset=True):
+        """Print queue wait per domain (only when tracer.reporting)."""
+        if not tracer.reporting:
+            if reset:
+                self.stats = {}
+            return
+        for key, stats in sorted(self.wait_stats().items()):
+            print(f"⏳ {key}: {stats['requests']} requests, avg wait {stats['avg_wait_ms']:.0f} ms, max {stats['max_wait_ms']:.0f} ms")
+        if reset:
+            self.stats = {}
+
+# One limiter per event loop, like the shared HTTP client
+_limiters = weakref.WeakKeyDictionary()
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the rate limiter for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = _limiters[loop] = RateLimiter()
+    return limiter
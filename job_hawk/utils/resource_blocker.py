@@ -0,0 +1,187 @@
+from urllib.parse import urlsplit
+from .trace import tracer
+
+# Third-party hosts that only serve ads, trackers and analytics
+AD_HOSTS = [
+    'doubleclick.net',
+    'googlesyndication.com',
+    'googleadservices.com',
+    'google-analytics.com',
+    'googletagmanager.com',
+    'googletagservices.com',
+    'amazon-adsystem.com',
+    'facebook.net',
+    'connect.facebook.com',
+    'clarity.ms',
+    'hotjar.com',
+    'criteo.com',
+    'criteo.net',
+    'taboola.com',
+    'scorecardresearch.com',
+    'quantserve.com',
+    'moengage.com',
+    'branch.io',
+    'nr-data.net',
+    'bat.bing.com',
+    'mixpanel.com',
+    'segment.io',
+]
+
+DEFAULT_BLOCKED_TYPES = ['image', 'media', 'font']
+
+# Per-site request filters. `block_types` are Playwright resource types,
+# `block_hosts` are matched against the request host, and `javascript`
+# switches scripting off for the whole context (server-rendered pages only).
+RESOURCE_PROFILES = {
+    'default': {
+        'block_types': DEFAULT_BLOCKED_TYPES,
+        'block_hosts': AD_HOSTS,
+        'javascript': True
+    },
+    # Product pages on these sites carry title/price/rating in the server HTML
+    'amazon_product': {
+        'block_types': DEFAULT_BLOCKED_TYPES + ['stylesheet', 'script'],
+        'block_hosts': AD_HOSTS,
+        'javascript': False
+    },
+    'flipkart_product': {
+        'block_types': DEFAULT_BLOCKED_TYPES + ['stylesheet', 'script'],
+        'block_hosts': AD_HOSTS,
+        'javascript': False
+    },
+    # These product pages fill in price and rating from script-held state
+    'myntra_product': {
+        'block_types': DEFAULT_BLOCKED_TYPES + ['stylesheet'],
+        'block_hosts': AD_HOSTS,
+        'javascript': True
+    },
+    'nykaa_product': {
+        'block_types': DEFAULT_BLOCKED_TYPES + ['stylesheet'],
+        'block_hosts': AD_HOSTS,
+        'javascript': True
+    },
+    'ajio_product': {
+        'block_types': DEFAULT_BLOCKED_TYPES + ['stylesheet'],
+        'block_hosts': AD_HOSTS,
+        'javascript': True
+    },
+    'nike_product': {
+        'block_types': DEFAULT_BLOCKED_TYPES + ['stylesheet'],
+        'block_hosts': AD_HOSTS,
+        'javascript': True
+    },
+    # Listing pages render their cards client-side and lazy-load on scroll,
+    # so they keep scripts and stylesheets
+    'amazon': {
+        'block_types': DEFAULT_BLOCKED_TYPES,
+        'block_hosts': AD_HOSTS,
+        'javascript': True
+    },
+    'flipkart': {
+        'block_types': DEFAULT_BLOCKED_TYPES,
+        'block_hosts': AD_HOSTS,
+        'javascript': True
+    },
+    'myntra': {
+        'block_types': DEFAULT_BLOCKED_TYPES,
+        'block_hosts': AD_HOSTS,
+        'javascript': True
+    },
+    'nykaa': {
+        'block_types': DEFAULT_BLOCKED_TYPES,
+        'block_hosts': AD_HOSTS,
+        'javascript': True
+    },
+    'ajio': {
+        'block_types': DEFAULT_BLOCKED_TYPES,
+        'block_hosts': AD_HOSTS,
+        'javascript': True
+    },
+    'unstop': {
+        'block_types': DEFAULT_BLOCKED_TYPES,
+        'block_hosts': AD_HOSTS,
+        'javascript': True
+    },
+}
+
+# Typical transfer sizes used to estimate what a blocked request would have
+# cost. Aborted requests never get a response, so this is a guess, not a measurement.
+TYPICAL_BYTES = {
+    'image': 40_000,
+    'media': 500_000,
+    'font': 35_000,
+    'stylesheet': 25_000,
+    'script': 60_000,
+}
+OTHER_BYTES = 5_000
+
+def get_profile(name: str) -> dict:
+    """Return the named profile; unknown names raise instead of silently loading everything."""
+    try:
+        return RESOURCE_PROFILES[name]
+    except KeyError:
+        raise KeyError(f"Unknown resource profile '{name}'; add it to RESOURCE_PROFILES") from None
+
+def context_options(name: str) -> dict:
+    """Keyword arguments for browser.new_context() under the named profile."""
+    return {'java_script_enabled': get_profile(name)['javascript']}
+
+def should_block(profile: dict, resource_type: str, url: str) -> bool:
+    if resource_type in profile['block_types']:
+        return True
+    host = urlsplit(url).hostname or ''
+    return any(host == blocked or host.endswith('.' + blocked) for blocked in profile['block_hosts'])
+
+class ResourceStats:
+    """Counts blocked and allowed requests per site."""
+    def __init__(self):
+        self.sites = {}
+
+    def _site(self, site):
+        if site not in self.sites:
+            self.sites[site] = {'blocked': 0, 'allowed': 0, 'estimated_bytes_saved': 0}
+        return self.sites[site]
+
+    def record_blocked(self, site, resource_type):
+        counters = self._site(site)
+        counters['blocked'] += 1
+        counters['estimated_bytes_saved'] += TYPICAL_BYTES.get(resource_type, OTHER_BYTES)
+
+    def record_allowed(self, site):
+        self._site(site)['allowed'] += 1
+
+    def report(self, reset=True):
+        """Print blocked requests and an estimate of the bytes saved (from TYPICAL_BYTES) per site (only when tracer.reporting)."""
+        if not tracer.reporting:
+            if reset:
+                self.sites = {}
+            return
+        for site, counters in sorted(self.sites.items()):
+            if not counters['blocked']:
+                continue
+            print(f"🧹 {site}: blocked {counters['blocked']} of {counters['blocked'] + counters['allowed']} requests "
+                  f"(est. ~{counters['estimated_bytes_saved'] / 1_000_000:.1f} MB saved)")
+        if reset:
+            self.sites = {}
+
+resource_stats = ResourceStats()
+
+async def attach_profile(context, name: str, stats: ResourceStats = resource_stats):
+    """Route every request of `context` through the named profile's filter."""
+    profile = get_profile(name)
+
+    async def handle(route, request):
+        if should_block(profile, request.resource_type, request.url):
+            stats.record_blocked(name, request.resource_type)
+            await route.abort()
+        else:
+            stats.record_allowed(name)
+            await route.continue_()
+
+    await context.route('**/*', handle)
+
+async def new_context(browser, name: str = 'default', **kwargs):
+    """Create a browser context that applies the named resource profile."""
+    context = await browser.new_context(**context_options(name), **kwargs)
+    await attach_profile(context, name)
+    return context
@@ -0,0 +1,98 @@
+import json
+import os
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+TRACE_DIR = Path(__file__).resolve().parent.parent / 'data' / 'traces'
+TRACE_ENV = 'JOB_HAWK_TRACE'
+VERBOSE_ENV = 'JOB_HAWK_VERBOSE'
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, '').lower() in ('1', 'true', 'yes', 'on')
+
+class Tracer:
+    """
+    Opt-in debug capture. Off unless JOB_HAWK_TRACE=1: every call is then a
+    cheap no-op. When on, each source keeps its last `max_pages` raw pages and
+    `max_events` events in memory; nothing touches the disk until a failure
+    or an explicit dump(). Per-run counters (cache hits, rate-limit waits,
+    blocked requests, fetch tiers) are printed only while tracing or with
+    JOB_HAWK_VERBOSE=1.
+    """
+    def __init__(self, enabled: Optional[bool] = None, max_pages=5, max_events=200, directory=TRACE_DIR, verbose: Optional[bool] = None):
+        self.enabled = _env_flag(TRACE_ENV) if enabled is None else enabled
+        self.verbose = _env_flag(VERBOSE_ENV) if verbose is None else verbose
+        self.max_pages = max_pages
+        self.max_events = max_events
+        self.directory = Path(directory)
+        self._pages = {}
+        self._events = {}
+
+    @property
+    def reporting(self) -> bool:
+        """Whether the per-run counter reports should print."""
+        return self.enabled or self.verbose
+
+    def event(self, source: str, message: str, **fields):
+        """Remember an event; field values are only turned into text when dumped."""
+        if not self.enabled:
+            return
+        if source not in self._events:
+            self._events[source] = deque(maxlen=self.max_events)
+        self._events[source].append({'at': time.time(), 'message': message, **fields})
+
+    def page(self, source: str, url: str, content):
+        """Remember a raw page body (bytes or str)."""
+        if not self.enabled:
+            return
+        if source not in self._pages:
+            self._pages[source] = deque(maxlen=self.max_pages)
+        self._pages[source].append({'at': time.time(), 'url': url, 'content': content})
+
+    def failure(self, source: str, error):
+        """Record a source failure and dump that source's buffers."""
+        if not self.enabled:
+            return []
+        self.event(source, 'failure', error=error)
+        return self.dump(source, reason=str(error))
+
+    def dump(self, source: Optional[str] = None, reason='requested') -> List[Path]:
+        """Write buffered pages and events (one source, or all) to TRACE_DIR; returns the files written."""
+        if not self.enabled:
+            return []
+        sources = [source] if source else sorted(set(self._pages) | set(self._events))
+        written = []
+        for name in sources:
+            pages = list(self._pages.get(name, ()))
+            events = list(self._events.get(name, ()))
+            if not pages and not events:
+                continue
+            self.directory.mkdir(parents=True, exist_ok=True)
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+            path = self.directory / f"{name.lower()}-{stamp}.json"
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'source': name,
+                    'reason': reason,
+                    'events': events,
+                    'pages': [
+                        {**page, 'content': page['content'].decode('utf-8', 'replace') if isinstance(page['content'], bytes) else page['content']}
+                        for page in pages
+                    ]
+                }, f, indent=2, default=str)
+            written.append(path)
+            print(f"🧾 Trace for {name} written to {path}")
+        return written
+
+    def clear(self, source: Optional[str] = None):
+        if source:
+            self._pages.pop(source, None)
+            self._events.pop(source, None)
+        else:
+            self._pages = {}
+            self._events = {}
+
+tracer = Tracer()